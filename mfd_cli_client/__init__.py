@@ -2,4 +2,27 @@
 # SPDX-License-Identifier: MIT
 """Main module."""
 
-from .base import CliClient, FlowStats, TrafficClassCounters, SwitchStats
+import typing
+
+from .structures import FlowStats, TrafficClassCounters, SwitchStats, SwitchStatsSnapshot
+
+if typing.TYPE_CHECKING:
+    from .base import CliClient
+
+__all__ = ["CliClient", "FlowStats", "TrafficClassCounters", "SwitchStats", "SwitchStatsSnapshot"]
+
+
+def __getattr__(name: str) -> type:
+    """
+    Import CliClient with its dependencies (mfd_base_tool, mfd_common_libs, mfd_typing) on first use.
+
+    :param name: Name of attribute
+    :return: CliClient class
+    :raises AttributeError: on unknown attribute
+    """
+    if name == "CliClient":
+        from .base import CliClient
+
+        globals()[name] = CliClient
+        return CliClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
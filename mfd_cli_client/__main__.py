@@ -0,0 +1,9 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Run queries with `python -m mfd_cli_client`."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
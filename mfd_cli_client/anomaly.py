@@ -0,0 +1,253 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for streaming detection of discard and error anomalies in sampled counters."""
+
+import logging
+import math
+import typing
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Collection, Dict, Hashable, List, Mapping, Optional, Tuple
+
+from . import log
+from .quantile import P2Quantile
+
+if typing.TYPE_CHECKING:
+    from .exporter import CpSample
+    from .structures import SwitchStats, VSIStats
+
+logger = logging.getLogger(__name__)
+
+VSI_COUNTERS = ("discards_packet", "errors_packet")
+SWITCH_COUNTERS = ("discards",)
+DIRECTIONS = ("ingress", "egress")
+
+SeriesKey = Tuple[Hashable, ...]
+
+
+class _Series:
+    """Rolling state of one counter."""
+
+    __slots__ = ("counter", "timestamp", "mean", "variance", "samples", "quantile", "active")
+
+    def __init__(self, counter: int, timestamp: float, quantile: float) -> None:
+        self.counter = counter
+        self.timestamp = timestamp
+        self.mean = 0.0
+        self.variance = 0.0
+        self.samples = 0
+        self.quantile = P2Quantile(quantile)
+        self.active = False
+
+
+@dataclass(frozen=True)
+class Anomaly:
+    """
+    Structure for anomaly of one counter series.
+
+    series - e.g. ('cp0', 'vsi', 5, 'ingress', 'discards_packet'), reason - 'threshold' when rate crossed
+    configured threshold, 'deviation' when rate deviated from baseline (EWMA and quantile of previous rates).
+    """
+
+    series: SeriesKey
+    timestamp: float
+    rate: float
+    reason: str
+    baseline: float
+    limit: float
+
+
+class AnomalyDetector:
+    """
+    Detect spikes of discard and error rates in sampled counters, online and in constant memory per series.
+
+    For every series (counter of one direction of one VSI or switch on one CP) only the last counter value, EWMA of
+    mean and variance of its rate and P-square estimate of high quantile of its rate are kept.
+    Callbacks are called once when series becomes anomalous, series has to return to normal before it fires again.
+    """
+
+    def __init__(
+        self,
+        *,
+        thresholds: Optional[Mapping[str, float]] = None,
+        sigmas: float = 4.0,
+        quantile: float = 0.99,
+        smoothing: float = 0.05,
+        min_rate: float = 1.0,
+        warm_up: int = 10,
+        vsi_counters: Collection[str] = VSI_COUNTERS,
+        switch_counters: Collection[str] = SWITCH_COUNTERS,
+    ) -> None:
+        """
+        Initialize detector.
+
+        :param thresholds: Rate in events per second by counter name (e.g. 'errors_packet') above which
+                           series is anomalous regardless of baseline
+        :param sigmas: Rate is deviation when it exceeds EWMA mean by sigmas EWMA standard deviations
+                       and quantile of previous rates
+        :param quantile: Quantile of previous rates which rate has to exceed to be deviation
+        :param smoothing: Weight of newest rate in EWMA
+        :param min_rate: Rate up to which deviation is never reported, e.g. single discard after idle period
+        :param warm_up: Number of rates of series before deviations are reported
+        :param vsi_counters: Counters of VSIFlowStats observed
+        :param switch_counters: Counters of FlowStats observed
+        """
+        self.thresholds = dict(thresholds or {})
+        self.sigmas = sigmas
+        self.quantile = quantile
+        self.smoothing = smoothing
+        self.min_rate = min_rate
+        self.warm_up = warm_up
+        self.vsi_counters = tuple(vsi_counters)
+        self.switch_counters = tuple(switch_counters)
+        self._callbacks: List[Callable[[Anomaly], None]] = []
+        self._series: Dict[SeriesKey, _Series] = {}
+        self._lock = Lock()
+
+    def add_callback(self, callback: Callable[[Anomaly], None]) -> None:
+        """
+        Register callback called with every anomaly.
+
+        :param callback: Callable called with Anomaly
+        """
+        self._callbacks.append(callback)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def _update(self, key: SeriesKey, counter: Optional[int], timestamp: float) -> Optional[Anomaly]:
+        series = self._series.get(key)
+        if series is None:
+            if counter is not None:
+                self._series[key] = _Series(counter, timestamp, self.quantile)
+            return None
+        if counter is None or timestamp <= series.timestamp:
+            return None
+        if counter < series.counter:  # counter reset, e.g. VSI re-created
+            series.counter, series.timestamp = counter, timestamp
+            return None
+
+        rate = (counter - series.counter) / (timestamp - series.timestamp)
+        series.counter, series.timestamp = counter, timestamp
+        anomaly = None
+        threshold = self.thresholds.get(key[-1])
+        if threshold is not None and rate > threshold:
+            anomaly = Anomaly(key, timestamp, rate, "threshold", series.mean, threshold)
+        elif series.samples >= max(self.warm_up, 1) and rate > self.min_rate:
+            limit = max(series.mean + self.sigmas * math.sqrt(series.variance), series.quantile.value)
+            if rate > limit:
+                anomaly = Anomaly(key, timestamp, rate, "deviation", series.mean, limit)
+
+        # exponentially weighted mean and variance
+        if series.samples:
+            difference = rate - series.mean
+            increment = self.smoothing * difference
+            series.mean += increment
+            series.variance = (1 - self.smoothing) * (series.variance + difference * increment)
+        else:
+            series.mean = rate
+        series.quantile.add(rate)
+        series.samples += 1
+
+        if anomaly is None:
+            series.active = False
+            return None
+        if series.active:
+            return None
+        series.active = True
+        return anomaly
+
+    def _fire(self, anomalies: List[Anomaly]) -> List[Anomaly]:
+        for anomaly in anomalies:
+            log.debug(
+                logger,
+                "Anomaly of %s: %.1f/s (%s, limit %.1f/s).",
+                anomaly.series,
+                anomaly.rate,
+                anomaly.reason,
+                anomaly.limit,
+            )
+            for callback in self._callbacks:
+                callback(anomaly)
+        return anomalies
+
+    def observe(self, key: SeriesKey, counter: Optional[int], timestamp: float) -> Optional[Anomaly]:
+        """
+        Observe value of one counter.
+
+        :param key: Series of counter, its last item is name of counter used for thresholds
+        :param counter: Value of counter, None when counter is missing in output
+        :param timestamp: Time counter was read in seconds
+        :return: Anomaly if series became anomalous
+        """
+        with self._lock:
+            anomaly = self._update(key, counter, timestamp)
+        if anomaly is None:
+            return None
+        self._fire([anomaly])
+        return anomaly
+
+    def observe_vsi_stats(self, cp: str, stats: Mapping[int, "VSIStats"], timestamp: float) -> List[Anomaly]:
+        """
+        Observe statistics of VSIs, e.g. result of get_vsi_statistics_bulk.
+
+        :param cp: Name of CP
+        :param stats: Stats by VSI ID
+        :param timestamp: Time counters were read in seconds
+        :return: Anomalies of series which became anomalous
+        """
+        anomalies = []
+        with self._lock:
+            for vsi_id, vsi_stats in stats.items():
+                for direction in DIRECTIONS:
+                    flow = getattr(vsi_stats, direction)
+                    for counter in self.vsi_counters:
+                        key = (cp, "vsi", vsi_id, direction, counter)
+                        anomaly = self._update(key, getattr(flow, counter), timestamp)
+                        if anomaly:
+                            anomalies.append(anomaly)
+        return self._fire(anomalies)
+
+    def observe_switch_stats(self, cp: str, stats: Mapping[int, "SwitchStats"], timestamp: float) -> List[Anomaly]:
+        """
+        Observe statistics of switches.
+
+        :param cp: Name of CP
+        :param stats: Stats by switch ID
+        :param timestamp: Time counters were read in seconds
+        :return: Anomalies of series which became anomalous
+        """
+        anomalies = []
+        with self._lock:
+            for switch_id, switch_stats in stats.items():
+                for direction in DIRECTIONS:
+                    flow = getattr(switch_stats, direction)
+                    for counter in self.switch_counters:
+                        key = (cp, "switch", switch_id, direction, counter)
+                        anomaly = self._update(key, getattr(flow, counter), timestamp)
+                        if anomaly:
+                            anomalies.append(anomaly)
+        return self._fire(anomalies)
+
+    def on_cp_sample(self, cp: str, sample: "CpSample") -> None:
+        """
+        Observe sample of BackgroundSampler, to be passed as its listener.
+
+        :param cp: Name of CP
+        :param sample: Sample of CP
+        """
+        self.observe_vsi_stats(cp, sample.vsi_stats, sample.timestamp)
+        self.observe_switch_stats(cp, sample.switch_stats, sample.timestamp)
+
+    def forget(self, cp: Optional[str] = None) -> None:
+        """
+        Drop rolling state, e.g. of CP which was re-initialized.
+
+        :param cp: Name of CP, all series by default
+        """
+        with self._lock:
+            if cp is None:
+                self._series.clear()
+            else:
+                for key in [key for key in self._series if key[0] == cp]:
+                    del self._series[key]
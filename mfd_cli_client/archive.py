@@ -0,0 +1,326 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for append-only, chunk-compressed archive of raw cli_client outputs."""
+
+import json
+import logging
+import os
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from time import time
+from types import TracebackType
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from . import log
+from .compression import CompressionPolicy
+from .exceptions import CliClientException
+from .parsers import parse_qos_vm_info, parse_switch_stats, parse_vsi_config_list, parse_vsi_statistics
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+
+# parsers of archived outputs by command type (command flags without values)
+PARSERS: Dict[str, Callable[[str], Any]] = {
+    "--query --statistics --switch": parse_switch_stats,
+    "--query --statistics --vsi": parse_vsi_statistics,
+    "--query --config --verbose": parse_vsi_config_list,
+    "--query --statistics --vm_qos_info": parse_qos_vm_info,
+}
+
+
+def command_type(command: str) -> str:
+    """
+    Get command type, so e.g. statistics of different VSIs share parser.
+
+    :param command: Command passed to command line interface client tool
+    :return: Flags of command without values
+    """
+    return CompressionPolicy.command_type(command)
+
+
+def register_parser(command: str, parser: Callable[[str], Any]) -> None:
+    """
+    Register parser of archived outputs, replacing parser registered for the same command type.
+
+    :param command: Command or command type which outputs are parsed
+    :param parser: Function parsing output of command
+    """
+    PARSERS[command_type(command)] = parser
+
+
+@dataclass(frozen=True)
+class ArchiveRecord:
+    """Structure for one archived output: wall-clock time it was received, host it came from and its command."""
+
+    timestamp: float
+    host: str
+    command: str
+    output: str
+
+
+@dataclass(frozen=True)
+class ChunkIndexEntry:
+    """Structure for index of one compressed chunk: its position in archive and ranges of records in it."""
+
+    offset: int
+    length: int
+    count: int
+    first: float
+    last: float
+    command_types: Tuple[str, ...]
+    hosts: Tuple[str, ...]
+
+    def matches(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        command_types: Optional[Collection[str]] = None,
+        hosts: Optional[Collection[str]] = None,
+    ) -> bool:
+        """
+        Check if chunk may contain records matching filters.
+
+        :param start: Minimum timestamp of records
+        :param end: Maximum timestamp of records
+        :param command_types: Command types of records
+        :param hosts: Hosts of records
+        :return: False when no record in chunk matches
+        """
+        return (
+            (start is None or self.last >= start)
+            and (end is None or self.first <= end)
+            and (command_types is None or not set(command_types).isdisjoint(self.command_types))
+            and (hosts is None or not set(hosts).isdisjoint(self.hosts))
+        )
+
+
+def _record_matches(
+    record: ArchiveRecord,
+    start: Optional[float],
+    end: Optional[float],
+    command_types: Optional[Collection[str]],
+    hosts: Optional[Collection[str]],
+) -> bool:
+    return (
+        (start is None or record.timestamp >= start)
+        and (end is None or record.timestamp <= end)
+        and (command_types is None or command_type(record.command) in command_types)
+        and (hosts is None or record.host in hosts)
+    )
+
+
+def read_chunk(path: Union[Path, str], entry: ChunkIndexEntry) -> List[ArchiveRecord]:
+    """
+    Read and decompress one chunk, e.g. in worker process which has only path of archive.
+
+    :param path: Path of archive data file
+    :param entry: Index entry of chunk
+    :return: Records of chunk in order they were appended
+    :raises CliClientException: when chunk is truncated or corrupted
+    """
+    with open(path, "rb") as file:
+        file.seek(entry.offset)
+        data = file.read(entry.length)
+    try:
+        lines = zlib.decompress(data).decode().splitlines()
+        return [ArchiveRecord(**json.loads(line)) for line in lines]
+    except (zlib.error, ValueError, TypeError) as e:
+        raise CliClientException(f"Corrupted archive chunk at offset {entry.offset} of {path}: {e}") from e
+
+
+class OutputArchive:
+    """
+    Append-only archive of raw cli_client outputs.
+
+    Records are buffered in memory and written as zlib-compressed chunks of JSON lines to the data file,
+    each chunk is indexed by one JSON line in index file (data file path + '.idx') with its offset, length,
+    time range, command types and hosts. Reads decompress only chunks which index entry matches the filters.
+    Chunk is written to data file before its index entry, so chunk interrupted by crash is never indexed.
+    """
+
+    def __init__(self, path: Union[Path, str], *, chunk_size: int = 1024 * 1024, compression_level: int = 6) -> None:
+        """
+        Open archive, creating it if it does not exist.
+
+        :param path: Path of archive data file
+        :param chunk_size: Size of buffered outputs in bytes above which chunk is compressed and written
+        :param compression_level: zlib compression level of chunks
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.chunk_size = chunk_size
+        self.compression_level = compression_level
+        self._lock = Lock()
+        self._pending: List[ArchiveRecord] = []
+        self._pending_size = 0
+        self._index = self._load_index()
+
+    def _load_index(self) -> List[ChunkIndexEntry]:
+        if not self.index_path.exists():
+            return []
+        size = self.path.stat().st_size if self.path.exists() else 0
+        index = []
+        for line in self.index_path.read_text().splitlines():
+            try:
+                fields = json.loads(line)
+                entry = ChunkIndexEntry(
+                    **{**fields, "command_types": tuple(fields["command_types"]), "hosts": tuple(fields["hosts"])}
+                )
+            except (ValueError, TypeError, KeyError):
+                log.debug(logger, "Skipping malformed index entry of %s: %s", self.path, line)
+                continue
+            if entry.offset + entry.length <= size:
+                index.append(entry)
+        return index
+
+    def append(self, command: str, output: str, *, host: str = "", timestamp: Optional[float] = None) -> None:
+        """
+        Append output of command, writing chunk when buffered outputs exceed chunk size.
+
+        :param command: Command passed to command line interface client tool
+        :param output: Raw output of command
+        :param host: Host which executed command
+        :param timestamp: Wall-clock time output was received, now by default
+        """
+        record = ArchiveRecord(time() if timestamp is None else timestamp, host, command, output)
+        with self._lock:
+            self._pending.append(record)
+            self._pending_size += len(output) + len(command)
+            if self._pending_size >= self.chunk_size:
+                self._write_pending()
+
+    def flush(self) -> None:
+        """Compress and write buffered outputs."""
+        with self._lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        """Write buffered outputs, archive stays readable and appendable."""
+        self.flush()
+
+    def _write_pending(self) -> None:
+        if not self._pending:
+            return
+        records = self._pending
+        data = zlib.compress(
+            "".join(json.dumps(asdict(record)) + "\n" for record in records).encode(), self.compression_level
+        )
+        with open(self.path, "ab") as file:
+            offset = file.tell()
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        timestamps = [record.timestamp for record in records]
+        entry = ChunkIndexEntry(
+            offset,
+            len(data),
+            len(records),
+            min(timestamps),
+            max(timestamps),
+            tuple(sorted({command_type(record.command) for record in records})),
+            tuple(sorted({record.host for record in records})),
+        )
+        with open(self.index_path, "a") as file:
+            file.write(json.dumps(asdict(entry)) + "\n")
+        self._index.append(entry)
+        self._pending = []
+        self._pending_size = 0
+        log.debug(logger, "Archived chunk of %d outputs, %d bytes compressed.", entry.count, entry.length)
+
+    def chunks(
+        self,
+        *,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        command_types: Optional[Collection[str]] = None,
+        hosts: Optional[Collection[str]] = None,
+    ) -> List[ChunkIndexEntry]:
+        """
+        Get index entries of written chunks which may contain matching records.
+
+        :param start: Minimum timestamp of records
+        :param end: Maximum timestamp of records
+        :param command_types: Command types (or commands) of records
+        :param hosts: Hosts of records
+        :return: Index entries in order chunks were written
+        """
+        command_types = None if command_types is None else {command_type(command) for command in command_types}
+        with self._lock:
+            return [entry for entry in self._index if entry.matches(start, end, command_types, hosts)]
+
+    def records(
+        self,
+        *,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        command_types: Optional[Collection[str]] = None,
+        hosts: Optional[Collection[str]] = None,
+    ) -> Iterator[ArchiveRecord]:
+        """
+        Read records matching all filters, including buffered records which were not written yet.
+
+        :param start: Minimum timestamp of records
+        :param end: Maximum timestamp of records
+        :param command_types: Command types (or commands) of records
+        :param hosts: Hosts of records
+        :return: Records in order they were appended
+        :raises CliClientException: when chunk is corrupted
+        """
+        types = None if command_types is None else {command_type(command) for command in command_types}
+        with self._lock:
+            pending = list(self._pending)
+        for entry in self.chunks(start=start, end=end, command_types=types, hosts=hosts):
+            for record in read_chunk(self.path, entry):
+                if _record_matches(record, start, end, types, hosts):
+                    yield record
+        for record in pending:
+            if _record_matches(record, start, end, types, hosts):
+                yield record
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(entry.count for entry in self._index) + len(self._pending)
+
+    def __enter__(self) -> "OutputArchive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def reparse(
+    records: Iterable[ArchiveRecord],
+    *,
+    parsers: Optional[Dict[str, Callable[[str], Any]]] = None,
+    skip_errors: bool = False,
+) -> Iterator[Tuple[ArchiveRecord, Any]]:
+    """
+    Push archived outputs through current parsers, e.g. after fixing parser bug.
+
+    Records of command types without parser are skipped.
+
+    :param records: Archived records, e.g. from OutputArchive.records()
+    :param parsers: Parsers by command type, PARSERS by default
+    :param skip_errors: Skip records which parser failed on instead of raising
+    :return: Records with their parsed results
+    :raises CliClientException: when parser failed and skip_errors is False
+    """
+    parsers = PARSERS if parsers is None else parsers
+    for record in records:
+        parser = parsers.get(command_type(record.command))
+        if parser is None:
+            continue
+        try:
+            yield record, parser(record.output)
+        except Exception as e:
+            if not skip_errors:
+                raise CliClientException(f"Cannot parse archived output of {record.command}: {e}") from e
+            log.debug(logger, "Skipping archived output of %s: %s", record.command, e)
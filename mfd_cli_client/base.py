@@ -4,98 +4,121 @@
 
 import logging
 import re
-from dataclasses import dataclass
+import typing
+from contextlib import contextmanager
 from pathlib import Path
-from time import sleep
-from typing import Optional, Iterable, Dict, Union, List
-from enum import IntEnum
+from secrets import token_hex
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable, Optional, Iterable, Iterator, Dict, Tuple, TypeVar, Union, List
 
 from mfd_common_libs import add_logging_level, log_levels, os_supported
 from mfd_base_tool import ToolTemplate
 from mfd_typing import OSName, MACAddress
 
-from .exceptions import CliClientException, CliClientNotAvailable
+from . import log
+from .coalescing import SingleFlight
+from .compression import CompressionPolicy
+from .deadline import current_deadline, deadline_scope
+from .exceptions import (
+    CliClientCircuitOpen,
+    CliClientException,
+    CliClientNotAvailable,
+    CliClientRemoteParserError,
+    CliClientRunnerUnavailable,
+)
+from .parsers import parse_qos_vm_info, parse_switch_stats, parse_vsi_config_list, parse_vsi_statistics  # noqa: F401
+from .rate_limit import RateLimiter
+from .remote_parser import RemoteParser, decode_qos_vm_info, decode_vsi_config_list
+from .runner import PersistentRunner
+from .structures import (  # noqa: F401
+    AcquisitionWindow,
+    ExecutionStats,
+    FlowStats,
+    LinkStatus,
+    SwitchStats,
+    SwitchStatsSnapshot,
+    TrafficClassCounters,
+    VSIFlowStats,
+    VSIStats,
+    VsiConfigListEntry,
+    VsiListEntry,
+)
+from .timeouts import AdaptiveTimeout, CircuitBreaker, is_timeout
+from .vsi_table import IS_VF, VsiConfigTable
+from .waiters import Backoff, WaitResult, wait_until
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.base import ConnectionCompletedProcess
+
+    from .archive import OutputArchive
 
 logger = logging.getLogger(__name__)
-add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
-
-@dataclass
-class FlowStats:
-    """Structure for single direction statistics."""
-
-    traffic_class_counters: List[int]
-    packet: int
-    discards: int
-
-
-@dataclass
-class SwitchStats:
-    """Structure for both directions statistics."""
-
-    egress: FlowStats
-    ingress: FlowStats
-    unicast_packet: int
-    multicast_packet: int
-    broadcast_packet: int
-
-
-@dataclass
-class VSIFlowStats:
-    """Structure for VSI statistics."""
-
-    packet: int
-    unicast_packet: int
-    multicast_packet: int
-    broadcast_packet: int
-    discards_packet: int
-    errors_packet: int
-    unknown_packet: int | None = None
-
-
-@dataclass
-class VSIStats:
-    """Structure for both directions VSI statistics."""
-
-    ingress: VSIFlowStats
-    egress: VSIFlowStats
-
-
-@dataclass
-class TrafficClassCounters:
-    """Structure for both directions Traffic Classes Counter."""
-
-    tx: List[int]
-    rx: List[int]
-
-
-@dataclass
-class VsiListEntry:
-    """Structure for an entry in VSI list containing VSI ID and MAC address."""
-
-    vsi_id: int
-    mac: MACAddress
-
-
-@dataclass
-class VsiConfigListEntry:
-    """Structure for an entry in VSI Config list containing all fields."""
-
-    fn_id: int
-    host_id: int
-    is_vf: bool
-    vsi_id: int
-    vport_id: int
-    is_created: bool
-    is_enabled: bool
-    mac: MACAddress
-
-
-class LinkStatus(IntEnum):
-    """Link Status enum represents link state."""
-
-    DOWN = 0
-    UP = 1
+T = TypeVar("T")
+
+READ_ONLY_COMMAND_FLAG = "--query"
+MUTATING_COMMAND_FLAGS = frozenset({"--modify", "-m", "--event"})
+BATCH_MARKER = "__cli_client_batch_rc_"
+PIPE_MARKER = "__cli_client_pipe_rc_"
+MIRROR_PROFILE_MIN_ID = 16
+MIRROR_PROFILE_SUCCESS_MARKERS = (
+    "command succeeded",
+    "random mirror profile set",
+)
+
+
+def link_change_command(
+    link_status: str, link_speed: str = "200000Mbps", pf_num: Optional[int] = None, vport_id: Optional[int] = None
+) -> str:
+    """
+    Build link change event command.
+
+    :param link_status: Link status ('up' or 'down')
+    :param link_speed: Link speed (one of 100MB,1GB,10GB,40GB,20GB,25GB,2_5GB,5GB,xxxMbps(xxx from 1 to 200000))
+    :param pf_num: pf number on which link changes will be applied, all pfs if None
+    :param vport_id: vport id on which link changes will be applied (optional, used only with pf_num)
+    :return: Command for command line interface client tool
+    :raises CliClientException: on illegal link status
+    """
+    try:
+        link_status = LinkStatus[link_status.upper()]
+    except KeyError as illegal_link:
+        raise CliClientException("Link status must be 'up' or 'down'") from illegal_link
+    if pf_num is None:
+        return f"--event link_change --link_status {link_status} --link_speed {link_speed} --all_pf"
+    cmd = f"--event link_change --link_status {link_status} --link_speed {link_speed} "
+    cmd += f"--pf_num {hex(pf_num)} "
+    cmd += f"--vport_id {hex(vport_id)}" if vport_id else ""
+    return cmd
+
+
+def mirror_profile_command(profile_id: int, vsi_id: int, *, enable: bool = True) -> str:
+    """
+    Build command creating (enable) or disabling mirror profile.
+
+    :param profile_id: Mirror profile id (must be >= 16)
+    :param vsi_id: VSI id where packets will be mirrored
+    :param enable: Set func_valid, otherwise clear it
+    :return: Command for command line interface client tool
+    :raises CliClientException: on reserved profile id
+    """
+    if profile_id < MIRROR_PROFILE_MIN_ID:
+        raise CliClientException(f"Mirror profile id {profile_id} must be >=16. Profiles < 16 are reserved.")
+    cmd = f"--modify --config --mir_prof {profile_id} --vsi {vsi_id}"
+    return f"{cmd} --func_valid" if enable else cmd
+
+
+def mirror_profile_succeeded(output: str) -> bool:
+    """
+    Check output of mirror profile command.
+
+    :param output: Output of command
+    :return: True when command succeeded
+    """
+    output_lower = output.lower()
+    return any(marker in output_lower for marker in MIRROR_PROFILE_SUCCESS_MARKERS)
 
 
 class CliClient(ToolTemplate):
@@ -103,34 +126,104 @@ class CliClient(ToolTemplate):
 
     tool_executable_name = "cli_client"
     ALL_USER_PRIORITY_TRAFFIC_CLASS = 8
-    _MIRROR_PROFILE_SUCCESS_MARKERS = (
-        "command succeeded",
-        "random mirror profile set",
-    )
 
-    __init__ = os_supported(OSName.LINUX)(ToolTemplate.__init__)
+    @os_supported(OSName.LINUX)
+    def __init__(
+        self,
+        *,
+        connection: "Connection",
+        absolute_path_to_binary_dir: Optional[Union[Path, str]] = None,
+        coalesce_queries: bool = False,
+        query_rate_limit: Optional[RateLimiter] = None,
+        mutation_rate_limit: Optional[RateLimiter] = None,
+        remote_parsing: bool = False,
+        remote_parser_dir: str = "/tmp",
+        compression: Optional[CompressionPolicy] = None,
+        archive: Optional["OutputArchive"] = None,
+        adaptive_timeout: Optional[AdaptiveTimeout] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        persistent_runner: bool = False,
+        max_runner_restarts: int = 3,
+    ) -> None:
+        """
+        Initialize tool.
+
+        :param connection: Connection object
+        :param absolute_path_to_binary_dir: path to dir where binary of tool is stored
+                                            if None tool should be added to $PATH
+        :param coalesce_queries: Share result of read-only query in flight with identical concurrent queries
+                                 (same command, timeout and expected return codes) instead of executing them again
+        :param query_rate_limit: Rate and concurrency limit of read-only queries sent to CP
+        :param mutation_rate_limit: Rate and concurrency limit of commands which may modify CP state
+        :param remote_parsing: Parse large tables (VSI config, VM QoS info) on the CP by parser script pushed once
+                               to remote_parser_dir, local parsers are used as fallback
+        :param remote_parser_dir: Directory on the CP where parser scripts are pushed
+        :param compression: Policy of compressed transport of outputs. By default outputs are compressed only when
+                            requested with compress=True, pass CompressionPolicy(threshold=...) to compress outputs
+                            of command types learned to be large automatically.
+        :param archive: Archive which every raw output of cli_client is appended to, with command, host and time.
+                        Outputs redirected on the CP (e.g. warm-up queries) and outputs of remote parsers
+                        are not archived.
+        :param adaptive_timeout: Timeouts learned per command type from observed latency, timeout passed to methods
+                                 is used as ceiling
+        :param circuit_breaker: Breaker which rejects executions with CliClientCircuitOpen after repeated timeouts
+        :param persistent_runner: Execute commands through one long-lived shell on the CP, started on first
+                                  execution, instead of spawning remote shell per execution. Connection is used
+                                  directly when the shell cannot be started or exits.
+        :param max_runner_restarts: Number of times persistent runner is started again on next execution after
+                                    its shell exited (e.g. stopped on timeout), before connection is used for good
+        """
+        add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+        self.execution_stats = ExecutionStats()
+        self._stats_lock = Lock()
+        self._single_flight = SingleFlight() if coalesce_queries else None
+        self.query_rate_limit = query_rate_limit
+        self.mutation_rate_limit = mutation_rate_limit
+        self._remote_parser = RemoteParser(remote_parser_dir) if remote_parsing else None
+        self.compression = compression if compression is not None else CompressionPolicy(threshold=None)
+        self._snapshots: Dict[str, Tuple[float, typing.Any]] = {}
+        self.archive = archive
+        self.adaptive_timeout = adaptive_timeout
+        self.circuit_breaker = circuit_breaker
+        self._runner = PersistentRunner(connection) if persistent_runner else None
+        self._runner_restarts = max_runner_restarts
+        self._runner_lock = Lock()
+        super().__init__(connection=connection, absolute_path_to_binary_dir=absolute_path_to_binary_dir)
 
     def _get_tool_exec_factory(self) -> str:
         """Get correct tool name."""
         return self.tool_executable_name
 
-    def _apply_config_changes(self, module: str, success_val: str, config_file_path: Union[Path, str]) -> None:
+    def _apply_config_changes(
+        self,
+        module: str,
+        success_val: str,
+        config_file_path: Union[Path, str],
+        deadline: Optional[float] = None,
+    ) -> None:
         """
         Apply qos config file change (VMRL, TUPRL ect.) through the cli_client.
 
         :param config_file_path: Path to config file.
         :param module: Module to modify.
         :param success_val: Expected lower of success string.
+        :param deadline: Time budget in seconds of applying and waiting for update, None for no deadline.
         :raises CliClientException: on failure.
+        :raises CliClientDeadlineExceeded: when deadline passed before update was waited for.
         """
-        logger.log(level=log_levels.MODULE_DEBUG, msg="Apply the CP configuration changes.")
-        output = self.execute_cli_client_command(command=f"-b qos -m -C {module} -f {config_file_path}")
-        if success_val in output.lower():
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Configure and update {module} passed.")
-        else:
-            raise CliClientException(f"Configure and update {module} failed.")
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Wait 10 sec for update {config_file_path} file.")
-        sleep(10)
+        log.debug(logger, "Apply the CP configuration changes.")
+        steps = [f"apply {module} config", f"wait for update of {module}"]
+        with deadline_scope(f"apply_{module.lower()}_changes", deadline, steps) as budget:
+            with budget.step(steps[0]):
+                output = self.execute_cli_client_command(command=f"-b qos -m -C {module} -f {config_file_path}")
+                if success_val in output.lower():
+                    log.debug(logger, "Configure and update %s passed.", module)
+                else:
+                    raise CliClientException(f"Configure and update {module} failed.")
+            with budget.step(steps[1]):
+                log.debug(logger, "Wait 10 sec for update %s file.", config_file_path)
+                sleep(budget.clamp(10))
+                budget.check()
 
     def check_if_available(self) -> None:
         """
@@ -141,7 +234,12 @@ class CliClient(ToolTemplate):
         self._connection.execute_command(f"{self._tool_exec} -h", custom_exception=CliClientNotAvailable)
 
     def execute_cli_client_command(
-        self, command: str, *, timeout: int = 120, expected_return_codes: Iterable = frozenset({0})
+        self,
+        command: str,
+        *,
+        timeout: int = 120,
+        expected_return_codes: Iterable = frozenset({0}),
+        compress: Optional[bool] = None,
     ) -> str:
         """
         Execute any command passed through command parameter with command line interface client tool.
@@ -149,23 +247,498 @@ class CliClient(ToolTemplate):
         :param command: Command to execute using command line interface client tool.
         :param timeout: Maximum wait time for command to execute.
         :param expected_return_codes: Return codes to be considered acceptable
+        :param compress: Compress output on the CP and decompress it locally. None to let compression policy decide
+                         from learned output size of this command type.
         :return: Command output for user to verify it.
         """
-        command = f"{self._tool_exec} {command}"
-        output = self._connection.execute_command(
-            command, timeout=timeout, expected_return_codes=expected_return_codes
-        ).stdout
+        return self._execute_coalesced(
+            command, timeout=timeout, expected_return_codes=expected_return_codes, compress=compress
+        )
+
+    def _execute_coalesced(
+        self,
+        command: str,
+        *,
+        timeout: int,
+        expected_return_codes: Iterable,
+        pipe: Optional[str] = None,
+        compress: Optional[bool] = None,
+    ) -> str:
+        """
+        Execute command, sharing result of identical read-only query in flight.
+
+        :param command: Command to execute using command line interface client tool.
+        :param timeout: Maximum wait time for command to execute.
+        :param expected_return_codes: Return codes to be considered acceptable
+        :param pipe: Shell command on the CP which output of cli_client is piped through
+        :param compress: Compress output on the CP, None to let compression policy decide
+        :return: Command output.
+        """
+
+        def execute() -> str:
+            return self._execute_command(
+                command, timeout=timeout, expected_return_codes=expected_return_codes, pipe=pipe, compress=compress
+            )
+
+        if self._single_flight is None or not self._is_read_only_command(command):
+            return execute()
+
+        return_codes = frozenset(expected_return_codes) if expected_return_codes is not None else None
+        output, shared = self._single_flight.do((command, timeout, return_codes, pipe, compress), execute)
+        if shared:
+            with self._stats_lock:
+                self.execution_stats.coalesced += 1
         return output
 
+    def _execute_command(
+        self,
+        command: str,
+        *,
+        timeout: int,
+        expected_return_codes: Iterable,
+        pipe: Optional[str] = None,
+        compress: Optional[bool] = None,
+        archive: bool = True,
+    ) -> str:
+        """
+        Execute command with command line interface client tool on connection, within rate limits.
+
+        :param command: Command to execute using command line interface client tool.
+        :param timeout: Maximum wait time for command to execute.
+        :param expected_return_codes: Return codes to be considered acceptable
+        :param pipe: Shell command on the CP which output of cli_client is piped through
+        :param compress: Compress output on the CP, None to let compression policy decide
+        :param archive: Append output to archive, False e.g. for warm-up queries which output is discarded
+        :return: Command output.
+        """
+        with self._execution_slot(self._is_read_only_command(command)):
+            return self._execute_on_connection(
+                command,
+                timeout=timeout,
+                expected_return_codes=expected_return_codes,
+                pipe=pipe,
+                compress=compress,
+                archive=archive,
+            )
+
+    @contextmanager
+    def _execution_slot(self, read_only: bool) -> Iterator[None]:
+        """
+        Wait for slot in rate limits of command type.
+
+        :param read_only: Whether command only queries CP
+        """
+        if not read_only:
+            # cached snapshots may not reflect state changed by this command
+            self._snapshots.clear()
+        rate_limit = self.query_rate_limit if read_only else self.mutation_rate_limit
+        if rate_limit is None:
+            yield
+            return
+
+        with rate_limit.limit() as throttled_time:
+            if throttled_time:
+                with self._stats_lock:
+                    self.execution_stats.throttled_time += throttled_time
+            yield
+
+    def execute_cli_client_batch(
+        self,
+        commands: List[str],
+        *,
+        timeout: int = 120,
+        expected_return_codes: Optional[Iterable] = frozenset({0}),
+    ) -> List[str]:
+        """
+        Execute several commands with command line interface client tool in one remote invocation.
+
+        Commands are executed sequentially by one shell on the CP, output of each command is followed by marker
+        with its return code, so outputs can be split and checked locally.
+
+        :param commands: Commands to execute using command line interface client tool.
+        :param timeout: Maximum wait time for all commands to execute.
+        :param expected_return_codes: Return codes to be considered acceptable for each command, None to accept any
+        :return: Outputs of commands, in order of commands
+        :raises CliClientException: when any command returned unexpected return code or output is incomplete
+        """
+        return self._execute_batch(commands, timeout=timeout, expected_return_codes=expected_return_codes)[0]
+
+    def _execute_batch(
+        self, commands: List[str], *, timeout: int, expected_return_codes: Optional[Iterable]
+    ) -> Tuple[List[str], AcquisitionWindow]:
+        """
+        Execute several commands in one remote invocation and measure its round-trip.
+
+        :param commands: Commands to execute using command line interface client tool.
+        :param timeout: Maximum wait time for all commands to execute.
+        :param expected_return_codes: Return codes to be considered acceptable for each command, None to accept any
+        :return: Outputs of commands in order of commands, window of remote invocation
+        :raises CliClientException: when any command returned unexpected return code or output is incomplete
+        """
+        if not commands:
+            return AcquisitionWindow.measure(list)
+        marker = f"{BATCH_MARKER}{token_hex(4)}"
+        script = "; ".join(f"{self._tool_exec} {command}; printf '\\n{marker} %d\\n' $?" for command in commands)
+        read_only = all(self._is_read_only_command(command) for command in commands)
+        with self._execution_slot(read_only):
+            result, window = AcquisitionWindow.measure(
+                lambda: self._send(
+                    commands[0],
+                    script,
+                    count=len(commands),
+                    timeout=timeout,
+                    idempotent=read_only,
+                    expected_return_codes=frozenset({0}),
+                    shell=True,
+                )
+            )
+        output = result.stdout
+
+        outputs = []
+        position = 0
+        for match in re.finditer(rf"\n{marker} (\d+)(?:\n|$)", output):
+            command = commands[len(outputs)] if len(outputs) < len(commands) else None
+            if expected_return_codes is not None and int(match[1]) not in expected_return_codes:
+                raise CliClientException(f"Command ({command}) in batch returned unexpected return code {match[1]}")
+            outputs.append(output[position : match.start()])
+            position = match.end()
+        if len(outputs) != len(commands):
+            raise CliClientException(f"Batch output is incomplete, got {len(outputs)} of {len(commands)} outputs")
+        for command, command_output in zip(commands, outputs):
+            self._archive_output(command, command_output)
+        return outputs, window
+
+    def _send(
+        self, learned_as: str, script: str, *, timeout: int, count: int = 1, idempotent: bool = False, **kwargs
+    ) -> "ConnectionCompletedProcess":
+        """
+        Send command to connection, with adaptive timeout and circuit breaker.
+
+        :param learned_as: Command which latency is learned
+        :param script: Command executed on connection
+        :param timeout: Maximum wait time for command to execute, ceiling of adaptive timeout and deadline
+        :param count: Number of cli_client commands in script
+        :param idempotent: Whether script may be executed again when persistent runner exited while executing it
+        :param kwargs: Further parameters of execute_command
+        :return: Result of execute_command
+        :raises CliClientCircuitOpen: when circuit breaker is open
+        :raises CliClientDeadlineExceeded: when deadline of current composite operation passed
+        """
+        if self.adaptive_timeout is not None:
+            timeout = self.adaptive_timeout.timeout(learned_as, timeout, count)
+        unclamped_timeout = timeout
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+        # nothing may fail between trial let through by half-open breaker and recording its result
+        if self.circuit_breaker is not None:
+            try:
+                self.circuit_breaker.before_call()
+            except CliClientCircuitOpen:
+                with self._stats_lock:
+                    self.execution_stats.rejected += 1
+                raise
+
+        with self._stats_lock:
+            self.execution_stats.executions += 1
+        start = monotonic() if self.adaptive_timeout is not None else 0.0
+        try:
+            result = self._run(script, timeout=timeout, idempotent=idempotent, **kwargs)
+        except Exception as e:
+            if not is_timeout(e):
+                # CP responded, e.g. with unexpected return code
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                raise
+            log.debug(logger, "Execution of %s timed out after %ds.", learned_as, timeout)
+            with self._stats_lock:
+                self.execution_stats.timeouts += 1
+            # timeout shortened by deadline says nothing about latency of command
+            if self.adaptive_timeout is not None and timeout == unclamped_timeout:
+                self.adaptive_timeout.record_timeout(learned_as, timeout, count)
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_timeout()
+            raise
+
+        if self.adaptive_timeout is not None:
+            self.adaptive_timeout.record(learned_as, monotonic() - start, count)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+        return result
+
+    def _run(self, script: str, *, timeout: int, idempotent: bool, **kwargs) -> "ConnectionCompletedProcess":
+        """
+        Execute script through persistent runner, falling back to connection.
+
+        :param script: Command executed on the CP
+        :param timeout: Maximum wait time for command to execute
+        :param idempotent: Whether script may be executed again when persistent runner exited while executing it
+        :param kwargs: Further parameters of execute_command
+        :return: Result of execution
+        :raises CliClientException: when persistent runner exited while executing script which is not idempotent
+        """
+        runner = self._current_runner() if "\n" not in script else None
+        if runner is not None:
+            try:
+                runner.start()
+            except CliClientRunnerUnavailable as e:
+                if not runner.started:
+                    # shell cannot be started through this connection, it is not started again
+                    log.debug(logger, "Persistent runner disabled: %s", e)
+                    with self._runner_lock:
+                        if self._runner is runner:
+                            self._runner = None
+                runner = None
+        if runner is not None:
+            try:
+                result = runner.execute(
+                    script, timeout=timeout, expected_return_codes=kwargs.get("expected_return_codes")
+                )
+                with self._stats_lock:
+                    self.execution_stats.runner_executions += 1
+                return result
+            except CliClientRunnerUnavailable as e:
+                log.debug(logger, "Persistent runner did not execute request: %s", e)
+            except CliClientException as e:
+                log.debug(logger, "Persistent runner exited: %s", e)
+                if not idempotent:
+                    raise
+        return self._connection.execute_command(script, timeout=timeout, **kwargs)
+
+    def _current_runner(self) -> Optional[PersistentRunner]:
+        """
+        Get persistent runner, replacing exited one with new runner while restarts are left.
+
+        :return: Runner to execute script, None to use connection
+        """
+        with self._runner_lock:
+            runner = self._runner
+            if runner is None or not runner.closed:
+                return runner
+            if self._runner_restarts <= 0:
+                log.debug(logger, "Persistent runner disabled, no restarts left.")
+                self._runner = None
+                return None
+            self._runner_restarts -= 1
+            log.debug(logger, "Restarting persistent runner, %d restarts left.", self._runner_restarts)
+            self._runner = PersistentRunner(self._connection)
+            return self._runner
+
+    def stop_runner(self) -> None:
+        """Stop persistent runner on the CP, later commands are executed through connection."""
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            runner.close()
+
+    def _execute_on_connection(
+        self,
+        command: str,
+        *,
+        timeout: int,
+        expected_return_codes: Iterable,
+        pipe: Optional[str] = None,
+        compress: Optional[bool] = None,
+        archive: bool = True,
+    ) -> str:
+        """
+        Execute command with command line interface client tool on connection, without any client-side policy.
+
+        :param command: Command to execute using command line interface client tool.
+        :param timeout: Maximum wait time for command to execute.
+        :param expected_return_codes: Return codes to be considered acceptable
+        :param pipe: Shell command on the CP which output of cli_client is piped through
+        :param compress: Compress output on the CP, None to let compression policy decide
+        :param archive: Append output to archive, only outputs which are not piped are archived
+        :return: Command output.
+        """
+        learned_as = command if pipe is None else f"{command} | {pipe}"
+        compressed = self.compression.should_compress(learned_as, compress)
+        pipes = [pipe] if pipe is not None else []
+        if compressed:
+            pipes.append(self.compression.remote_pipe)
+
+        start = monotonic()
+        idempotent = self._is_read_only_command(command)
+        if pipes:
+            output = self._send_piped(
+                learned_as,
+                command,
+                pipes,
+                timeout=timeout,
+                idempotent=idempotent,
+                expected_return_codes=expected_return_codes,
+            )
+        else:
+            output = self._send(
+                learned_as,
+                f"{self._tool_exec} {command}",
+                timeout=timeout,
+                idempotent=idempotent,
+                expected_return_codes=expected_return_codes,
+            ).stdout
+
+        if compressed:
+            payload_size = len(output)
+            try:
+                output = self.compression.decode(output)
+            except ValueError as e:
+                self.compression.enabled = False
+                logger.warning(
+                    "Compressed transport disabled for this client, compressed output of %s could not be decoded "
+                    "(compression is likely not supported on the CP): %s",
+                    command,
+                    e,
+                )
+                if not idempotent:
+                    # command already ran on the CP, executing it again could apply change twice
+                    raise CliClientException(
+                        f"Compressed output of command ({command}) could not be decoded, command may modify CP state "
+                        f"so it is not executed again: {e}. Raw output: {output!r}"
+                    ) from e
+                return self._execute_on_connection(
+                    command,
+                    timeout=timeout,
+                    expected_return_codes=expected_return_codes,
+                    pipe=pipe,
+                    compress=False,
+                    archive=archive,
+                )
+
+        time_saved = self.compression.record(learned_as, len(output), monotonic() - start, compressed)
+        if compressed:
+            with self._stats_lock:
+                self.execution_stats.compressed_executions += 1
+                self.execution_stats.compressed_bytes += payload_size
+                self.execution_stats.decompressed_bytes += len(output)
+                if time_saved is not None:
+                    self.execution_stats.compression_time_saved += time_saved
+        if archive and pipe is None:
+            self._archive_output(command, output)
+        return output
+
+    def _send_piped(
+        self,
+        learned_as: str,
+        command: str,
+        pipes: List[str],
+        *,
+        timeout: int,
+        idempotent: bool,
+        expected_return_codes: Optional[Iterable],
+    ) -> str:
+        """
+        Send command which output is piped through shell commands on the CP, checking return code of cli_client.
+
+        Return code of pipeline is return code of its last command, so return code of cli_client is captured
+        on the CP (POSIX replacement of pipefail) and printed after output of pipeline, followed by marker.
+
+        :param learned_as: Command which latency is learned
+        :param command: Command passed to command line interface client tool
+        :param pipes: Shell commands output of cli_client is piped through, in order
+        :param timeout: Maximum wait time for command to execute
+        :param idempotent: Whether command may be executed again when persistent runner exited while executing it
+        :param expected_return_codes: Return codes of cli_client to be considered acceptable, None to accept any
+        :return: Output of last pipe, as is when return code of cli_client is missing in it
+        :raises CliClientException: when cli_client returned unexpected return code
+        """
+        marker = f"{PIPE_MARKER}{token_hex(4)}"
+        pipeline = " | ".join([f"{{ {self._tool_exec} {command}; printf '%d' $? >&3; }}", *pipes])
+        script = f"{{ rc=$( {{ {pipeline} >&4; }} 3>&1 ); }} 4>&1; printf '\\n{marker} %s\\n' \"$rc\""
+        output = self._send(
+            learned_as,
+            script,
+            timeout=timeout,
+            idempotent=idempotent,
+            expected_return_codes=frozenset({0}),
+            shell=True,
+        ).stdout
+        match = re.search(rf"(?:^|\n){marker} (\d+)\s*$", output)
+        if match is None:
+            # shell output is incomplete, consumer of pipe output validates it
+            return output
+        if expected_return_codes is not None and int(match[1]) not in expected_return_codes:
+            raise CliClientException(f"Command ({command}) returned unexpected return code {match[1]}")
+        return output[: match.start()]
+
+    def _archive_output(self, command: str, output: str) -> None:
+        """
+        Append raw output of command to archive, if any.
+
+        :param command: Command passed to command line interface client tool.
+        :param output: Raw output of command
+        """
+        if self.archive is None or ">" in command.split():
+            return
+        self.archive.append(command, output, host=str(getattr(self._connection, "ip", None) or ""))
+
+    @staticmethod
+    def _is_read_only_command(command: str) -> bool:
+        """
+        Check if command only queries CP and can be safely shared between callers.
+
+        :param command: Command passed to command line interface client tool.
+        :return: True for queries, False for commands which may modify CP state
+        """
+        flags = command.split()
+        return READ_ONLY_COMMAND_FLAG in flags and MUTATING_COMMAND_FLAGS.isdisjoint(flags)
+
+    def _query_with_remote_parser(self, name: str, command: str, decoder: Callable[[str], T]) -> Optional[T]:
+        """
+        Execute query and parse its output on the CP.
+
+        :param name: Name of remote parser script
+        :param command: Query to execute using command line interface client tool.
+        :param decoder: Function decoding output of remote parser
+        :return: Decoded result or None when remote parsing failed and local parser has to be used
+        :raises CliClientException: when query failed, e.g. with unexpected return code of cli_client
+        """
+        try:
+            self._remote_parser.install(self._connection)
+        except Exception as e:
+            if is_timeout(e):
+                raise
+            log.debug(logger, "Remote parsing disabled, cannot push parser: %s", e)
+            self._remote_parser = None
+            return None
+        # only undecodable output falls back to local parsing, failed query (timeout, open circuit, passed deadline,
+        # unexpected return code) would fail again when repeated
+        output = self._execute_coalesced(
+            command, timeout=120, expected_return_codes=frozenset({0}), pipe=self._remote_parser.pipe(name)
+        )
+        try:
+            return decoder(output)
+        except CliClientRemoteParserError as e:
+            log.debug(logger, "Remote parsing of %s failed, parsing locally: %s", name, e)
+            return None
+
     def get_version(self) -> Optional[str]:
         """
         Get version of tool.
 
         :return: Version of tool
         """
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Tool version is not available for {self.tool_executable_name}")
+        log.debug(logger, "Tool version is not available for %s", self.tool_executable_name)
         return "N/A"
 
+    def _read_statistics(self, command: str, *, timeout: int = 120) -> Tuple[str, AcquisitionWindow]:
+        """
+        Warm up statistics query and read refreshed statistics.
+
+        Neither query is coalesced: warm-up and real query share command, so real query could join warm-up
+        of another caller in flight and return its stale output.
+
+        :param command: Statistics query passed to command line interface client tool
+        :param timeout: Maximum wait time for each query to execute
+        :return: Output of real query and window of its round-trip to the CP
+        """
+        # w/a because the first execution of this command never shows refreshed stats, its output is not archived
+        self._execute_command(command, timeout=timeout, expected_return_codes=frozenset({0}), archive=False)
+        with self._execution_slot(read_only=True):
+            # window starts after waiting for rate limit, so it bounds only the round-trip counters were read in
+            return AcquisitionWindow.measure(
+                lambda: self._execute_on_connection(command, timeout=timeout, expected_return_codes=frozenset({0}))
+            )
+
     def get_switch_stats(self, switch_id: int = 1) -> SwitchStats:
         """
         Get command line interface client switch stats.
@@ -173,54 +746,53 @@ class CliClient(ToolTemplate):
         :param switch_id: switch ID
         :return: Stats for both directions
         """
-        command = f"--query --statistics --switch {switch_id}"
-        # w/a because the first execution of this command never shows refreshed stats.
-        self.execute_cli_client_command(command=command)
-        output = self.execute_cli_client_command(command=command)
-        rx_stats = FlowStats([0], 0, 0)
-        tx_stats = FlowStats([0], 0, 0)
-        unicast_counter = multicast_counter = broadcast_counter = 0
-
-        for direction_in_output, direction_in_stats in zip(["egress", "ingress"], ["tx", "rx"]):
-            traffic_classes_packet_counter = [0] * self.ALL_USER_PRIORITY_TRAFFIC_CLASS
-            packet_counter = discards_counter = 0
-            for traffic_class in range(self.ALL_USER_PRIORITY_TRAFFIC_CLASS):
-                tc_counter_regex = rf"{direction_in_output}\stc\s{traffic_class}\spacket\scounter:\s(?P<counter>\d+)"
-                match = re.search(tc_counter_regex, output)
-                if match:
-                    traffic_classes_packet_counter[traffic_class] = int(match.group("counter"))
-
-            packet_counter_regex = rf"{direction_in_output}\spacket:\s(?P<counter>\d+)\sbytes"
-            match = re.search(packet_counter_regex, output)
-            if match:
-                packet_counter = int(match.group("counter"))
-
-            discards_counter_regex = rf"{direction_in_output}\sdiscards\spacket:\s(?P<counter>\d+)\sbytes"
-            match = re.search(discards_counter_regex, output)
-            if match:
-                discards_counter = int(match.group("counter"))
-
-            if "tx" == direction_in_stats:
-                tx_stats = FlowStats(traffic_classes_packet_counter, packet_counter, discards_counter)
-            else:
-                rx_stats = FlowStats(traffic_classes_packet_counter, packet_counter, discards_counter)
+        output, window = self._read_statistics(f"--query --statistics --switch {switch_id}")
+        stats = parse_switch_stats(output, traffic_class_count=self.ALL_USER_PRIORITY_TRAFFIC_CLASS)
+        stats.window = window
+        return stats
 
-        unicast_counter_regex = r"unicast\spacket:\s(?P<counter>\d+)\sbytes"
-        match = re.search(unicast_counter_regex, output)
-        if match:
-            unicast_counter = int(match.group("counter"))
+    def get_switch_stats_snapshot(self, switch_id: int = 1, max_age: Optional[float] = None) -> SwitchStatsSnapshot:
+        """
+        Get switch stats with views derived from them (TC priorities, totals, casting ratios) from one acquisition.
+
+        :param switch_id: switch ID
+        :param max_age: Return snapshot acquired at most max_age seconds ago instead of querying again, if available
+        :return: Snapshot of switch stats
+        """
+        return self._get_snapshot(
+            f"switch_stats_{switch_id}",
+            max_age,
+            lambda: SwitchStatsSnapshot(switch_id, self.get_switch_stats(switch_id)),
+        )
 
-        multicast_counter_regex = r"multicast\spacket:\s(?P<counter>\d+)\sbytes"
-        match = re.search(multicast_counter_regex, output)
-        if match:
-            multicast_counter = int(match.group("counter"))
+    def get_switch_stats_bulk(
+        self, switch_ids: Iterable[int], *, warm_up: Union[bool, Iterable[int]] = True, timeout: int = 120
+    ) -> Dict[int, SwitchStats]:
+        """
+        Get command line interface client switch stats of many switches in one remote invocation.
 
-        broadcast_counter_regex = r"broadcast\spacket:\s(?P<counter>\d+)\sbytes"
-        match = re.search(broadcast_counter_regex, output)
-        if match:
-            broadcast_counter = int(match.group("counter"))
+        Warm-up queries are sent in the same invocation before the first real query and their outputs are discarded
+        on the CP, real queries follow back to back, so all switches are sampled at almost the same instant.
+        All stats share the same acquisition window and are stored as snapshots of get_switch_stats_snapshot().
 
-        return SwitchStats(tx_stats, rx_stats, unicast_counter, multicast_counter, broadcast_counter)
+        :param switch_ids: Switch IDs
+        :param warm_up: Warm up all switches, none of them (e.g. when they were queried recently) or only passed IDs
+        :param timeout: Maximum wait time for all queries to execute
+        :return: Stats for both directions by switch ID
+        :raises CliClientException: on failure of any query
+        """
+        switch_ids = list(dict.fromkeys(switch_ids))
+        outputs, window = self._query_statistics_bulk("switch", switch_ids, warm_up=warm_up, timeout=timeout)
+        stats = {}
+        for switch_id, output in zip(switch_ids, outputs):
+            stats[switch_id] = parse_switch_stats(output, traffic_class_count=self.ALL_USER_PRIORITY_TRAFFIC_CLASS)
+            stats[switch_id].window = window
+            # derived queries (e.g. get_tc_priorities_switch with max_age) reuse this acquisition
+            self._snapshots[f"switch_stats_{switch_id}"] = (
+                window.started,
+                SwitchStatsSnapshot(switch_id, stats[switch_id]),
+            )
+        return stats
 
     def get_vsi_statistics(self, vsi_id: int = 1) -> VSIStats:
         """
@@ -229,50 +801,87 @@ class CliClient(ToolTemplate):
         :param vsi_id: VSI ID
         :return: Stats for both directions
         """
-        command = f"--query --statistics --vsi {vsi_id}"
-        # w/a because the first execution of this command never shows refreshed stats.
-        self.execute_cli_client_command(command=command)
-        output = self.execute_cli_client_command(command=command)
-        rx_stats = VSIFlowStats(0, 0, 0, 0, 0, 0, 0)
-        tx_stats = VSIFlowStats(0, 0, 0, 0, 0, 0, 0)
-        stats = {}
+        output, window = self._read_statistics(f"--query --statistics --vsi {vsi_id}")
+        stats = parse_vsi_statistics(output)
+        stats.window = window
+        return stats
+
+    def get_vsi_statistics_bulk(
+        self, vsi_ids: Iterable[int], *, warm_up: Union[bool, Iterable[int]] = True, timeout: int = 120
+    ) -> Dict[int, VSIStats]:
+        """
+        Get command line interface client vsi stats of many VSIs in one remote invocation.
 
-        for direction in ["ingress", "egress"]:
-            patterns = {
-                "packet": rf"{direction} packet: (?P<counter>\d+)",
-                "unicast_packet": rf"{direction} unicast packet: (?P<counter>\d+)",
-                "multicast_packet": rf"{direction} multicast packet: (?P<counter>\d+)",
-                "broadcast_packet": rf"{direction} broadcast packet: (?P<counter>\d+)",
-                "discards_packet": rf"{direction} discards packet: (?P<counter>\d+)",
-                "errors_packet": rf"{direction} errors packet: (?P<counter>\d+)",
-                "unknown_packet": rf"{direction} unknown packet: (?P<counter>\d+)",
-            }
-            for key, regex in patterns.items():
-                match = re.search(regex, output)
-                stats[key] = int(match.group("counter")) if match else None
-
-            if "ingress" == direction:
-                rx_stats = VSIFlowStats(**stats)
-            else:
-                tx_stats = VSIFlowStats(**stats)
+        Warm-up queries (first execution of the query never shows refreshed stats) are sent in the same invocation,
+        all of them before the first real query, and their outputs are discarded on the CP.
+
+        :param vsi_ids: VSI IDs
+        :param warm_up: Warm up all VSIs, none of them (e.g. when they were queried recently) or only passed VSI IDs
+        :param timeout: Maximum wait time for all queries to execute
+        :return: Stats for both directions by VSI ID
+        :raises CliClientException: on failure of any query
+        """
+        vsi_ids = list(dict.fromkeys(vsi_ids))
+        outputs, window = self._query_statistics_bulk("vsi", vsi_ids, warm_up=warm_up, timeout=timeout)
+        stats = {}
+        for vsi_id, output in zip(vsi_ids, outputs):
+            stats[vsi_id] = parse_vsi_statistics(output)
+            stats[vsi_id].window = window
+        return stats
+
+    def _query_statistics_bulk(
+        self, target: str, ids: List[int], *, warm_up: Union[bool, Iterable[int]], timeout: int
+    ) -> Tuple[List[str], AcquisitionWindow]:
+        """
+        Query statistics of many objects in one remote invocation, warm-up queries first.
 
-        return VSIStats(rx_stats, tx_stats)
+        Real queries cannot be timed apart from warm-up queries of the same invocation, so window of real queries
+        spans the whole invocation.
 
-    def add_group_vf2vm(self, psm_vf2vm: Dict[int, List[int]]) -> None:
+        :param target: Flag of queried object without dashes, e.g. 'vsi' or 'switch'
+        :param ids: Unique IDs of objects
+        :param warm_up: Warm up all objects, none of them or only passed IDs
+        :param timeout: Maximum wait time for all queries to execute
+        :return: Outputs of real queries in order of IDs, window of invocation
+        :raises CliClientException: on failure of any query
+        """
+        if warm_up is True:
+            warm_up_ids = ids
+        elif warm_up is False:
+            warm_up_ids = []
+        else:
+            requested = set(ids)
+            warm_up_ids = [object_id for object_id in dict.fromkeys(warm_up) if object_id in requested]
+        commands = [f"--query --statistics --{target} {object_id} > /dev/null" for object_id in warm_up_ids]
+        commands += [f"--query --statistics --{target} {object_id}" for object_id in ids]
+        outputs, window = self._execute_batch(commands, timeout=timeout, expected_return_codes=frozenset({0}))
+        return outputs[len(warm_up_ids) :], window
+
+    def add_group_vf2vm(self, psm_vf2vm: Dict[int, List[int]], *, deadline: Optional[float] = None) -> None:
         """Create a full vf2vm topology in PSM from a dictionary.
 
         :param psm_vf2vm: Dictionary of VMs to create and list of Vfs to assign to VMs.
         :type psm_vf2vm: Dict[int, List[int]]
+        :param deadline: Time budget in seconds of whole topology, None for no deadline
         :raises CliClientException: on failure
+        :raises CliClientDeadlineExceeded: when deadline passed, with nodes and mappings created so far
         """
-        for vmid in psm_vf2vm.keys():
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Creating PSM VM node {vmid}")
-            self.add_psm_vm_node(vm_id=vmid)
-
-        for vmid, vfs in psm_vf2vm.items():
-            for vf in vfs:
-                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Mapping VF: {vf} to VM node: {vmid}")
-                self.add_vf_to_vm_node(vm_id=vmid, vf_id=vf)
+        steps = [f"add VM node {vmid}" for vmid in psm_vf2vm]
+        steps += [f"map VF {vf} to VM node {vmid}" for vmid, vfs in psm_vf2vm.items() for vf in vfs]
+        with (
+            log.BulkLog(logger, "Create vf2vm topology in PSM") as bulk,
+            deadline_scope("add_group_vf2vm", deadline, steps) as budget,
+        ):
+            for vmid in psm_vf2vm.keys():
+                bulk.step("Creating PSM VM node %s", vmid)
+                with budget.step(f"add VM node {vmid}"):
+                    self.add_psm_vm_node(vm_id=vmid)
+
+            for vmid, vfs in psm_vf2vm.items():
+                for vf in vfs:
+                    bulk.step("Mapping VF: %s to VM node: %s", vf, vmid)
+                    with budget.step(f"map VF {vf} to VM node {vmid}"):
+                        self.add_vf_to_vm_node(vm_id=vmid, vf_id=vf)
 
     def add_psm_vm_node(self, vm_id: Union[int, str] = 1) -> None:
         """
@@ -289,7 +898,7 @@ class CliClient(ToolTemplate):
 
         output = self.execute_cli_client_command(command=f"-b psm -m -c -H 0 --vmid {vm_id}")
         if "command succeeded" in output.lower():
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Successfully add PSM VM node id: {vm_id}.")
+            log.debug(logger, "Successfully add PSM VM node id: %s.", vm_id)
         else:
             raise CliClientException(f"Error adding PSM VM node id: {vm_id}")
 
@@ -313,15 +922,17 @@ class CliClient(ToolTemplate):
 
         output = self.execute_cli_client_command(command=f"-b psm -m -c -H 0 --vfid {vf_id} --vmid {vm_id}")
         if "command succeeded" in output.lower():
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Successfully add VF {vf_id} to VM node id {vm_id}.")
+            log.debug(logger, "Successfully add VF %s to VM node id %s.", vf_id, vm_id)
         else:
             raise CliClientException(f"Error adding VF {vf_id} to VM node id {vm_id}")
 
-    def prepare_vm_vsi(self, vf_amount: Union[int, str] = 1) -> None:
+    def prepare_vm_vsi(self, vf_amount: Union[int, str] = 1, *, deadline: Optional[float] = None) -> None:
         """
         Pick a VM ID for each VM and associate it to the host.
 
         :param vf_amount: Number of VFs. If hex string, hex is used in cli_client command.
+        :param deadline: Time budget in seconds of mapping all VFs, None for no deadline
+        :raises CliClientDeadlineExceeded: when deadline passed, with VFs mapped so far
         """
         use_hex = True
         if isinstance(vf_amount, str):
@@ -334,14 +945,20 @@ class CliClient(ToolTemplate):
             use_hex = False
 
         # Start vm nodes at 1
-        for node in vf_id_list:
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Mapping vf_id: {node} to vm node: {node+1}")
-            if use_hex:
-                self.add_psm_vm_node(vm_id=hex(node + 1))
-                self.add_vf_to_vm_node(vf_id=hex(node), vm_id=hex(node + 1))
-            else:
-                self.add_psm_vm_node(vm_id=node + 1)
-                self.add_vf_to_vm_node(vf_id=node, vm_id=node + 1)
+        steps = [
+            step for node in vf_id_list for step in (f"add VM node {node + 1}", f"map VF {node} to VM node {node + 1}")
+        ]
+        with (
+            log.BulkLog(logger, "Map VFs to VM nodes") as bulk,
+            deadline_scope("prepare_vm_vsi", deadline, steps) as budget,
+        ):
+            for node in vf_id_list:
+                bulk.step("Mapping vf_id: %s to vm node: %s", node, node + 1)
+                vf_id, vm_id = (hex(node), hex(node + 1)) if use_hex else (node, node + 1)
+                with budget.step(f"add VM node {node + 1}"):
+                    self.add_psm_vm_node(vm_id=vm_id)
+                with budget.step(f"map VF {node} to VM node {node + 1}"):
+                    self.add_vf_to_vm_node(vf_id=vf_id, vm_id=vm_id)
 
     def find_vf_vsi(self, vf_amount: int = 1) -> Dict[str, str]:
         """
@@ -350,20 +967,15 @@ class CliClient(ToolTemplate):
         :param vf_amount: Number of VFs
         :return: dict with vf vsi
         """
-        vf_found = 0
-        logger.log(level=log_levels.MODULE_DEBUG, msg="Find VFs VSIs.")
-        output = self.get_vsi_config_list()
+        log.debug(logger, "Find VFs VSIs.")
+        table = self.get_vsi_config_list()
         vf_vsi = {}
 
-        for vsi in output:
-            if vf_found != vf_amount:
-                if vsi.is_vf is False:
-                    continue
-                else:
-                    vf_vsi[f"{vsi.fn_id:x}"] = f"{vsi.vsi_id:x}"
-                    vf_found = vf_found + 1
-            else:
+        for fn_id, vsi_id, flags in zip(table.fn_ids, table.vsi_ids, table.flags):
+            if len(vf_vsi) == vf_amount:
                 break
+            if flags & IS_VF:
+                vf_vsi[f"{fn_id:x}"] = f"{vsi_id:x}"
 
         return vf_vsi
 
@@ -373,116 +985,190 @@ class CliClient(ToolTemplate):
 
         :return: list with entries from VSI list containing VSI ID and MAC address
         """
-        output = self.get_vsi_config_list()
-        vsi_mac_list = []
+        table = self.get_vsi_config_list()
+        return [VsiListEntry(vsi_id, MACAddress(mac)) for vsi_id, mac in zip(table.vsi_ids, table.macs)]
 
-        for vsi in output:
-            vsi_mac_list.append(VsiListEntry(vsi.vsi_id, vsi.mac))
+    def get_vsi_config_list(self, max_age: Optional[float] = None) -> VsiConfigTable:
+        """
+        Get MAC and VSI list.
 
-        return vsi_mac_list
+        :param max_age: Return snapshot queried at most max_age seconds ago instead of querying again, if available
+        :return: table with entries from VSI list containing all fields in ouput, usable as list of VsiConfigListEntry
+        """
+        # table is mutable like list, so every caller gets own copy of shared snapshot
+        return self._get_snapshot("vsi_config", max_age, self._query_vsi_config_list).copy()
 
-    def get_vsi_config_list(self) -> List[VsiConfigListEntry]:
+    def _query_vsi_config_list(self) -> VsiConfigTable:
         """
-        Get MAC and VSI list.
+        Query VSI config table.
+
+        :return: table with entries from VSI list containing all fields in ouput
+        """
+        command = "--query --config --verbose"
+        if self._remote_parser is not None:
+            vsi_config_list = self._query_with_remote_parser("vsi_config", command, decode_vsi_config_list)
+            if vsi_config_list is not None:
+                return vsi_config_list
+        output = self.execute_cli_client_command(command=command)
+        return parse_vsi_config_list(output)
+
+    def _get_snapshot(self, name: str, max_age: Optional[float], query: Callable[[], T]) -> T:
+        """
+        Get cached snapshot of CP state or query fresh one.
+
+        :param name: Name of snapshot
+        :param max_age: Maximum age of cached snapshot in seconds, None to always query
+        :param query: Function querying snapshot
+        :return: Snapshot
+        """
+        if max_age is not None:
+            cached = self._snapshots.get(name)
+            if cached is not None and monotonic() - cached[0] <= max_age:
+                return cached[1]
+        queried_at = monotonic()
+        snapshot = query()
+        self._snapshots[name] = (queried_at, snapshot)
+        return snapshot
+
+    def wait_for_vsi_state(
+        self,
+        predicate: Callable[[VsiConfigTable], bool],
+        timeout: float = 60,
+        *,
+        backoff: Optional[Backoff] = None,
+        max_age: Optional[float] = 1.0,
+    ) -> WaitResult[VsiConfigTable]:
+        """
+        Wait until VSI config table meets condition.
+
+        Table is polled with adaptive backoff and returned as soon as condition holds.
 
-        :return: list with entries from VSI list containing all fields in ouput
+        :param predicate: Condition, e.g. vfs_created_and_enabled(4), vsi_has_mac(0x1d, "00:1d:00:00:03:14")
+        :param timeout: Maximum time of waiting in seconds
+        :param backoff: Policy of delays between polls
+        :param max_age: Maximum age of cached table which can be checked first
+        :return: Table which met condition, elapsed time and number of checked tables
+        :raises CliClientTimeout: when condition is not met in time
         """
-        output = self.execute_cli_client_command(command="--query --config --verbose")
-        pattern = re.compile(
-            r"fn_id:\s(?P<fn_id>\w+).*host_id:\s(?P<host_id>\w+).*is_vf:\s(?P<is_vf>(no|yes)).*vsi_id:\s(?P"
-            r"<vsi_id>\w+).*vport_id\s(?P<vport_id>\w+).*is_created:\s(?P<is_created>(no|yes)).*is_enabled:"
-            r"\s(?P<is_enabled>(no|yes))\smac\saddr:\s(?P<mac>([a-fA-F0-9]{1,2}[:|-]?){6})"
+        return wait_until(
+            self.get_vsi_config_list,
+            predicate,
+            timeout,
+            backoff=backoff,
+            max_age=max_age,
+            description=f"VSI state {getattr(predicate, '__qualname__', predicate)}",
         )
-        vsi_config_list = []
-
-        for line in [match.groupdict() for match in pattern.finditer(output)]:
-            fn_id = int(line["fn_id"], 16)
-            host_id = int(line["host_id"], 16)
-            is_vf = True if line["is_vf"] == "yes" else False
-            vsi_id = int(line["vsi_id"], 16)
-            vport_id = int(line["vport_id"], 16)
-            is_created = True if line["is_created"] == "yes" else False
-            is_enabled = True if line["is_enabled"] == "yes" else False
-            mac = MACAddress(line["mac"])
-            vsi_config_list.append(
-                VsiConfigListEntry(fn_id, host_id, is_vf, vsi_id, vport_id, is_created, is_enabled, mac)
-            )
 
-        return vsi_config_list
+    def wait_for_qos_vm_info(
+        self,
+        predicate: Callable[[Dict[int, Dict[int, List[int]]]], bool],
+        timeout: float = 60,
+        *,
+        backoff: Optional[Backoff] = None,
+        max_age: Optional[float] = 1.0,
+    ) -> WaitResult[Dict[int, Dict[int, List[int]]]]:
+        """
+        Wait until VF2VM mapping meets condition.
+
+        Mapping is polled with adaptive backoff and returned as soon as condition holds.
 
-    def get_tc_priorities_switch(self, switch_id: int = 1) -> TrafficClassCounters:
+        :param predicate: Condition, e.g. vm_mapping_present(vm_id=1, vf_ids=[0])
+        :param timeout: Maximum time of waiting in seconds
+        :param backoff: Policy of delays between polls
+        :param max_age: Maximum age of cached mapping which can be checked first
+        :return: Mapping which met condition, elapsed time and number of checked mappings
+        :raises CliClientTimeout: when condition is not met in time
+        """
+        return wait_until(
+            self.read_qos_vm_info,
+            predicate,
+            timeout,
+            backoff=backoff,
+            max_age=max_age,
+            description=f"VM QoS info {getattr(predicate, '__qualname__', predicate)}",
+        )
+
+    def get_tc_priorities_switch(self, switch_id: int = 1, max_age: Optional[float] = None) -> TrafficClassCounters:
         """
         Get Traffic Class priorities from switch stats.
 
         :param switch_id: switch ID
+        :param max_age: Use switch stats snapshot acquired at most max_age seconds ago instead of querying again
         :return: Stats of Traffic Classes counter
         """
-        switch_stats = self.get_switch_stats(switch_id)
-        return TrafficClassCounters(
-            rx=switch_stats.ingress.traffic_class_counters, tx=switch_stats.egress.traffic_class_counters
-        )
+        return self.get_switch_stats_snapshot(switch_id, max_age=max_age).tc_priorities()
 
-    def apply_up_tc_changes(self, config_file_path: Union[Path, str]) -> None:
+    def apply_up_tc_changes(self, config_file_path: Union[Path, str], *, deadline: Optional[float] = None) -> None:
         """
         Apply the User Priorities and Traffic Classes configuration changes from file.
 
         :param config_file_path: Path to user priority/traffic classes file
+        :param deadline: Time budget in seconds of applying and waiting for update, None for no deadline
         :raises CliClientException: on failure
         """
-        self._apply_config_changes("TC", "file successfully processed", config_file_path)
+        self._apply_config_changes("TC", "file successfully processed", config_file_path, deadline)
 
-    def apply_tuprl_changes(self, config_file_path: Union[Path, str]) -> None:
+    def apply_tuprl_changes(self, config_file_path: Union[Path, str], *, deadline: Optional[float] = None) -> None:
         """
         Apply the TUPRL configuration changes from file.
 
         :param config_file_path: Path to user qos_tuprl.cfg file
+        :param deadline: Time budget in seconds of applying and waiting for update, None for no deadline
         :raises CliClientException: on failure
         """
-        self._apply_config_changes("TUPRL", "command succeeded", config_file_path)
+        self._apply_config_changes("TUPRL", "command succeeded", config_file_path, deadline)
 
-    def apply_mrl_changes(self, config_file_path: Union[Path, str]) -> None:
+    def apply_mrl_changes(self, config_file_path: Union[Path, str], *, deadline: Optional[float] = None) -> None:
         """
         Apply the MRL (Mirror Rate Limit) configuration changes from file.
 
         :param config_file_path: Path to user qos_mirr_rl.cfg file
+        :param deadline: Time budget in seconds of applying and waiting for update, None for no deadline
         :raises CliClientException: on failure
         """
-        self._apply_config_changes("MRL", "command succeeded", config_file_path)
+        self._apply_config_changes("MRL", "command succeeded", config_file_path, deadline)
 
-    def apply_fxprl_changes(self, config_file_path: Union[Path, str]) -> None:
+    def apply_fxprl_changes(self, config_file_path: Union[Path, str], *, deadline: Optional[float] = None) -> None:
         """
         Apply the FXP_RL configuration changes from file.
 
         :param config_file_path: Path to user qos_mirr_rl.cfg file
+        :param deadline: Time budget in seconds of applying and waiting for update, None for no deadline
         :raises CliClientException: on failure
         """
-        self._apply_config_changes("FXP_RL", "command succeeded", config_file_path)
+        self._apply_config_changes("FXP_RL", "command succeeded", config_file_path, deadline)
 
-    def apply_vmrl_changes(self, config_file_path: Union[Path, str]) -> None:
+    def apply_vmrl_changes(self, config_file_path: Union[Path, str], *, deadline: Optional[float] = None) -> None:
         """
         Apply the VMRL (VM Rate Limiter) configuration changes from file.
 
         :param config_file_path: Path to user qos_vmrl.cfg file
+        :param deadline: Time budget in seconds of applying and waiting for update, None for no deadline
         :raises CliClientException: on failure
         """
-        self._apply_config_changes("VMRL", "command succeeded", config_file_path)
+        self._apply_config_changes("VMRL", "command succeeded", config_file_path, deadline)
 
-    def apply_grl_changes(self, config_file_path: Union[Path, str]) -> None:
+    def apply_grl_changes(self, config_file_path: Union[Path, str], *, deadline: Optional[float] = None) -> None:
         """
         Apply the GRL (Global Rate Limiter) configuration changes from file.
 
         :param config_file_path: Path to user qos_global_rl.cfg file
+        :param deadline: Time budget in seconds of applying and waiting for update, None for no deadline
         :raises CliClientException: on failure
         """
-        self._apply_config_changes("GRL", "command succeeded", config_file_path)
+        self._apply_config_changes("GRL", "command succeeded", config_file_path, deadline)
 
-    def configure_up_up_translation(self, vsi_id: int = 0, different_value: bool = False) -> None:
+    def configure_up_up_translation(
+        self, vsi_id: int = 0, different_value: bool = False, *, deadline: Optional[float] = None
+    ) -> None:
         """
         Configure UP-UP translation from the CLI tool such that each NUP value maps to same VUP value.
 
         :param vsi_id: vsi id of interface where mapping will be applied
         :param different_value: each NUP value maps to a different VUP value
+        :param deadline: Time budget in seconds of all translation commands, None for no deadline
         :raises CliClientException: on failure
+        :raises CliClientDeadlineExceeded: when deadline passed, with commands executed so far
         """
         command_list = []
         for direction in [0, 1]:  # 0 - rx, 1 - tx
@@ -499,12 +1185,17 @@ class CliClient(ToolTemplate):
                 for value in list_of_traffic_classes:
                     cmd = f"-b qos -m -v {vsi_id} --dir {direction} --nup {value} --vup {value}"
                     command_list.append(cmd)
-        for command in command_list:
-            output = self.execute_cli_client_command(command=command)
-            if "command succeeded" in output.lower():
-                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Configure UP-UP translation ({command}) passed.")
-            else:
-                raise CliClientException(f"Configure UP-UP translation ({command}) failed.")
+        with (
+            log.BulkLog(logger, "Configure UP-UP translation") as bulk,
+            deadline_scope("configure_up_up_translation", deadline, command_list) as budget,
+        ):
+            for command in command_list:
+                with budget.step(command):
+                    output = self.execute_cli_client_command(command=command)
+                if "command succeeded" in output.lower():
+                    bulk.step("Configure UP-UP translation (%s) passed.", command)
+                else:
+                    raise CliClientException(f"Configure UP-UP translation ({command}) failed.")
 
     def send_link_change_event_all_pf(self, link_status: str, link_speed: str = "200000Mbps") -> None:
         """
@@ -514,16 +1205,10 @@ class CliClient(ToolTemplate):
         :param link_speed: Link speed (one of 100MB,1GB,10GB,40GB,20GB,25GB,2_5GB,5GB,xxxMbps(xxx from 1 to 200000))
         :raises CliClientException: on failure
         """
-        try:
-            cmd = (
-                "--event link_change "
-                f"--link_status {LinkStatus[link_status.upper()]} --link_speed {link_speed} --all_pf"
-            )
-        except KeyError as illegal_link:
-            raise CliClientException("Link status must be 'up' or 'down'") from illegal_link
+        cmd = link_change_command(link_status, link_speed)
         output = self.execute_cli_client_command(command=cmd)
         if "command succeeded" in output.lower():
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Link change ({cmd}) passed.")
+            log.debug(logger, "Link change (%s) passed.", cmd)
         else:
             raise CliClientException(f"Link change ({cmd}) failed.")
 
@@ -543,15 +1228,10 @@ class CliClient(ToolTemplate):
         :param vport_id: vport id on which link changes will be applied. (optional)
         :raises CliClientException: on failure
         """
-        try:
-            cmd = f"--event link_change --link_status {LinkStatus[link_status.upper()]} --link_speed {link_speed} "
-        except KeyError as illegal_link:
-            raise CliClientException("Link status must be 'up' or 'down'") from illegal_link
-        cmd += f"--pf_num {hex(pf_num)} "
-        cmd += f"--vport_id {hex(vport_id)}" if vport_id else ""
+        cmd = link_change_command(link_status, link_speed, pf_num, vport_id)
         output = self.execute_cli_client_command(command=cmd)
         if "command succeeded" in output.lower():
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Link change ({cmd}) passed.")
+            log.debug(logger, "Link change (%s) passed.", cmd)
         else:
             raise CliClientException(f"Link change ({cmd}) failed.")
 
@@ -562,14 +1242,10 @@ class CliClient(ToolTemplate):
         :param profile_id: Mirror profile id (must be >= 16)
         :param vsi_id: VSI id where packets will be mirrored
         """
-        if profile_id < 16:
-            raise CliClientException(f"Mirror profile id {profile_id} must be >=16. Profiles < 16 are reserved.")
-
-        cmd = f"--modify --config --mir_prof {profile_id} --vsi {vsi_id} --func_valid"
+        cmd = mirror_profile_command(profile_id, vsi_id)
         output = self.execute_cli_client_command(command=cmd)
-        output_lower = output.lower()
-        if any(marker in output_lower for marker in self._MIRROR_PROFILE_SUCCESS_MARKERS):
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Mirror profile ({cmd}) passed.")
+        if mirror_profile_succeeded(output):
+            log.debug(logger, "Mirror profile (%s) passed.", cmd)
         else:
             raise CliClientException(f"Mirror profile ({cmd}) failed.")
 
@@ -580,14 +1256,10 @@ class CliClient(ToolTemplate):
         :param profile_id: Mirror profile id (must be >= 16)
         :param vsi_id: VSI id currently configured on the mirror profile
         """
-        if profile_id < 16:
-            raise CliClientException(f"Mirror profile id {profile_id} must be >=16. Profiles < 16 are reserved.")
-
-        cmd = f"--modify --config --mir_prof {profile_id} --vsi {vsi_id}"
+        cmd = mirror_profile_command(profile_id, vsi_id, enable=False)
         output = self.execute_cli_client_command(command=cmd)
-        output_lower = output.lower()
-        if any(marker in output_lower for marker in self._MIRROR_PROFILE_SUCCESS_MARKERS):
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Mirror profile delete ({cmd}) passed.")
+        if mirror_profile_succeeded(output):
+            log.debug(logger, "Mirror profile delete (%s) passed.", cmd)
         else:
             raise CliClientException(f"Mirror profile delete ({cmd}) failed.")
 
@@ -608,14 +1280,15 @@ class CliClient(ToolTemplate):
 
         output = self.execute_cli_client_command(command=f"-b psm -m -c -H 0 --vmid {vm_id} -l {limit} -u {burst}")
         if "command succeeded" in output.lower():
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Successfully added {limit} rate limit on vmid: {vm_id}.")
+            log.debug(logger, "Successfully added %s rate limit on vmid: %s.", limit, vm_id)
         else:
             raise CliClientException(f"Error adding PSM VM ratelimit on vmid: {vm_id} rate: {limit} burst: {burst}")
 
-    def read_qos_vm_info(self) -> Dict[int, Dict[int, List[int]]]:
+    def read_qos_vm_info(self, max_age: Optional[float] = None) -> Dict[int, Dict[int, List[int]]]:
         """
         Query, parse and return the VF2VM mapping currently applied in the cp.
 
+        :param max_age: Return mapping queried at most max_age seconds ago instead of querying again, if available
         return: A dictionary of keys hosts, if a host has vms the key is a dict
                 of vms which keys are vfs in that vm.
 
@@ -625,29 +1298,21 @@ class CliClient(ToolTemplate):
                 {0: {1: [0, 1], 2: [2, 3], -1: [4]}, 1: {}, 2: {}, 3: {}}
         raises: CliClientException on failure
         """
-        output = self.execute_cli_client_command(command="--query --statistics --vm_qos_info")
-        if "server finished responding" not in output.lower():
-            raise CliClientException("cli_client returned unexpected output when querying vm_qos_info")
-
-        lines = output.split("\n")
-        data = {}
-        host_id = None
-        vm_id = None
-
-        for line in lines:
-            if "HOST ID" in line:
-                host_id = int(line.split()[-1])
-                data[host_id] = {}
-            elif "VM ID" in line:
-                vm_id = int(line.split()[-1])
-                data[host_id][vm_id] = []
-            elif "VF ID" in line:
-                vf_ids = line.split(":")[-1].strip().split(",")
-                vf_ids = [int(vfid) for vfid in vf_ids if vfid]
-                data[host_id][vm_id] = vf_ids
-
-        for key in [0, 1, 2, 3]:
-            if key not in data:
-                raise CliClientException("Error parsing output from vm_qos_info")
-
-        return data
+        mapping = self._get_snapshot("qos_vm_info", max_age, self._query_qos_vm_info)
+        # every caller gets own copy of shared snapshot, down to lists of VFs
+        return {host: {vm: vfs.copy() for vm, vfs in vms.items()} for host, vms in mapping.items()}
+
+    def _query_qos_vm_info(self) -> Dict[int, Dict[int, List[int]]]:
+        """
+        Query VF2VM mapping.
+
+        :return: A dictionary of keys hosts, values are dicts of vms which values are lists of vfs in that vm.
+        :raises CliClientException: on failure
+        """
+        command = "--query --statistics --vm_qos_info"
+        if self._remote_parser is not None:
+            data = self._query_with_remote_parser("qos_vm_info", command, decode_qos_vm_info)
+            if data is not None:
+                return data
+        output = self.execute_cli_client_command(command=command)
+        return parse_qos_vm_info(output)
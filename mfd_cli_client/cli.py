@@ -0,0 +1,372 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Command line entry point for main cli_client queries with JSON output.
+
+Usage:
+    python -m mfd_cli_client --ip 10.10.10.10 switch-stats --switch-id 1
+    python -m mfd_cli_client --ip 10.10.10.10 vsi-stats --vsi-id 5 --watch 1
+    python -m mfd_cli_client --simulate vsi-config --format ndjson
+    python -m mfd_cli_client --replay recording.json qos-vm-info
+    python -m mfd_cli_client --ip 10.10.10.10 top --sort drops --interval 2
+    python -m mfd_cli_client --ip 10.10.10.10 export --port 9464 --interval 10
+"""
+
+import argparse
+import json
+import sys
+import time
+import typing
+from collections.abc import Sequence
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from threading import Event
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from .exceptions import CliClientException
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+
+    from .base import CliClient
+    from .monitor import MonitorSample
+
+CONNECTION_TYPES = ("rpyc", "ssh", "local")
+# same as monitor.SORT_KEYS, monitor is imported only when it runs
+SORT_KEYS = ("pps", "drops", "errors")
+
+
+def _query_switch_stats(client: "CliClient", args: argparse.Namespace) -> Any:
+    return client.get_switch_stats(switch_id=args.switch_id)
+
+
+def _query_vsi_stats(client: "CliClient", args: argparse.Namespace) -> Any:
+    return client.get_vsi_statistics(vsi_id=args.vsi_id)
+
+
+def _query_vsi_config(client: "CliClient", args: argparse.Namespace) -> Any:
+    return client.get_vsi_config_list()
+
+
+def _query_qos_vm_info(client: "CliClient", args: argparse.Namespace) -> Any:
+    return client.read_qos_vm_info()
+
+
+# name: (query, whether result holds counters, help)
+QUERIES: Dict[str, typing.Tuple[Callable[["CliClient", argparse.Namespace], Any], bool, str]] = {
+    "switch-stats": (_query_switch_stats, True, "switch statistics"),
+    "vsi-stats": (_query_vsi_stats, True, "VSI statistics"),
+    "vsi-config": (_query_vsi_config, False, "VSI config table"),
+    "qos-vm-info": (_query_qos_vm_info, False, "VF to VM mapping of QoS"),
+}
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert query result to JSON-serializable value.
+
+    :param value: Structure, table of structures, dict or list returned by CliClient
+    :return: Dicts, lists and scalars, MAC addresses as strings
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return to_jsonable(asdict(value))
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return [to_jsonable(item) for item in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def counter_rates(previous: Any, current: Any, elapsed: float) -> Any:
+    """
+    Compute per-second rates of counters between two samples.
+
+    :param previous: Previous sample converted by to_jsonable()
+    :param current: Current sample converted by to_jsonable()
+    :param elapsed: Time between samples in seconds
+    :return: Sample of the same shape with rates, None where rate is not known (missing counter, counter reset)
+    """
+    if isinstance(current, dict):
+        previous = previous if isinstance(previous, dict) else {}
+        return {key: counter_rates(previous.get(key), item, elapsed) for key, item in current.items()}
+    if isinstance(current, list):
+        previous = previous if isinstance(previous, list) else []
+        return [
+            counter_rates(previous[index] if index < len(previous) else None, item, elapsed)
+            for index, item in enumerate(current)
+        ]
+    # counters are ints, floats (e.g. timestamps) have no rate
+    if isinstance(current, bool) or not isinstance(current, int) or not isinstance(previous, int):
+        return None
+    delta = current - previous
+    return delta / elapsed if delta >= 0 and elapsed > 0 else None
+
+
+def _emit(record: Any, output_format: str, stream: TextIO) -> None:
+    """
+    Write record to stream.
+
+    :param record: JSON-serializable record
+    :param output_format: 'json' for indented document, 'ndjson' for single line
+    :param stream: Output stream
+    """
+    if output_format == "ndjson":
+        stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+    else:
+        stream.write(json.dumps(record, indent=2) + "\n")
+    stream.flush()
+
+
+def watch(
+    fetch: Callable[[], Any],
+    interval: float,
+    *,
+    counters: bool,
+    count: Optional[int] = None,
+    emit: Callable[[Any], None],
+    clock: Callable[[], float] = time.monotonic,
+    sleeper: Callable[[float], None] = time.sleep,
+) -> None:
+    """
+    Query periodically and emit rates of counters or changed tables.
+
+    Queries are scheduled every interval seconds from start, a query which overruns its slot delays only itself.
+
+    :param fetch: Query returning JSON-serializable sample
+    :param interval: Interval between queries in seconds
+    :param counters: Emit rates between consecutive samples, otherwise emit sample whenever it changed
+    :param count: Number of intervals to watch, forever if None
+    :param emit: Callable writing record
+    :param clock: Clock used for scheduling and rates
+    :param sleeper: Function used for sleeping
+    """
+    previous = fetch()
+    previous_at = next_at = clock()
+    if not counters:
+        emit({"timestamp": time.time(), "data": previous})
+    intervals = 0
+    while count is None or intervals < count:
+        next_at = max(next_at + interval, clock())
+        sleeper(max(0.0, next_at - clock()))
+        current = fetch()
+        current_at = clock()
+        intervals += 1
+        if counters:
+            elapsed = current_at - previous_at
+            emit({"timestamp": time.time(), "interval": elapsed, "rates": counter_rates(previous, current, elapsed)})
+        elif current != previous:
+            emit({"timestamp": time.time(), "data": current})
+        previous, previous_at = current, current_at
+
+
+def _create_connection(args: argparse.Namespace) -> "Connection":
+    """
+    Create connection selected by arguments.
+
+    :param args: Parsed arguments
+    :return: Connection, simulated or replaying recording if requested
+    """
+    if args.simulate or args.replay:
+        from .simulation import FakeConnection, RecordedResponder, SimulatedResponder, load_recording
+
+        if args.replay:
+            return FakeConnection(RecordedResponder(load_recording(args.replay)))
+        return FakeConnection(SimulatedResponder(args.vsi_count, args.host_count))
+
+    import mfd_connect
+
+    if args.connection == "local":
+        return mfd_connect.LocalConnection()
+    if args.ip is None:
+        raise CliClientException(f"--ip is required for {args.connection} connection.")
+    if args.connection == "ssh":
+        return mfd_connect.SSHConnection(ip=args.ip, username=args.username, password=args.password)
+    return mfd_connect.RPyCConnection(ip=args.ip)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build parser of command line arguments.
+
+    :return: Argument parser
+    """
+    parser = argparse.ArgumentParser(prog="mfd-cli-client", description=__doc__.strip().splitlines()[0])
+    transport = parser.add_argument_group("transport")
+    transport.add_argument("--connection", choices=CONNECTION_TYPES, default="rpyc", help="type of connection to CP")
+    transport.add_argument("--ip", help="management IP address of CP")
+    transport.add_argument("--username", default="root", help="user of SSH connection")
+    transport.add_argument("--password", help="password of SSH connection")
+    transport.add_argument("--binary-dir", help="directory of cli_client on CP, $PATH is used by default")
+    source = transport.add_mutually_exclusive_group()
+    source.add_argument("--simulate", action="store_true", help="answer queries with synthetic outputs")
+    source.add_argument("--replay", type=Path, metavar="FILE", help="answer queries with recorded outputs")
+    transport.add_argument("--record", type=Path, metavar="FILE", help="record outputs of cli_client for --replay")
+    transport.add_argument(
+        "--archive", type=Path, metavar="FILE", help="append raw outputs of cli_client to compressed archive"
+    )
+    transport.add_argument(
+        "--persistent-runner",
+        action="store_true",
+        help="execute cli_client through one long-lived shell on CP instead of remote shell per command",
+    )
+    transport.add_argument("--vsi-count", type=int, default=16, help="rows of simulated VSI config table")
+    transport.add_argument("--host-count", type=int, default=4, help="hosts of simulated CP")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument(
+        "--format", choices=("json", "ndjson"), help="output format, json by default, ndjson in watch mode"
+    )
+    output.add_argument(
+        "--watch",
+        type=float,
+        metavar="INTERVAL",
+        help="query every INTERVAL seconds, print rates of counters or changed tables",
+    )
+    output.add_argument("--count", type=int, help="stop watching after COUNT intervals")
+
+    commands = parser.add_subparsers(dest="query", required=True, metavar="QUERY")
+    for name, (_, _, description) in QUERIES.items():
+        command = commands.add_parser(name, parents=[output], help=f"query {description}")
+        if name == "switch-stats":
+            command.add_argument("--switch-id", type=int, default=1, help="switch ID")
+        elif name == "vsi-stats":
+            command.add_argument("--vsi-id", type=int, default=1, help="VSI ID")
+
+    top = commands.add_parser("top", help="live VSI traffic monitor")
+    top.add_argument("--interval", type=float, default=1.0, help="refresh interval in seconds")
+    top.add_argument("--sort", choices=SORT_KEYS, default="pps", help="rank VSIs by packets, drops or errors")
+    top.add_argument("--limit", type=int, default=20, help="number of VSIs shown")
+    top.add_argument("--vsi-id", type=int, action="append", help="monitor only this VSI, can be repeated")
+    top.add_argument("--format", choices=("table", "ndjson"), default="table", help="output format")
+    top.add_argument("--count", type=int, help="stop after COUNT refreshes")
+
+    export = commands.add_parser("export", help="serve counters in OpenMetrics text format over HTTP")
+    export.add_argument("--bind", default="127.0.0.1", help="address to listen on")
+    export.add_argument("--port", type=int, default=9464, help="port to listen on")
+    export.add_argument("--interval", type=float, default=10.0, help="sampling interval in seconds")
+    export.add_argument("--switch-id", type=int, action="append", help="sampled switch ID, can be repeated")
+    export.add_argument("--duration", type=float, help="stop after DURATION seconds, serve forever by default")
+    return parser
+
+
+def _run_query(client: "CliClient", args: argparse.Namespace, stream: TextIO) -> None:
+    """
+    Run query once or in watch mode.
+
+    :param client: CliClient
+    :param args: Parsed arguments
+    :param stream: Output stream
+    """
+    query, counters, _ = QUERIES[args.query]
+    output_format = args.format or ("json" if args.watch is None else "ndjson")
+
+    def fetch() -> Any:
+        return to_jsonable(query(client, args))
+
+    if args.watch is None:
+        _emit(fetch(), output_format, stream)
+    else:
+        watch(
+            fetch,
+            args.watch,
+            counters=counters,
+            count=args.count,
+            emit=lambda record: _emit(record, output_format, stream),
+        )
+
+
+def _run_top(client: "CliClient", args: argparse.Namespace, stream: TextIO) -> None:
+    """
+    Run live VSI traffic monitor.
+
+    :param client: CliClient
+    :param args: Parsed arguments
+    :param stream: Output stream, screen is redrawn when it is terminal
+    """
+    from .monitor import VsiTrafficMonitor, format_top
+
+    redraw = "\x1b[H\x1b[2J" if stream.isatty() else ""
+
+    def show(sample: "MonitorSample") -> None:
+        if args.format == "ndjson":
+            record = to_jsonable(sample)
+            record["traffic"] = to_jsonable(sample.top(args.limit, args.sort))
+            _emit({"timestamp": time.time(), **record}, "ndjson", stream)
+        else:
+            stream.write(f"{redraw}{format_top(sample, limit=args.limit, sort_by=args.sort)}\n\n")
+            stream.flush()
+
+    VsiTrafficMonitor(client, vsi_ids=args.vsi_id).run(args.interval, show, count=args.count)
+
+
+def _run_export(client: "CliClient", args: argparse.Namespace, stream: TextIO) -> None:
+    """
+    Run OpenMetrics exporter.
+
+    :param client: CliClient
+    :param args: Parsed arguments
+    :param stream: Output stream
+    """
+    from .exporter import BackgroundSampler, MetricsExporter
+
+    name = args.ip or "cp"
+    sampler = BackgroundSampler({name: client}, interval=args.interval, switch_ids=args.switch_id or (1,))
+    with sampler, MetricsExporter(sampler, host=args.bind, port=args.port) as exporter:
+        stream.write(f"Serving metrics of {name} on http://{args.bind}:{exporter.port}{exporter.path}\n")
+        stream.flush()
+        Event().wait(args.duration)
+
+
+def main(argv: Optional[List[str]] = None, stream: Optional[TextIO] = None) -> int:
+    """
+    Run query from command line.
+
+    :param argv: Command line arguments
+    :param stream: Output stream, standard output by default
+    :return: Exit code, 1 on cli_client failure
+    """
+    args = build_parser().parse_args(argv)
+    stream = stream or sys.stdout
+
+    from .base import CliClient
+
+    recorder = output_archive = client = None
+    try:
+        connection = _create_connection(args)
+        if args.record:
+            from .simulation import RecordingConnection
+
+            connection = recorder = RecordingConnection(connection)
+        if args.archive:
+            from .archive import OutputArchive
+
+            output_archive = OutputArchive(args.archive)
+        client = CliClient(
+            connection=connection,
+            absolute_path_to_binary_dir=args.binary_dir,
+            archive=output_archive,
+            persistent_runner=args.persistent_runner,
+        )
+        if args.query == "top":
+            _run_top(client, args, stream)
+        elif args.query == "export":
+            _run_export(client, args, stream)
+        else:
+            _run_query(client, args, stream)
+    except CliClientException as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if client is not None:
+            client.stop_runner()
+        if output_archive is not None:
+            output_archive.close()
+        if recorder is not None:
+            from .simulation import save_recording
+
+            save_recording(recorder.recording, args.record)
+    return 0
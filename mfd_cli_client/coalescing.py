@@ -0,0 +1,68 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for coalescing of identical concurrent calls."""
+
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """Call in flight, shared by all callers using the same key."""
+
+    def __init__(self) -> None:
+        """Initialize call."""
+        self.done = Event()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Execute function once for all concurrent callers using the same key.
+
+    Caller which comes first (leader) executes function, callers which come while it is in flight wait for it
+    and get the same result or exception. Call is forgotten as soon as it finishes, so results are never cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize SingleFlight."""
+        self._lock = Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Execute function or wait for identical call in flight.
+
+        :param key: Key identifying identical calls
+        :param function: Function to execute
+        :return: Result of function and flag whether it was shared with call in flight
+        :raises Exception: exception raised by function, also in waiting callers
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result, True
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls in flight."""
+        with self._lock:
+            return len(self._calls)
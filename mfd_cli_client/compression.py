@@ -0,0 +1,149 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for compressed transport of large cli_client outputs."""
+
+import base64
+import gzip
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+@dataclass(frozen=True)
+class Codec:
+    """Compression codec: command compressing stdout on the CP and function decompressing it locally."""
+
+    name: str
+    remote_command: str
+    decompress: Callable[[bytes], bytes]
+
+
+CODECS: Dict[str, Codec] = {"gzip": Codec("gzip", "gzip -c", gzip.decompress)}
+if zstandard is not None:
+    CODECS["zstd"] = Codec(
+        "zstd", "zstd -c -q", lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    )
+
+
+class CompressionPolicy:
+    """
+    Decide which outputs are compressed on the CP and decode them locally.
+
+    Compressed output is base64 encoded on the CP, so binary data survives text-only connections.
+    Size and duration of outputs are learned per command type (command flags without values), and compression is
+    turned on automatically for command types which outputs were at least threshold bytes long.
+    """
+
+    def __init__(self, codec: str = "gzip", threshold: Optional[int] = 64 * 1024, smoothing: float = 0.5) -> None:
+        """
+        Initialize compression policy.
+
+        :param codec: Name of codec, one of CODECS keys ('zstd' requires zstandard package)
+        :param threshold: Learned output size in bytes above which output is compressed automatically,
+                          None to compress only on explicit request
+        :param smoothing: Weight of newest observation in learned output size and duration
+        :raises ValueError: if codec is not available
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Codec {codec} is not available, available codecs: {', '.join(CODECS)}")
+        self.codec = CODECS[codec]
+        self.threshold = threshold
+        self.smoothing = smoothing
+        self.enabled = True
+        self._lock = Lock()
+        self._sizes: Dict[str, float] = {}
+        self._plain_durations: Dict[str, float] = {}
+
+    @staticmethod
+    def command_type(command: str) -> str:
+        """
+        Get command type, so e.g. statistics of different VSIs share learned size.
+
+        :param command: Command passed to command line interface client tool.
+        :return: Flags of command without values
+        """
+        return " ".join(flag for flag in command.split() if flag.startswith("-"))
+
+    def _smooth(self, learned: Dict[str, float], key: str, value: float) -> None:
+        """
+        Update exponentially weighted moving average.
+
+        :param learned: Learned values
+        :param key: Command type
+        :param value: New observation
+        """
+        previous = learned.get(key)
+        learned[key] = value if previous is None else previous + self.smoothing * (value - previous)
+
+    def learned_size(self, command: str) -> Optional[float]:
+        """
+        Get learned size of output of command type.
+
+        :param command: Command passed to command line interface client tool.
+        :return: Size in bytes or None if command type was not executed yet
+        """
+        with self._lock:
+            return self._sizes.get(self.command_type(command))
+
+    def should_compress(self, command: str, requested: Optional[bool] = None) -> bool:
+        """
+        Decide whether output of command is compressed.
+
+        :param command: Command passed to command line interface client tool.
+        :param requested: Explicit request of caller, None to decide from learned output size
+        :return: True if output should be compressed
+        """
+        if not self.enabled or requested is False:
+            return False
+        if requested:
+            return True
+        if self.threshold is None:
+            return False
+        size = self.learned_size(command)
+        return size is not None and size >= self.threshold
+
+    @property
+    def remote_pipe(self) -> str:
+        """Shell command on the CP which output is piped through to compress it."""
+        return f"{self.codec.remote_command} | base64"
+
+    def decode(self, payload: str) -> str:
+        """
+        Decode compressed output.
+
+        :param payload: Base64 encoded, compressed output
+        :return: Decompressed output
+        :raises ValueError: when payload is empty or cannot be decoded
+        """
+        compressed = base64.b64decode(payload)
+        if not compressed:
+            raise ValueError("Compressed output is empty")
+        try:
+            return self.codec.decompress(compressed).decode()
+        except Exception as e:
+            raise ValueError(f"Cannot decompress {self.codec.name} output: {e}") from e
+
+    def record(self, command: str, size: int, duration: float, compressed: bool) -> Optional[float]:
+        """
+        Learn size and duration of command output.
+
+        :param command: Command passed to command line interface client tool.
+        :param size: Size of (decompressed) output in bytes
+        :param duration: Duration of execution in seconds
+        :param compressed: Whether output was compressed
+        :return: Time saved by compression compared to learned duration of uncompressed executions,
+                 None if output was not compressed or there was no uncompressed execution yet
+        """
+        key = self.command_type(command)
+        with self._lock:
+            self._smooth(self._sizes, key, size)
+            if not compressed:
+                self._smooth(self._plain_durations, key, duration)
+                return None
+            plain_duration = self._plain_durations.get(key)
+        return None if plain_duration is None else plain_duration - duration
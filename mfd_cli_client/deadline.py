@@ -0,0 +1,172 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for deadlines of composite operations propagated to their sub-commands."""
+
+import logging
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from . import log
+from .exceptions import CliClientDeadlineExceeded, CliClientTimeout
+from .timeouts import is_timeout
+
+logger = logging.getLogger(__name__)
+
+_current_deadline: ContextVar[Optional["Deadline"]] = ContextVar("cli_client_deadline", default=None)
+
+
+def current_deadline() -> Optional["Deadline"]:
+    """
+    Get deadline of composite operation running in current context.
+
+    :return: Innermost deadline, None outside of operation with deadline
+    """
+    return _current_deadline.get()
+
+
+class Deadline:
+    """
+    Time budget of composite operation and progress of its steps.
+
+    Every sub-command executed while deadline is current gets timeout bounded by time left, so the budget is split
+    across sub-commands in order they run and operation never waits longer than its deadline.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        steps: Sequence[str],
+        *,
+        expires_at: float = math.inf,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """
+        Initialize deadline.
+
+        :param operation: Name of composite operation
+        :param steps: Descriptions of steps of operation, in order
+        :param expires_at: Monotonic time of deadline, infinity without deadline
+        :param clock: Monotonic clock in seconds
+        """
+        self.operation = operation
+        self.steps = list(steps)
+        self.completed: List[str] = []
+        self.expires_at = expires_at
+        self._clock = clock
+        self.started = clock()
+
+    def remaining(self) -> float:
+        """Seconds left until deadline."""
+        return self.expires_at - self._clock()
+
+    def exceeded(self) -> CliClientDeadlineExceeded:
+        """
+        Create exception reporting progress of operation.
+
+        :return: Exception to raise
+        """
+        pending = self.steps[len(self.completed) :]
+        elapsed = self._clock() - self.started
+        return CliClientDeadlineExceeded(
+            f"{self.operation} exceeded its deadline after {elapsed:.1f}s, completed {len(self.completed)} "
+            f"of {len(self.steps)} steps" + (f", stopped at: {pending[0]}" if pending else ""),
+            operation=self.operation,
+            completed=list(self.completed),
+            pending=pending,
+            elapsed=elapsed,
+        )
+
+    def timeout(self, ceiling: int) -> int:
+        """
+        Get timeout of sub-command.
+
+        :param ceiling: Timeout requested for sub-command
+        :return: Timeout in seconds, at most time left
+        :raises CliClientDeadlineExceeded: when deadline passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.exceeded()
+        if remaining >= ceiling:
+            return ceiling
+        return max(1, math.ceil(remaining))
+
+    def clamp(self, seconds: float) -> float:
+        """
+        Clamp wait to time left.
+
+        :param seconds: Requested wait in seconds
+        :return: Wait in seconds, at most time left
+        """
+        return max(0.0, min(seconds, self.remaining()))
+
+    def check(self) -> None:
+        """
+        Check that deadline did not pass.
+
+        :raises CliClientDeadlineExceeded: when deadline passed
+        """
+        if self.remaining() <= 0:
+            raise self.exceeded()
+
+    @contextmanager
+    def step(self, description: str) -> Iterator[None]:
+        """
+        Run next step of operation, recording it as completed when it succeeds.
+
+        :param description: Description of step, as passed in steps
+        :raises CliClientDeadlineExceeded: when deadline passed before or during step
+        """
+        self.check()
+        try:
+            yield
+        except CliClientDeadlineExceeded as e:
+            if e.operation == self.operation:
+                raise
+            raise self.exceeded() from e
+        except Exception as e:
+            # waits (CliClientTimeout) and executions cut short by deadline
+            if (isinstance(e, CliClientTimeout) or is_timeout(e)) and self.remaining() <= 0:
+                raise self.exceeded() from e
+            raise
+        self.completed.append(description)
+
+
+@contextmanager
+def deadline_scope(
+    operation: str,
+    seconds: Optional[float],
+    steps: Sequence[str],
+    *,
+    clock: Callable[[], float] = monotonic,
+) -> Iterator[Deadline]:
+    """
+    Run composite operation under deadline, which becomes current for its sub-commands.
+
+    Deadline never ends later than deadline of operation this one is nested in, operation without own deadline
+    inherits it.
+
+    :param operation: Name of composite operation
+    :param seconds: Time budget of operation, None for no own deadline
+    :param steps: Descriptions of steps of operation, in order
+    :param clock: Monotonic clock in seconds
+    :return: Deadline of operation
+    """
+    outer = _current_deadline.get()
+    expires_at = math.inf if seconds is None else clock() + seconds
+    if outer is not None:
+        expires_at = min(expires_at, outer.expires_at)
+    deadline = Deadline(operation, steps, expires_at=expires_at, clock=clock)
+    if math.isinf(expires_at):
+        yield deadline
+        return
+
+    log.debug(logger, "%s has %.1fs for %d steps.", operation, deadline.remaining(), len(deadline.steps))
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
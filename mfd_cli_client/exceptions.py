@@ -2,12 +2,71 @@
 # SPDX-License-Identifier: MIT
 """Exceptions for command line interface client module."""
 
-from mfd_base_tool.exceptions import ToolNotAvailable
+from threading import Lock
+from typing import List
+
+_lazy_lock = Lock()
 
 
 class CliClientException(Exception):
     """Exception for command line interface client module."""
 
 
-class CliClientNotAvailable(ToolNotAvailable, CliClientException):
-    """Handle tool not available exception."""
+class CliClientTimeout(CliClientException):
+    """Handle condition not met in time."""
+
+
+class CliClientDeadlineExceeded(CliClientTimeout):
+    """Handle composite operation stopped early because its deadline passed, with its partial progress."""
+
+    def __init__(
+        self, message: str, *, operation: str, completed: List[str], pending: List[str], elapsed: float
+    ) -> None:
+        """
+        Initialize exception.
+
+        :param message: Message of exception
+        :param operation: Name of composite operation
+        :param completed: Steps of operation which were completed
+        :param pending: Steps of operation which were not completed, first of them was interrupted
+        :param elapsed: Seconds since operation started
+        """
+        super().__init__(message)
+        self.operation = operation
+        self.completed = completed
+        self.pending = pending
+        self.elapsed = elapsed
+
+
+class CliClientRunnerUnavailable(CliClientException):
+    """Handle request which persistent runner did not execute, so it can be executed another way."""
+
+
+class CliClientCircuitOpen(CliClientException):
+    """Handle execution rejected without sending it to CP after repeated timeouts."""
+
+
+class CliClientRemoteParserError(CliClientException):
+    """Handle output of remote parser which cannot be decoded, so output has to be parsed locally."""
+
+
+def __getattr__(name: str) -> type:
+    """
+    Create exceptions based on mfd_base_tool on first use, so that importing this module stays cheap.
+
+    :param name: Name of attribute
+    :return: Exception class
+    :raises AttributeError: on unknown attribute
+    """
+    if name != "CliClientNotAvailable":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _lazy_lock:
+        if name not in globals():
+            from mfd_base_tool.exceptions import ToolNotAvailable
+
+            class CliClientNotAvailable(ToolNotAvailable, CliClientException):
+                """Handle tool not available exception."""
+
+            CliClientNotAvailable.__qualname__ = name
+            globals()[name] = CliClientNotAvailable
+    return globals()[name]
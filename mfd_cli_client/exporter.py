@@ -0,0 +1,433 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for exporting switch, VSI and QoS topology counters in OpenMetrics text format."""
+
+import logging
+import typing
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Lock, Thread
+from time import monotonic, time
+from types import TracebackType
+from typing import Callable, Collection, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+from . import log
+
+if typing.TYPE_CHECKING:
+    from .base import CliClient
+    from .structures import SwitchStats, VSIStats
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+METRIC_PREFIX = "cli_client"
+
+Labels = Tuple[Tuple[str, object], ...]
+
+
+@dataclass(frozen=True)
+class CpSample:
+    """Structure for counters of one CP collected in one sampling round."""
+
+    timestamp: float
+    duration: float
+    switch_stats: Dict[int, "SwitchStats"] = field(default_factory=dict)
+    vsi_stats: Dict[int, "VSIStats"] = field(default_factory=dict)
+    vsis: Dict[int, Tuple[int, int, bool]] = field(default_factory=dict)
+    qos_vm_info: Dict[int, Dict[int, List[int]]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CpState:
+    """Structure for sampling state of one CP: last successful sample, result of last round and failed rounds."""
+
+    sample: Optional[CpSample] = None
+    up: bool = False
+    errors: int = 0
+    last_error: Optional[str] = None
+
+
+class BackgroundSampler:
+    """
+    Sample counters of CPs in background threads, one per CP.
+
+    Every round reads switch stats of switch_ids, statistics of all created VSIs (in one remote invocation,
+    new VSIs are warmed up once) and QoS VM info. Consumers (e.g. MetricsExporter) read the latest state
+    and never query CP themselves, so CP load does not depend on the number of consumers or scrapes.
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[str, "CliClient"],
+        *,
+        interval: float = 10.0,
+        switch_ids: Sequence[int] = (1,),
+        vsi_ids: Optional[Collection[int]] = None,
+        table_max_age: float = 60.0,
+        listeners: Sequence[Callable[[str, CpSample], None]] = (),
+    ) -> None:
+        """
+        Initialize sampler.
+
+        :param clients: CliClient of every CP by name used as 'cp' label
+        :param interval: Interval between sampling rounds in seconds
+        :param switch_ids: Switch IDs to sample
+        :param vsi_ids: Sample only these VSIs, all created VSIs by default
+        :param table_max_age: Maximum age of VSI config table in seconds
+        :param listeners: Callables called with name of CP and every successful sample in sampling thread,
+                          e.g. AnomalyDetector.on_cp_sample
+        :raises ValueError: on interval which is not positive
+        """
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive, got {interval}")
+        self.clients = dict(clients)
+        self.interval = interval
+        self.switch_ids = tuple(switch_ids)
+        self.vsi_ids = None if vsi_ids is None else frozenset(vsi_ids)
+        self.table_max_age = table_max_age
+        self.listeners = list(listeners)
+        self.generation = 0
+        self._states = {name: CpState() for name in self.clients}
+        self._lock = Lock()
+        self._stop = Event()
+        self._threads: List[Thread] = []
+
+    @property
+    def states(self) -> Dict[str, CpState]:
+        """Latest state of every CP."""
+        with self._lock:
+            return dict(self._states)
+
+    def _collect(self, client: "CliClient", previous: Optional[CpSample]) -> CpSample:
+        """
+        Collect counters of one CP.
+
+        :param client: CliClient of CP
+        :param previous: Previous sample of CP, its VSIs are not warmed up again
+        :return: Sample
+        """
+        started = monotonic()
+        vsis = client.get_vsi_config_list(max_age=self.table_max_age).created_vsis(self.vsi_ids)
+        warm_up = [vsi_id for vsi_id in vsis if previous is None or vsi_id not in previous.vsi_stats]
+        vsi_stats = client.get_vsi_statistics_bulk(vsis, warm_up=warm_up) if vsis else {}
+        switch_warm_up = [
+            switch_id for switch_id in self.switch_ids if previous is None or switch_id not in previous.switch_stats
+        ]
+        switch_stats = client.get_switch_stats_bulk(self.switch_ids, warm_up=switch_warm_up) if self.switch_ids else {}
+        qos_vm_info = client.read_qos_vm_info()
+        return CpSample(time(), monotonic() - started, switch_stats, vsi_stats, vsis, qos_vm_info)
+
+    def sample(self, name: str) -> CpState:
+        """
+        Run one sampling round of CP.
+
+        :param name: Name of CP
+        :return: New state of CP
+        """
+        previous = self._states[name]
+        try:
+            sample = self._collect(self.clients[name], previous.sample)
+        except Exception as e:  # sampler thread must survive any failure of CP or connection
+            log.debug(logger, "Sampling of %s failed: %s", name, e)
+            state = replace(previous, up=False, errors=previous.errors + 1, last_error=str(e))
+        else:
+            log.debug(logger, "Sampled %s in %.3fs.", name, sample.duration)
+            state = replace(previous, sample=sample, up=True)
+        with self._lock:
+            self._states[name] = state
+            self.generation += 1
+        if state.up:
+            for listener in self.listeners:
+                try:
+                    listener(name, state.sample)
+                except Exception as e:
+                    log.debug(logger, "Listener of %s samples failed: %s", name, e)
+        return state
+
+    def refresh(self) -> Dict[str, CpState]:
+        """
+        Run one sampling round of every CP in calling thread.
+
+        :return: New state of every CP
+        """
+        for name in self.clients:
+            self.sample(name)
+        return self.states
+
+    def _run(self, name: str) -> None:
+        """
+        Sample CP at fixed interval until stopped, skipping slots missed by slow rounds.
+
+        :param name: Name of CP
+        """
+        next_at = monotonic()
+        while not self._stop.is_set():
+            self.sample(name)
+            now = monotonic()
+            next_at += self.interval
+            if next_at < now:
+                next_at += ((now - next_at) // self.interval + 1) * self.interval
+            self._stop.wait(next_at - now)
+
+    def start(self) -> None:
+        """Start sampling threads."""
+        if self._threads:
+            return
+        self._stop.clear()
+        self._threads = [
+            Thread(target=self._run, args=(name,), name=f"cli_client-sampler-{name}", daemon=True)
+            for name in self.clients
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling threads, waiting for rounds in progress."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> "BackgroundSampler":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+
+class _Families:
+    """Metric families of OpenMetrics exposition, samples of each family are kept together."""
+
+    def __init__(self) -> None:
+        """Initialize empty exposition."""
+        self._families: Dict[str, Tuple[str, str, List[Tuple[str, Labels, object]]]] = {}
+
+    def add(self, name: str, metric_type: str, help_text: str, labels: Labels, value: object) -> None:
+        """
+        Add sample, counters missing in output (None) are skipped.
+
+        :param name: Name of family, without prefix
+        :param metric_type: 'counter', 'gauge' or 'info'
+        :param help_text: Description of family
+        :param labels: Label names and values
+        :param value: Value of sample
+        """
+        if value is None:
+            return
+        suffix = {"counter": "_total", "info": "_info"}.get(metric_type, "")
+        family = self._families.setdefault(f"{METRIC_PREFIX}_{name}", (metric_type, help_text, []))
+        family[2].append((suffix, labels, value))
+
+    def render(self) -> str:
+        """
+        Render exposition.
+
+        :return: OpenMetrics text, terminated with EOF
+        """
+        lines = []
+        for name, (metric_type, help_text, samples) in self._families.items():
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"# HELP {name} {help_text}")
+            for suffix, labels, value in samples:
+                rendered = ",".join(f'{label}="{_escape(str(label_value))}"' for label, label_value in labels)
+                lines.append(f"{name}{suffix}{{{rendered}}} {value}")
+        lines.append("# EOF\n")
+        return "\n".join(lines)
+
+
+def _escape(value: str) -> str:
+    """
+    Escape label value.
+
+    :param value: Label value
+    :return: Value with backslash, quote and newline escaped
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _add_sample(families: _Families, cp: str, sample: CpSample) -> None:
+    """
+    Add counters of CP sample.
+
+    :param families: Exposition
+    :param cp: Name of CP
+    :param sample: Sample of CP
+    """
+    for switch_id, stats in sample.switch_stats.items():
+        switch = (("cp", cp), ("switch", switch_id))
+        for direction in ("ingress", "egress"):
+            flow = getattr(stats, direction)
+            labels = (*switch, ("direction", direction))
+            families.add("switch_packets", "counter", "Packets of switch.", labels, flow.packet)
+            families.add("switch_discards", "counter", "Discarded packets of switch.", labels, flow.discards)
+            for traffic_class, value in enumerate(flow.traffic_class_counters):
+                families.add(
+                    "switch_traffic_class_packets",
+                    "counter",
+                    "Packets of switch per traffic class.",
+                    (*labels, ("traffic_class", traffic_class)),
+                    value,
+                )
+        for cast in ("unicast", "multicast", "broadcast"):
+            families.add(
+                "switch_cast_packets",
+                "counter",
+                "Unicast, multicast and broadcast packets of switch.",
+                (*switch, ("cast", cast)),
+                getattr(stats, f"{cast}_packet"),
+            )
+
+    for vsi_id, (host_id, fn_id, is_vf) in sample.vsis.items():
+        labels = (("cp", cp), ("vsi", vsi_id), ("host", host_id), ("fn", fn_id), ("vf", str(is_vf).lower()))
+        families.add("vsi", "info", "Created VSIs.", labels, 1)
+    for vsi_id, stats in sample.vsi_stats.items():
+        for direction in ("ingress", "egress"):
+            flow = getattr(stats, direction)
+            labels = (("cp", cp), ("vsi", vsi_id), ("direction", direction))
+            for cast in ("all", "unicast", "multicast", "broadcast"):
+                value = flow.packet if cast == "all" else getattr(flow, f"{cast}_packet")
+                families.add("vsi_packets", "counter", "Packets of VSI.", (*labels, ("cast", cast)), value)
+            families.add("vsi_discards", "counter", "Discarded packets of VSI.", labels, flow.discards_packet)
+            families.add("vsi_errors", "counter", "Error packets of VSI.", labels, flow.errors_packet)
+            families.add("vsi_unknown_packets", "counter", "Unknown packets of VSI.", labels, flow.unknown_packet)
+
+    for host_id, vms in sample.qos_vm_info.items():
+        host = (("cp", cp), ("host", host_id))
+        families.add("qos_vms", "gauge", "VMs of host in QoS topology.", host, len(vms))
+        for vm_id, vf_ids in vms.items():
+            families.add("qos_vfs", "gauge", "VFs of VM in QoS topology.", (*host, ("vm", vm_id)), len(vf_ids))
+
+
+def render_openmetrics(states: Mapping[str, CpState]) -> str:
+    """
+    Render states of CPs in OpenMetrics text format.
+
+    :param states: State of every CP by name used as 'cp' label
+    :return: OpenMetrics text
+    """
+    families = _Families()
+    for cp, state in states.items():
+        labels = (("cp", cp),)
+        families.add("up", "gauge", "Whether last sampling round of CP succeeded.", labels, int(state.up))
+        families.add("sample_errors", "counter", "Failed sampling rounds of CP.", labels, state.errors)
+        if state.sample is not None:
+            sample = state.sample
+            families.add(
+                "sample_timestamp_seconds", "gauge", "Time of last successful sample.", labels, sample.timestamp
+            )
+            families.add(
+                "sample_duration_seconds", "gauge", "Duration of last successful sample.", labels, sample.duration
+            )
+    for cp, state in states.items():
+        if state.sample is not None:
+            _add_sample(families, cp, state.sample)
+    return families.render()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Handler serving exposition of exporter which owns the server."""
+
+    server: "_MetricsServer"
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Serve metrics."""
+        if self.path.split("?", 1)[0] != self.server.exporter.path:
+            self.send_error(404)
+            return
+        body = self.server.exporter.render()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Log requests at debug level instead of stderr."""
+        log.debug(logger, format, *args)
+
+
+class _MetricsServer(ThreadingHTTPServer):
+    """HTTP server of exporter."""
+
+    daemon_threads = True
+    exporter: "MetricsExporter"
+
+
+class MetricsExporter:
+    """
+    Serve latest state of BackgroundSampler over HTTP in OpenMetrics text format.
+
+    Exposition is rendered once per sampling round and served from cache, so scrapes cost neither CP queries
+    nor rendering.
+    """
+
+    def __init__(
+        self, sampler: BackgroundSampler, *, host: str = "127.0.0.1", port: int = 9464, path: str = "/metrics"
+    ) -> None:
+        """
+        Initialize exporter.
+
+        :param sampler: Sampler providing states of CPs, started and stopped by its owner
+        :param host: Address to listen on, local only by default
+        :param port: Port to listen on, 0 to pick free port
+        :param path: Path of metrics endpoint
+        """
+        self.sampler = sampler
+        self.host = host
+        self.port = port
+        self.path = path
+        self._cache: Tuple[int, bytes] = (-1, b"")
+        self._lock = Lock()
+        self._server: Optional[_MetricsServer] = None
+        self._thread: Optional[Thread] = None
+
+    def render(self) -> bytes:
+        """
+        Get exposition of latest states.
+
+        :return: OpenMetrics text, re-rendered only when sampler completed new round
+        """
+        with self._lock:
+            generation = self.sampler.generation
+            if self._cache[0] != generation:
+                self._cache = (generation, render_openmetrics(self.sampler.states).encode())
+            return self._cache[1]
+
+    def start(self) -> None:
+        """Start HTTP server in background thread, port is updated when 0 was passed."""
+        if self._server is not None:
+            return
+        self._server = _MetricsServer((self.host, self.port), _MetricsHandler)
+        self._server.exporter = self
+        self.port = self._server.server_address[1]
+        self._thread = Thread(target=self._server.serve_forever, name="cli_client-exporter", daemon=True)
+        self._thread.start()
+        log.debug(logger, "Serving metrics on http://%s:%d%s", self.host, self.port, self.path)
+
+    def stop(self) -> None:
+        """Stop HTTP server."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "MetricsExporter":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
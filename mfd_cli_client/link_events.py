@@ -0,0 +1,214 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for scheduled link change events."""
+
+import logging
+import statistics
+import typing
+from dataclasses import dataclass, field
+from itertools import groupby
+from time import perf_counter, sleep
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+
+from . import log
+from .base import link_change_command
+from .exceptions import CliClientException
+
+if typing.TYPE_CHECKING:
+    from .base import CliClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LinkTarget:
+    """Structure for target of link change event: pf and vport, all pfs when pf_num is None."""
+
+    pf_num: Optional[int] = None
+    vport_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class LinkEvent:
+    """Structure for link change event sent at offset (seconds) from start of plan."""
+
+    at: float
+    target: LinkTarget
+    link_status: str
+    link_speed: str = "200000Mbps"
+
+    @property
+    def command(self) -> str:
+        """Command for command line interface client tool."""
+        return link_change_command(self.link_status, self.link_speed, self.target.pf_num, self.target.vport_id)
+
+
+@dataclass(frozen=True)
+class FlapPlan:
+    """
+    Plan of link flaps.
+
+    Each step of sequence (e.g. down, up) is applied to all targets every interval seconds, the whole sequence is
+    repeated repeat times. Speed of step is taken from speeds in round-robin. Events of the same step share timestamp
+    (and are sent in one remote invocation) unless stagger spreads targets by stagger seconds.
+    """
+
+    targets: Sequence[LinkTarget]
+    sequence: Sequence[str] = ("down", "up")
+    speeds: Sequence[str] = ("200000Mbps",)
+    interval: float = 1.0
+    repeat: int = 1
+    stagger: float = 0.0
+
+    def events(self) -> List[LinkEvent]:
+        """
+        Expand plan to events.
+
+        :return: Events sorted by time
+        """
+        events = []
+        for cycle in range(self.repeat):
+            for step, link_status in enumerate(self.sequence):
+                at = (cycle * len(self.sequence) + step) * self.interval
+                link_speed = self.speeds[step % len(self.speeds)]
+                for index, target in enumerate(self.targets):
+                    events.append(LinkEvent(at + index * self.stagger, target, link_status, link_speed))
+        return sorted(events, key=lambda event: event.at)
+
+
+@dataclass(frozen=True)
+class SentLinkEvent:
+    """Structure for sent event: scheduled and actual send time (seconds from start of plan), completion time."""
+
+    event: LinkEvent
+    scheduled: float
+    sent: float
+    completed: float
+    succeeded: bool
+
+    @property
+    def lateness(self) -> float:
+        """Delay of actual send time behind scheduled time in seconds."""
+        return self.sent - self.scheduled
+
+
+@dataclass
+class LinkEventReport:
+    """Report of executed plan."""
+
+    sent: List[SentLinkEvent] = field(default_factory=list)
+    invocations: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether all events succeeded."""
+        return all(sent.succeeded for sent in self.sent)
+
+    @property
+    def achieved_rate(self) -> float:
+        """Events per second between first and last send, 0 if not measurable."""
+        if len(self.sent) < 2:
+            return 0.0
+        duration = self.sent[-1].sent - self.sent[0].sent
+        return (len(self.sent) - 1) / duration if duration > 0 else float("inf")
+
+    @property
+    def mean_lateness(self) -> float:
+        """Mean delay of send times behind schedule in seconds."""
+        return statistics.fmean(sent.lateness for sent in self.sent) if self.sent else 0.0
+
+    @property
+    def max_lateness(self) -> float:
+        """Maximum delay of send time behind schedule in seconds."""
+        return max((sent.lateness for sent in self.sent), default=0.0)
+
+    @property
+    def jitter(self) -> float:
+        """Standard deviation of delays of send times behind schedule in seconds."""
+        return statistics.pstdev(sent.lateness for sent in self.sent) if self.sent else 0.0
+
+
+class LinkEventScheduler:
+    """
+    Send link change events at scheduled times.
+
+    Scheduler sleeps until spin_threshold seconds before send time and busy-waits the rest, which keeps jitter
+    well below sleep() granularity. Events sharing timestamp are sent in one remote invocation.
+    """
+
+    def __init__(
+        self,
+        client: "CliClient",
+        *,
+        spin_threshold: float = 0.002,
+        stop_on_failure: bool = True,
+        clock: Callable[[], float] = perf_counter,
+        sleeper: Callable[[float], None] = sleep,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        :param client: CliClient used to send events
+        :param spin_threshold: Time before send time in seconds which is busy-waited instead of slept
+        :param stop_on_failure: Raise CliClientException on first failed event, otherwise only report it
+        :param clock: Clock used for scheduling
+        :param sleeper: Function used for sleeping
+        """
+        self.client = client
+        self.spin_threshold = spin_threshold
+        self.stop_on_failure = stop_on_failure
+        self._clock = clock
+        self._sleep = sleeper
+
+    def _wait_until(self, deadline: float) -> None:
+        """
+        Wait until clock reaches deadline.
+
+        :param deadline: Time of clock
+        """
+        remaining = deadline - self._clock()
+        if remaining > self.spin_threshold:
+            self._sleep(remaining - self.spin_threshold)
+        while self._clock() < deadline:
+            pass
+
+    def run(self, plan: Union[FlapPlan, Iterable[LinkEvent]]) -> LinkEventReport:
+        """
+        Send events of plan at scheduled times.
+
+        :param plan: Flap plan or events
+        :return: Report with actual send times
+        :raises CliClientException: on failed event when stop_on_failure is set
+        """
+        events = plan.events() if isinstance(plan, FlapPlan) else sorted(plan, key=lambda event: event.at)
+        # commands are built (and validated) up front, so nothing but sending happens at scheduled times
+        batches = [(at, [(event, event.command) for event in group]) for at, group in groupby(events, lambda e: e.at)]
+        report = LinkEventReport()
+        start = self._clock()
+        for at, batch in batches:
+            group, commands = zip(*batch)
+            self._wait_until(start + at)
+            sent = self._clock() - start
+            if len(commands) == 1:
+                outputs = [self.client.execute_cli_client_command(command=commands[0])]
+            else:
+                outputs = self.client.execute_cli_client_batch(list(commands))
+            completed = self._clock() - start
+            report.invocations += 1
+            log.debug(logger, "Sent %d link change event(s) scheduled at %.6fs at %.6fs.", len(commands), at, sent)
+            for event, command, output in zip(group, commands, outputs):
+                succeeded = "command succeeded" in output.lower()
+                report.sent.append(SentLinkEvent(event, at, sent, completed, succeeded))
+                if not succeeded and self.stop_on_failure:
+                    raise CliClientException(f"Link change ({command}) failed.")
+        if logger.isEnabledFor(log.MODULE_DEBUG):
+            log.debug(
+                logger,
+                "Sent %d link change events in %d invocations, rate %.1f/s, mean lateness %.3fms, jitter %.3fms.",
+                len(report.sent),
+                report.invocations,
+                report.achieved_rate,
+                report.mean_lateness * 1000,
+                report.jitter * 1000,
+            )
+        return report
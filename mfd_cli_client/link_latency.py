@@ -0,0 +1,291 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for measuring propagation latency of link change events."""
+
+import csv
+import json
+import logging
+import re
+import statistics
+import typing
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from . import log
+from .link_events import LinkEvent, LinkTarget
+from .structures import LinkStatus
+
+if typing.TYPE_CHECKING:
+    from .base import CliClient
+
+logger = logging.getLogger(__name__)
+
+Observer = Callable[[LinkEvent], bool]
+
+
+class CommandObserver:
+    """
+    Observer checking link state on the CP.
+
+    Command is executed with cli_client and its output is matched with pattern, which has to contain named group
+    'status' (up/down or 1/0) and can contain named group 'speed'. New state is visible when both match the event.
+    """
+
+    def __init__(self, client: "CliClient", command: str, pattern: Union[str, re.Pattern]) -> None:
+        """
+        Initialize observer.
+
+        :param client: CliClient used to execute command
+        :param command: Query showing link state, e.g. '--query --config --pf_num 0x0'
+        :param pattern: Regular expression with named group 'status' and optional named group 'speed'
+        """
+        self.client = client
+        self.command = command
+        self.pattern = re.compile(pattern)
+
+    def __call__(self, event: LinkEvent) -> bool:
+        """
+        Check if state of event is visible.
+
+        :param event: Sent link change event
+        :return: True when status (and speed, if captured) match event
+        """
+        match = self.pattern.search(self.client.execute_cli_client_command(command=self.command))
+        if match is None:
+            return False
+        status = match["status"].upper()
+        expected = LinkStatus[event.link_status.upper()]
+        if status not in (expected.name, str(expected.value)):
+            return False
+        speed = match.groupdict().get("speed")
+        return speed is None or speed.lower() == event.link_speed.lower()
+
+
+@dataclass(frozen=True)
+class LatencySample:
+    """
+    Structure for single trial.
+
+    Times are in seconds from start of measurement: sent - before sending event, acknowledged - when cli_client
+    returned, observed - when observer saw new state (None when it did not in time).
+    """
+
+    link_status: str
+    link_speed: str
+    pf_num: Optional[int]
+    vport_id: Optional[int]
+    sent: float
+    acknowledged: float
+    observed: Optional[float]
+    polls: int
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Time from sending event until new state was observed in seconds."""
+        return None if self.observed is None else self.observed - self.sent
+
+
+def _percentile(values: Sequence[float], percent: float) -> float:
+    """
+    Compute percentile of sorted values with linear interpolation.
+
+    :param values: Sorted values
+    :param percent: Percentile 0-100
+    :return: Percentile
+    """
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+@dataclass
+class LatencyReport:
+    """Report of link event propagation latency trials."""
+
+    samples: List[LatencySample] = field(default_factory=list)
+
+    @property
+    def timeouts(self) -> int:
+        """Number of trials in which new state was not observed in time."""
+        return sum(1 for sample in self.samples if sample.observed is None)
+
+    def distribution(self, link_status: Optional[str] = None) -> Dict[str, float]:
+        """
+        Compute latency distribution.
+
+        :param link_status: Use only trials of this status ('up' or 'down'), all by default
+        :return: count, timeouts, min, mean, stdev, p50, p90, p99 and max of latency in seconds
+        """
+        samples = [s for s in self.samples if link_status is None or s.link_status.lower() == link_status.lower()]
+        latencies = sorted(sample.latency for sample in samples if sample.latency is not None)
+        distribution = {"count": len(latencies), "timeouts": len(samples) - len(latencies)}
+        if latencies:
+            distribution.update(
+                {
+                    "min": latencies[0],
+                    "mean": statistics.fmean(latencies),
+                    "stdev": statistics.pstdev(latencies),
+                    "p50": _percentile(latencies, 50),
+                    "p90": _percentile(latencies, 90),
+                    "p99": _percentile(latencies, 99),
+                    "max": latencies[-1],
+                }
+            )
+        return distribution
+
+    def to_dict(self) -> Dict:
+        """
+        Get report as JSON-serializable dict.
+
+        :return: Distributions (all trials and per status) and samples
+        """
+        statuses = sorted({sample.link_status.lower() for sample in self.samples})
+        return {
+            "distribution": self.distribution(),
+            "by_status": {status: self.distribution(status) for status in statuses},
+            "samples": [dict(asdict(sample), latency=sample.latency) for sample in self.samples],
+        }
+
+    def to_json(self, path: Union[Path, str]) -> None:
+        """
+        Export report to JSON file.
+
+        :param path: Path of file
+        """
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    def to_csv(self, path: Union[Path, str]) -> None:
+        """
+        Export samples to CSV file.
+
+        :param path: Path of file
+        """
+        fields = [*LatencySample.__dataclass_fields__, "latency"]
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fields)
+            writer.writeheader()
+            for sample in self.samples:
+                writer.writerow(dict(asdict(sample), latency=sample.latency))
+
+
+class LinkLatencyProbe:
+    """
+    Measure time from sending link change event until new state is visible.
+
+    Each event is timestamped right before it is sent, then observer is polled every poll_interval seconds
+    until it reports new state or timeout expires.
+    """
+
+    def __init__(
+        self,
+        client: "CliClient",
+        observer: Observer,
+        *,
+        poll_interval: float = 0.01,
+        timeout: float = 10.0,
+        clock: Callable[[], float] = perf_counter,
+        sleeper: Callable[[float], None] = sleep,
+    ) -> None:
+        """
+        Initialize probe.
+
+        :param client: CliClient used to send events
+        :param observer: CommandObserver or callable on the host side returning True when state of event is visible
+        :param poll_interval: Interval between polls of observer in seconds
+        :param timeout: Maximum time of waiting for new state in seconds
+        :param clock: Clock used for timestamps
+        :param sleeper: Function used for sleeping between polls
+        """
+        self.client = client
+        self.observer = observer
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._clock = clock
+        self._sleep = sleeper
+
+    def _send(self, event: LinkEvent) -> None:
+        """
+        Send link change event.
+
+        :param event: Event to send
+        """
+        if event.target.pf_num is None:
+            self.client.send_link_change_event_all_pf(event.link_status, event.link_speed)
+        else:
+            self.client.send_link_change_event_per_pf(
+                event.link_status, event.link_speed, event.target.pf_num, event.target.vport_id
+            )
+
+    def measure(self, event: LinkEvent, start: Optional[float] = None) -> LatencySample:
+        """
+        Send event and wait until its state is observed.
+
+        :param event: Event to send, its time offset is ignored
+        :param start: Clock value times of sample are relative to, time of sending by default
+        :return: Sample
+        """
+        sent = self._clock()
+        start = sent if start is None else start
+        self._send(event)
+        acknowledged = self._clock()
+        polls = 0
+        observed = None
+        while True:
+            polls += 1
+            if self.observer(event):
+                observed = self._clock()
+                break
+            remaining = sent + self.timeout - self._clock()
+            if remaining <= 0:
+                break
+            self._sleep(min(self.poll_interval, remaining))
+        target = event.target
+        sample = LatencySample(
+            event.link_status,
+            event.link_speed,
+            target.pf_num,
+            target.vport_id,
+            sent - start,
+            acknowledged - start,
+            None if observed is None else observed - start,
+            polls,
+        )
+        if sample.latency is None:
+            log.debug(logger, "Link change (%s) not observed in time.", event.command)
+        else:
+            log.debug(
+                logger,
+                "Link change (%s) observed after %.3fms (%d polls).",
+                event.command,
+                sample.latency * 1000,
+                polls,
+            )
+        return sample
+
+    def run(
+        self,
+        target: LinkTarget,
+        trials: int = 10,
+        *,
+        sequence: Sequence[str] = ("down", "up"),
+        speeds: Iterable[str] = ("200000Mbps",),
+    ) -> LatencyReport:
+        """
+        Run repeated trials of link changes on target.
+
+        :param target: Target of events, all pfs when pf_num is None
+        :param trials: Number of events to send
+        :param sequence: Link statuses sent in round-robin
+        :param speeds: Link speeds sent in round-robin
+        :return: Report with latency of each trial
+        """
+        speeds = list(speeds)
+        report = LatencyReport()
+        start = self._clock()
+        for trial in range(trials):
+            event = LinkEvent(0.0, target, sequence[trial % len(sequence)], speeds[trial % len(speeds)])
+            report.samples.append(self.measure(event, start))
+        return report
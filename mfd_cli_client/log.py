@@ -0,0 +1,75 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for logging of command line interface client, cheap when MODULE_DEBUG level is disabled."""
+
+import logging
+from time import perf_counter
+from types import TracebackType
+from typing import Optional, Type
+
+# Same value as mfd_common_libs.log_levels.MODULE_DEBUG, so this module does not import mfd_common_libs
+MODULE_DEBUG = 13
+
+
+def debug(logger: logging.Logger, msg: str, *args: object) -> None:
+    """
+    Log message at MODULE_DEBUG level, formatting it only when level is enabled.
+
+    :param logger: Logger
+    :param msg: Message with %-style placeholders
+    :param args: Arguments of message
+    """
+    if logger.isEnabledFor(MODULE_DEBUG):
+        logger.log(MODULE_DEBUG, msg, *args)
+
+
+class BulkLog:
+    """
+    Summarize bulk operation in one MODULE_DEBUG record.
+
+    Only steps of the operation itself, logged by step(), are counted in summary. Messages of nested calls are logged
+    as they are, so the count does not depend on how many records single step produces.
+    """
+
+    def __init__(self, logger: logging.Logger, operation: str) -> None:
+        """
+        Initialize bulk log.
+
+        :param logger: Logger
+        :param operation: Description of operation used in summary
+        """
+        self.logger = logger
+        self.operation = operation
+        self.items = 0
+        self._start = 0.0
+
+    def step(self, msg: str, *args: object) -> None:
+        """
+        Count step of operation and log it at MODULE_DEBUG level.
+
+        :param msg: Message with %-style placeholders
+        :param args: Arguments of message
+        """
+        self.items += 1
+        debug(self.logger, msg, *args)
+
+    def __enter__(self) -> "BulkLog":
+        self._start = perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self.logger.isEnabledFor(MODULE_DEBUG):
+            state = "failed after" if exc_type is not None else "passed,"
+            self.logger.log(
+                MODULE_DEBUG,
+                "%s %s %d items in %.3fs.",
+                self.operation,
+                state,
+                self.items,
+                perf_counter() - self._start,
+            )
@@ -0,0 +1,148 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for managing mirror profiles."""
+
+import logging
+import typing
+from threading import Lock
+from types import TracebackType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Type, Union
+
+from . import log
+from .base import mirror_profile_command, mirror_profile_succeeded
+from .exceptions import CliClientException
+
+if typing.TYPE_CHECKING:
+    from .base import CliClient
+
+logger = logging.getLogger(__name__)
+
+
+class MirrorProfileManager:
+    """
+    Create and delete mirror profiles, keeping track of profile -> VSI mappings created by this manager.
+
+    Bulk operations are validated up front and sent in one remote invocation.
+    teardown_all() removes only profiles created by this manager; manager can be used as context manager
+    which tears down on exit.
+    """
+
+    def __init__(self, client: "CliClient") -> None:
+        """
+        Initialize manager.
+
+        :param client: CliClient used to configure mirror profiles
+        """
+        self.client = client
+        self._profiles: Dict[int, int] = {}
+        self._lock = Lock()
+
+    @property
+    def profiles(self) -> Dict[int, int]:
+        """Copy of mirror profile id -> VSI id mappings created by this manager."""
+        with self._lock:
+            return dict(self._profiles)
+
+    def _execute(self, commands: List[str]) -> List[str]:
+        """
+        Execute commands in one remote invocation.
+
+        :param commands: Commands to execute
+        :return: Outputs of commands
+        """
+        if len(commands) == 1:
+            return [self.client.execute_cli_client_command(command=commands[0], expected_return_codes=None)]
+        return self.client.execute_cli_client_batch(commands, expected_return_codes=None)
+
+    def create(self, profile_id: int, vsi_id: int) -> None:
+        """
+        Create mirror profile to mirror traffic to a specific vsi.
+
+        :param profile_id: Mirror profile id (must be >= 16)
+        :param vsi_id: VSI id where packets will be mirrored
+        :raises CliClientException: on failure
+        """
+        self.create_many({profile_id: vsi_id})
+
+    def create_many(self, mappings: Union[Mapping[int, int], Iterable[Tuple[int, int]]]) -> None:
+        """
+        Create mirror profiles in one remote invocation.
+
+        :param mappings: Mirror profile id -> VSI id mappings, ids must be >= 16
+        :raises CliClientException: on reserved profile id (before anything is sent) or when any profile failed,
+                                    profiles which were created are tracked anyway
+        """
+        mappings = dict(mappings)
+        if not mappings:
+            return
+        commands = [mirror_profile_command(profile_id, vsi_id) for profile_id, vsi_id in mappings.items()]
+        outputs = self._execute(commands)
+        failed = []
+        with self._lock:
+            for (profile_id, vsi_id), command, output in zip(mappings.items(), commands, outputs):
+                if mirror_profile_succeeded(output):
+                    self._profiles[profile_id] = vsi_id
+                else:
+                    failed.append(command)
+        log.debug(logger, "Created %d of %d mirror profiles.", len(mappings) - len(failed), len(mappings))
+        if failed:
+            raise CliClientException(f"Mirror profile ({', '.join(failed)}) failed.")
+
+    def delete(self, profile_id: int) -> None:
+        """
+        Delete mirror profile created by this manager.
+
+        :param profile_id: Mirror profile id
+        :raises CliClientException: on failure
+        """
+        self.delete_many([profile_id])
+
+    def delete_many(self, profile_ids: Iterable[int]) -> None:
+        """
+        Delete mirror profiles created by this manager in one remote invocation.
+
+        :param profile_ids: Mirror profile ids
+        :raises CliClientException: on profile not created by this manager (before anything is sent) or when any
+                                    profile failed, profiles which failed stay tracked
+        """
+        with self._lock:
+            profiles = dict(self._profiles)
+        profile_ids = list(dict.fromkeys(profile_ids))
+        unknown = [profile_id for profile_id in profile_ids if profile_id not in profiles]
+        if unknown:
+            raise CliClientException(f"Mirror profiles {unknown} were not created by this manager.")
+        if not profile_ids:
+            return
+        commands = [
+            mirror_profile_command(profile_id, profiles[profile_id], enable=False) for profile_id in profile_ids
+        ]
+        outputs = self._execute(commands)
+        failed = []
+        with self._lock:
+            for profile_id, command, output in zip(profile_ids, commands, outputs):
+                if mirror_profile_succeeded(output):
+                    self._profiles.pop(profile_id, None)
+                else:
+                    failed.append(command)
+        log.debug(logger, "Deleted %d of %d mirror profiles.", len(profile_ids) - len(failed), len(profile_ids))
+        if failed:
+            raise CliClientException(f"Mirror profile delete ({', '.join(failed)}) failed.")
+
+    def teardown_all(self) -> None:
+        """
+        Delete all mirror profiles created by this manager in one remote invocation.
+
+        :raises CliClientException: when any profile failed
+        """
+        self.delete_many(self.profiles)
+
+    def __enter__(self) -> "MirrorProfileManager":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.teardown_all()
@@ -0,0 +1,246 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for live monitoring of VSI traffic, ranked like top."""
+
+import heapq
+import logging
+import typing
+from dataclasses import dataclass, field
+from operator import attrgetter
+from time import monotonic, process_time, sleep
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+from . import log
+
+if typing.TYPE_CHECKING:
+    from .base import CliClient
+    from .structures import VSIFlowStats, VSIStats
+
+logger = logging.getLogger(__name__)
+
+SORT_KEYS = ("pps", "drops", "errors")
+# title, width and rendering of table columns
+COLUMNS: Tuple[Tuple[str, int, Callable[["VsiTraffic"], str]], ...] = (
+    ("VSI", 6, lambda traffic: f"{traffic.vsi_id:#x}"),
+    ("HOST", 5, lambda traffic: f"{traffic.host_id:#x}"),
+    ("FN", 5, lambda traffic: f"{traffic.fn_id:#x}"),
+    ("VF", 3, lambda traffic: "yes" if traffic.is_vf else "no"),
+    ("RX pps", 12, lambda traffic: f"{traffic.ingress_pps:.1f}"),
+    ("TX pps", 12, lambda traffic: f"{traffic.egress_pps:.1f}"),
+    ("RX drop/s", 10, lambda traffic: f"{traffic.ingress_drops:.1f}"),
+    ("TX drop/s", 10, lambda traffic: f"{traffic.egress_drops:.1f}"),
+    ("RX err/s", 10, lambda traffic: f"{traffic.ingress_errors:.1f}"),
+    ("TX err/s", 10, lambda traffic: f"{traffic.egress_errors:.1f}"),
+)
+
+
+@dataclass(frozen=True)
+class VsiTraffic:
+    """Structure for traffic rates of single VSI in packets per second."""
+
+    vsi_id: int
+    host_id: int
+    fn_id: int
+    is_vf: bool
+    ingress_pps: float
+    egress_pps: float
+    ingress_drops: float
+    egress_drops: float
+    ingress_errors: float
+    egress_errors: float
+
+    @property
+    def pps(self) -> float:
+        """Packets per second in both directions."""
+        return self.ingress_pps + self.egress_pps
+
+    @property
+    def drops(self) -> float:
+        """Discarded packets per second in both directions."""
+        return self.ingress_drops + self.egress_drops
+
+    @property
+    def errors(self) -> float:
+        """Error packets per second in both directions."""
+        return self.ingress_errors + self.egress_errors
+
+
+@dataclass
+class MonitorSample:
+    """
+    Structure for single refresh of monitor.
+
+    elapsed - time since previous sample rates are computed over, query_time - time of bulk query,
+    cpu_time - CPU time of this process spent on sample, all in seconds.
+    """
+
+    elapsed: float
+    query_time: float
+    cpu_time: float
+    traffic: List[VsiTraffic] = field(default_factory=list)
+
+    def top(self, limit: Optional[int] = None, sort_by: str = "pps") -> List[VsiTraffic]:
+        """
+        Rank VSIs.
+
+        :param limit: Number of VSIs to return, all by default
+        :param sort_by: One of SORT_KEYS
+        :return: VSIs with highest rate first
+        :raises ValueError: on unknown sort key
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort_by}, expected one of {SORT_KEYS}")
+        key = attrgetter(sort_by)
+        if limit is None:
+            return sorted(self.traffic, key=key, reverse=True)
+        return heapq.nlargest(limit, self.traffic, key=key)
+
+
+def _rate(current: Optional[int], previous: Optional[int], elapsed: float) -> float:
+    """
+    Compute rate of counter.
+
+    :param current: Current value of counter
+    :param previous: Previous value of counter
+    :param elapsed: Time between values in seconds
+    :return: Increase per second, 0 for missing or reset counter
+    """
+    if current is None or previous is None or current < previous:
+        return 0.0
+    return (current - previous) / elapsed
+
+
+def _flow_rates(current: "VSIFlowStats", previous: "VSIFlowStats", elapsed: float) -> Tuple[float, float, float]:
+    """
+    Compute packet, discard and error rates of one direction.
+
+    :param current: Current counters
+    :param previous: Previous counters
+    :param elapsed: Time between counters in seconds
+    :return: Packets, discards and errors per second
+    """
+    return (
+        _rate(current.packet, previous.packet, elapsed),
+        _rate(current.discards_packet, previous.discards_packet, elapsed),
+        _rate(current.errors_packet, previous.errors_packet, elapsed),
+    )
+
+
+class VsiTrafficMonitor:
+    """
+    Sample traffic of all created VSIs and rank them by packets, drops or errors per second.
+
+    Every sample queries all VSIs in one remote invocation. Only VSIs which were not sampled before are warmed up,
+    so warm-up happens once per VSI. VSI config table is re-read at most every table_max_age seconds.
+    """
+
+    def __init__(
+        self,
+        client: "CliClient",
+        *,
+        vsi_ids: Optional[Collection[int]] = None,
+        table_max_age: float = 30.0,
+        clock: Callable[[], float] = monotonic,
+        sleeper: Callable[[float], None] = sleep,
+    ) -> None:
+        """
+        Initialize monitor.
+
+        :param client: CliClient used to query VSIs
+        :param vsi_ids: Monitor only these VSIs, all created VSIs by default
+        :param table_max_age: Maximum age of VSI config table in seconds
+        :param clock: Clock used for rates and scheduling
+        :param sleeper: Function used for sleeping between samples
+        """
+        self.client = client
+        self.vsi_ids = None if vsi_ids is None else frozenset(vsi_ids)
+        self.table_max_age = table_max_age
+        self._clock = clock
+        self._sleep = sleeper
+        self._previous: Dict[int, "VSIStats"] = {}
+        self._previous_at = 0.0
+
+    def reset(self) -> None:
+        """Forget previous counters, next sample only warms up and stores counters."""
+        self._previous = {}
+
+    def sample(self) -> Optional[MonitorSample]:
+        """
+        Query counters of monitored VSIs and compute rates since previous sample.
+
+        :return: Sample, None when there was no previous sample to compute rates from
+        """
+        cpu_start = process_time()
+        targets = self.client.get_vsi_config_list(max_age=self.table_max_age).created_vsis(self.vsi_ids)
+        started = self._clock()
+        new = [vsi_id for vsi_id in targets if vsi_id not in self._previous]
+        stats = self.client.get_vsi_statistics_bulk(targets, warm_up=new)
+        now = self._clock()
+        elapsed = now - self._previous_at
+        result = None
+        if self._previous:
+            traffic = []
+            for vsi_id, current in stats.items():
+                previous = self._previous.get(vsi_id)
+                if previous is None:
+                    continue
+                ingress = _flow_rates(current.ingress, previous.ingress, elapsed)
+                egress = _flow_rates(current.egress, previous.egress, elapsed)
+                traffic.append(
+                    VsiTraffic(
+                        vsi_id, *targets[vsi_id], ingress[0], egress[0], ingress[1], egress[1], ingress[2], egress[2]
+                    )
+                )
+            result = MonitorSample(elapsed, now - started, process_time() - cpu_start, traffic)
+            log.debug(logger, "Sampled %d VSIs in %.3fs.", len(traffic), result.query_time)
+        self._previous = stats
+        self._previous_at = now
+        return result
+
+    def run(self, interval: float, on_sample: Callable[[MonitorSample], None], *, count: Optional[int] = None) -> None:
+        """
+        Sample at fixed interval.
+
+        Samples are scheduled every interval seconds from start. Sample overrunning its slot skips missed slots
+        instead of sampling back to back, so at most one sample per interval is taken.
+
+        :param interval: Interval between samples in seconds
+        :param on_sample: Callable called with every sample
+        :param count: Number of samples to deliver, forever if None
+        :raises ValueError: on interval which is not positive
+        """
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive, got {interval}")
+        delivered = 0
+        next_at = self._clock()
+        while count is None or delivered < count:
+            sample = self.sample()
+            if sample is not None:
+                on_sample(sample)
+                delivered += 1
+                if count is not None and delivered >= count:
+                    return
+            now = self._clock()
+            next_at += interval
+            if next_at < now:
+                next_at += ((now - next_at) // interval + 1) * interval
+            self._sleep(next_at - now)
+
+
+def format_top(sample: MonitorSample, *, limit: int = 20, sort_by: str = "pps") -> str:
+    """
+    Format sample as table of top VSIs.
+
+    :param sample: Monitor sample
+    :param limit: Number of VSIs shown
+    :param sort_by: One of SORT_KEYS
+    :return: Header and table
+    """
+    header = (
+        f"VSIs: {len(sample.traffic)}  interval: {sample.elapsed:.3f}s  query: {sample.query_time:.3f}s  "
+        f"cpu: {sample.cpu_time:.3f}s  sorted by: {sort_by}"
+    )
+    lines = [header, "", " ".join(f"{title:>{width}}" for title, width, _ in COLUMNS)]
+    for traffic in sample.top(limit, sort_by):
+        lines.append(" ".join(f"{render(traffic):>{width}}" for _, width, render in COLUMNS))
+    return "\n".join(lines)
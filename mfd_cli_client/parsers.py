@@ -0,0 +1,153 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for parsers of command line interface client outputs, importable without heavy dependencies."""
+
+import re
+from typing import Dict, List
+
+from .exceptions import CliClientException
+from .structures import FlowStats, SwitchStats, VSIFlowStats, VSIStats
+from .vsi_table import VsiConfigTable, mac_to_int
+
+# any counter of switch statistics: per-TC counters, packets and discards of direction, packets by casting
+_SWITCH_COUNTER = re.compile(
+    r"(?:(?P<direction>ingress|egress)\s(?:tc\s(?P<tc>\d+)\spacket\scounter|(?P<discards>discards\s)?packet)"
+    r"|(?P<cast>unicast|multicast|broadcast)\spacket):\s(?P<counter>\d+)(?(tc)|\sbytes)"
+)
+
+
+def parse_switch_stats(output: str, traffic_class_count: int = 8) -> SwitchStats:
+    """
+    Parse output of switch statistics query in one pass.
+
+    First occurrence of every counter is used, counters missing in output are 0.
+
+    :param output: Output of '--query --statistics --switch' command
+    :param traffic_class_count: Number of traffic classes to look for
+    :return: Stats for both directions
+    """
+    counters = {}
+    for match in _SWITCH_COUNTER.finditer(output):
+        if match["tc"] is not None:
+            key = (match["direction"], int(match["tc"]))
+        elif match["direction"] is not None:
+            key = (match["direction"], "discards" if match["discards"] else "packet")
+        else:
+            key = match["cast"]
+        if key not in counters:
+            counters[key] = int(match["counter"])
+
+    flows = {
+        direction: FlowStats(
+            [counters.get((direction, traffic_class), 0) for traffic_class in range(traffic_class_count)],
+            counters.get((direction, "packet"), 0),
+            counters.get((direction, "discards"), 0),
+        )
+        for direction in ("egress", "ingress")
+    }
+    return SwitchStats(
+        flows["egress"],
+        flows["ingress"],
+        counters.get("unicast", 0),
+        counters.get("multicast", 0),
+        counters.get("broadcast", 0),
+    )
+
+
+def parse_vsi_statistics(output: str) -> VSIStats:
+    """
+    Parse output of VSI statistics query.
+
+    :param output: Output of '--query --statistics --vsi' command
+    :return: Stats for both directions
+    """
+    rx_stats = VSIFlowStats(0, 0, 0, 0, 0, 0, 0)
+    tx_stats = VSIFlowStats(0, 0, 0, 0, 0, 0, 0)
+    stats = {}
+
+    for direction in ["ingress", "egress"]:
+        patterns = {
+            "packet": rf"{direction} packet: (?P<counter>\d+)",
+            "unicast_packet": rf"{direction} unicast packet: (?P<counter>\d+)",
+            "multicast_packet": rf"{direction} multicast packet: (?P<counter>\d+)",
+            "broadcast_packet": rf"{direction} broadcast packet: (?P<counter>\d+)",
+            "discards_packet": rf"{direction} discards packet: (?P<counter>\d+)",
+            "errors_packet": rf"{direction} errors packet: (?P<counter>\d+)",
+            "unknown_packet": rf"{direction} unknown packet: (?P<counter>\d+)",
+        }
+        for key, regex in patterns.items():
+            match = re.search(regex, output)
+            stats[key] = int(match.group("counter")) if match else None
+
+        if "ingress" == direction:
+            rx_stats = VSIFlowStats(**stats)
+        else:
+            tx_stats = VSIFlowStats(**stats)
+
+    return VSIStats(rx_stats, tx_stats)
+
+
+def parse_vsi_config_list(output: str) -> VsiConfigTable:
+    """
+    Parse output of VSI config query.
+
+    Rows are stored directly in VsiConfigTable columns, VsiConfigListEntry objects are created only on access.
+
+    :param output: Output of '--query --config --verbose' command
+    :return: table with entries from VSI list containing all fields in output
+    """
+    pattern = re.compile(
+        r"fn_id:\s(?P<fn_id>\w+).*host_id:\s(?P<host_id>\w+).*is_vf:\s(?P<is_vf>(no|yes)).*vsi_id:\s(?P"
+        r"<vsi_id>\w+).*vport_id\s(?P<vport_id>\w+).*is_created:\s(?P<is_created>(no|yes)).*is_enabled:"
+        r"\s(?P<is_enabled>(no|yes))\smac\saddr:\s(?P<mac>([a-fA-F0-9]{1,2}[:|-]?){6})"
+    )
+    vsi_config_table = VsiConfigTable()
+
+    for match in pattern.finditer(output):
+        vsi_config_table.append_row(
+            int(match["fn_id"], 16),
+            int(match["host_id"], 16),
+            match["is_vf"] == "yes",
+            int(match["vsi_id"], 16),
+            int(match["vport_id"], 16),
+            match["is_created"] == "yes",
+            match["is_enabled"] == "yes",
+            mac_to_int(match["mac"]),
+        )
+
+    return vsi_config_table
+
+
+def parse_qos_vm_info(output: str) -> Dict[int, Dict[int, List[int]]]:
+    """
+    Parse output of VM QoS info query.
+
+    :param output: Output of '--query --statistics --vm_qos_info' command
+    :return: A dictionary of keys hosts, values are dicts of vms which values are lists of vfs in that vm.
+    :raises CliClientException: on unexpected output
+    """
+    if "server finished responding" not in output.lower():
+        raise CliClientException("cli_client returned unexpected output when querying vm_qos_info")
+
+    lines = output.split("\n")
+    data = {}
+    host_id = None
+    vm_id = None
+
+    for line in lines:
+        if "HOST ID" in line:
+            host_id = int(line.split()[-1])
+            data[host_id] = {}
+        elif "VM ID" in line:
+            vm_id = int(line.split()[-1])
+            data[host_id][vm_id] = []
+        elif "VF ID" in line:
+            vf_ids = line.split(":")[-1].strip().split(",")
+            vf_ids = [int(vfid) for vfid in vf_ids if vfid]
+            data[host_id][vm_id] = vf_ids
+
+    for key in [0, 1, 2, 3]:
+        if key not in data:
+            raise CliClientException("Error parsing output from vm_qos_info")
+
+    return data
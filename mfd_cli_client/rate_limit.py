@@ -0,0 +1,143 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for client-side rate limiting of cli_client invocations."""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import BoundedSemaphore, Lock
+from time import monotonic, sleep
+from typing import Callable, Iterator, Optional
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters of rate limiter."""
+
+    acquired: int = 0
+    throttled: int = 0
+    throttled_time: float = 0.0
+    max_in_flight: int = 0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Bucket holds up to burst tokens and is refilled with rate tokens per second. Caller which finds the bucket empty
+    reserves next token and sleeps until it is refilled, so waiting callers are served in order of arrival.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = monotonic,
+        sleeper: Callable[[float], None] = sleep,
+    ) -> None:
+        """
+        Initialize token bucket.
+
+        :param rate: Tokens added per second
+        :param burst: Capacity of bucket, by default 1 token (no bursts)
+        :param clock: Monotonic clock in seconds
+        :param sleeper: Function sleeping given number of seconds
+        :raises ValueError: if rate or burst is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        burst = 1 if burst is None else burst
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleeper = sleeper
+        self._lock = Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def acquire(self) -> float:
+        """
+        Take single token, waiting for it if bucket is empty.
+
+        :return: Time spent waiting for token in seconds
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleeper(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Limit rate and concurrency of cli_client invocations.
+
+    >>> query_limiter = RateLimiter(rate=20, burst=5, max_in_flight=4)
+    >>> with query_limiter.limit():
+    ...     connection.execute_command(...)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        *,
+        burst: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        clock: Callable[[], float] = monotonic,
+        sleeper: Callable[[float], None] = sleep,
+    ) -> None:
+        """
+        Initialize rate limiter.
+
+        :param rate: Maximum invocations per second, None for no rate limit
+        :param burst: Invocations allowed at once above rate, by default 1 (no bursts)
+        :param max_in_flight: Maximum invocations in flight at the same time, None for no cap
+        :param clock: Monotonic clock in seconds
+        :param sleeper: Function sleeping given number of seconds
+        :raises ValueError: if max_in_flight is not positive
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"Max in flight must be at least 1, got {max_in_flight}")
+        self._bucket = TokenBucket(rate, burst, clock=clock, sleeper=sleeper) if rate is not None else None
+        self._slots = BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+        self._clock = clock
+        self._lock = Lock()
+        self._in_flight = 0
+        self.stats = RateLimiterStats()
+
+    @contextmanager
+    def limit(self) -> Iterator[float]:
+        """
+        Wait for free slot and token, and hold the slot until the end of context.
+
+        :return: Time spent throttled in seconds
+        """
+        throttled_time = 0.0
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            start = self._clock()
+            self._slots.acquire()
+            throttled_time += self._clock() - start
+        try:
+            if self._bucket is not None:
+                throttled_time += self._bucket.acquire()
+            with self._lock:
+                self._in_flight += 1
+                self.stats.acquired += 1
+                if throttled_time > 0:
+                    self.stats.throttled += 1
+                    self.stats.throttled_time += throttled_time
+                self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+            try:
+                yield throttled_time
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+        finally:
+            if self._slots is not None:
+                self._slots.release()
@@ -0,0 +1,90 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for counter rates with error intervals from acquisition windows of stats."""
+
+import math
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .structures import AcquisitionWindow
+
+
+@dataclass(frozen=True)
+class Rate:
+    """
+    Structure for rate of counter per second with its error interval.
+
+    value - rate over time between midpoints of acquisition windows, low/high - rates over the longest and
+    the shortest time which could have passed between reads of counter (high is inf when windows overlap).
+    """
+
+    value: float
+    low: float
+    high: float
+
+    @property
+    def error(self) -> float:
+        """Largest distance of value from bounds."""
+        return max(self.value - self.low, self.high - self.value)
+
+    @property
+    def relative_error(self) -> Optional[float]:
+        """Error relative to value, None for zero rate."""
+        return self.error / self.value if self.value else None
+
+
+def counter_rate(
+    previous: Optional[int],
+    current: Optional[int],
+    previous_window: AcquisitionWindow,
+    current_window: AcquisitionWindow,
+) -> Optional[Rate]:
+    """
+    Compute rate of counter read in two acquisition windows.
+
+    :param previous: Previous value of counter
+    :param current: Current value of counter
+    :param previous_window: Window previous value was read in
+    :param current_window: Window current value was read in
+    :return: Rate with error interval, None for missing or reset counter or windows out of order
+    """
+    if previous is None or current is None or current < previous:
+        return None
+    elapsed = current_window.midpoint - previous_window.midpoint
+    if elapsed <= 0:
+        return None
+    increase = current - previous
+    longest = current_window.finished - previous_window.started
+    shortest = current_window.started - previous_window.finished
+    high = increase / shortest if shortest > 0 else (0.0 if not increase else math.inf)
+    return Rate(increase / elapsed, increase / longest, high)
+
+
+def _counters(stats: Any, name: str = "") -> Iterator[Tuple[str, Optional[int]]]:
+    if is_dataclass(stats):
+        for item in fields(stats):
+            if item.compare:  # skips timestamp and window
+                yield from _counters(getattr(stats, item.name), f"{name}.{item.name}" if name else item.name)
+    elif isinstance(stats, list):
+        for index, value in enumerate(stats):
+            yield f"{name}[{index}]", value
+    else:
+        yield name, stats
+
+
+def stats_rates(previous: Any, current: Any) -> Dict[str, Optional[Rate]]:
+    """
+    Compute rates of all counters of two stats results, e.g. SwitchStats or VSIStats.
+
+    :param previous: Previous stats
+    :param current: Current stats of the same switch or VSI
+    :return: Rates by counter path, e.g. 'ingress.packet' or 'egress.traffic_class_counters[3]'
+    :raises ValueError: when any of stats has no acquisition window
+    """
+    if previous.window is None or current.window is None:
+        raise ValueError("Stats without acquisition window, query them with CliClient")
+    previous_counters = dict(_counters(previous))
+    return {
+        name: counter_rate(previous_counters.get(name), counter, previous.window, current.window)
+        for name, counter in _counters(current)
+    }
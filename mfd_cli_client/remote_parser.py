@@ -0,0 +1,217 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for parsing cli_client outputs on the CP, next to cli_client."""
+
+import hashlib
+import json
+import logging
+import typing
+from typing import Dict, List
+
+from . import log
+from .exceptions import CliClientRemoteParserError
+from .vsi_table import VsiConfigTable, mac_to_int
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Both scripts are POSIX awk (busybox awk is enough) and emit single line of compact JSON:
+# {"v": FORMAT_VERSION, "rows"|"hosts": ..., "ok": 1 if cli_client finished responding else 0}
+VSI_CONFIG_SCRIPT = r"""
+function value(key,   s) {
+    if (!match($0, key "[ \t]+[0-9a-fA-Fx]+")) return ""
+    s = substr($0, RSTART, RLENGTH)
+    sub(key "[ \t]+", "", s)
+    return s
+}
+function flag(key) {
+    if (match($0, key "[ \t]+yes")) return 1
+    if (match($0, key "[ \t]+no")) return 0
+    return -1
+}
+BEGIN { printf "{\"v\":%d,\"rows\":[", version }
+/fn_id:/ {
+    mac = ""
+    if (match($0, /mac addr:[ \t]+[0-9a-fA-F:|-]+/)) {
+        mac = substr($0, RSTART, RLENGTH)
+        sub(/mac addr:[ \t]+/, "", mac)
+    }
+    printf "%s[\"%s\",\"%s\",%d,\"%s\",\"%s\",%d,%d,\"%s\"]", sep, value("fn_id:"), value("host_id:"),
+        flag("is_vf:"), value("vsi_id:"), value("vport_id"), flag("is_created:"), flag("is_enabled:"), mac
+    sep = ","
+}
+tolower($0) ~ /server finished responding/ { ok = 1 }
+END { printf "],\"ok\":%d}\n", ok }
+"""
+
+QOS_VM_INFO_SCRIPT = r"""
+function flush_vm() {
+    if (vm != "") printf "%s\"%s\":[%s]", vm_sep, vm, vfs
+    if (vm != "") vm_sep = ","
+    vm = ""
+}
+function flush_host() {
+    flush_vm()
+    if (host != "") printf "}"
+}
+BEGIN { printf "{\"v\":%d,\"hosts\":{", version }
+/HOST ID/ {
+    flush_host()
+    host = $NF
+    printf "%s\"%s\":{", host_sep, host
+    host_sep = ","
+    vm_sep = ""
+    next
+}
+/VM ID/ {
+    flush_vm()
+    vm = $NF
+    vfs = ""
+    next
+}
+/VF ID/ {
+    vfs = $0
+    sub(/.*:/, "", vfs)
+    gsub(/[ \t]/, "", vfs)
+    sub(/,+$/, "", vfs)
+    next
+}
+tolower($0) ~ /server finished responding/ { ok = 1 }
+END {
+    flush_host()
+    printf "},\"ok\":%d}\n", ok
+}
+"""
+
+SCRIPTS = {"vsi_config": VSI_CONFIG_SCRIPT, "qos_vm_info": QOS_VM_INFO_SCRIPT}
+
+
+class RemoteParser:
+    """
+    Parser scripts pushed once to the CP and run next to cli_client.
+
+    Scripts turn human-readable, whitespace-padded tables into compact JSON, so less data is transferred over
+    connection and less work is left for local parsing.
+    """
+
+    def __init__(self, directory: str = "/tmp") -> None:
+        """
+        Initialize remote parser.
+
+        :param directory: Directory on the CP where scripts are stored
+        """
+        self.directory = directory
+        self._installed = False
+
+    def script_path(self, name: str) -> str:
+        """
+        Get path of script on the CP.
+
+        Path contains digest of the script, so changed script never collides with script pushed by older version.
+
+        :param name: Name of script, one of SCRIPTS keys
+        :return: Path of script
+        """
+        digest = hashlib.sha1(SCRIPTS[name].encode()).hexdigest()[:8]
+        return f"{self.directory}/mfd_cli_client_{name}_{digest}.awk"
+
+    @property
+    def installed(self) -> bool:
+        """Whether scripts were pushed to the CP."""
+        return self._installed
+
+    def install(self, connection: "Connection") -> None:
+        """
+        Push scripts to the CP, once.
+
+        :param connection: Connection to the CP
+        """
+        if self._installed:
+            return
+        for name, script in SCRIPTS.items():
+            path = self.script_path(name)
+            log.debug(logger, "Pushing %s parser script to %s.", name, path)
+            connection.path(path).write_text(script)
+        self._installed = True
+
+    def pipe(self, name: str) -> str:
+        """
+        Get shell command which cli_client output is piped through on the CP.
+
+        :param name: Name of script, one of SCRIPTS keys
+        :return: Shell command
+        """
+        return f"awk -v version={FORMAT_VERSION} -f {self.script_path(name)}"
+
+
+def _load(payload: str, key: str) -> typing.Any:
+    """
+    Load and validate JSON emitted by remote script.
+
+    :param payload: Output of remote script
+    :param key: Key of parsed data in JSON
+    :return: Parsed data
+    :raises CliClientRemoteParserError: on malformed, incomplete or incompatible payload
+    """
+    try:
+        document = json.loads(payload)
+    except ValueError as e:
+        raise CliClientRemoteParserError(f"Remote parser returned malformed output: {payload[:100]!r}") from e
+    if document.get("v") != FORMAT_VERSION:
+        raise CliClientRemoteParserError(f"Remote parser returned unsupported format version {document.get('v')}")
+    if not document.get("ok"):
+        raise CliClientRemoteParserError("cli_client returned unexpected output to remote parser")
+    return document[key]
+
+
+def decode_vsi_config_list(payload: str) -> VsiConfigTable:
+    """
+    Decode VSI config list emitted by remote parser.
+
+    :param payload: Output of remote script
+    :return: table with entries from VSI list containing all fields in output
+    :raises CliClientRemoteParserError: on malformed or incomplete payload
+    """
+    vsi_config_table = VsiConfigTable()
+    try:
+        for fn_id, host_id, is_vf, vsi_id, vport_id, is_created, is_enabled, mac in _load(payload, "rows"):
+            if -1 in (is_vf, is_created, is_enabled):
+                raise ValueError("missing flag")
+            vsi_config_table.append_row(
+                int(fn_id, 16),
+                int(host_id, 16),
+                bool(is_vf),
+                int(vsi_id, 16),
+                int(vport_id, 16),
+                bool(is_created),
+                bool(is_enabled),
+                mac_to_int(mac),
+            )
+    except (TypeError, ValueError, OverflowError) as e:
+        raise CliClientRemoteParserError("Remote parser returned incomplete VSI config row") from e
+    return vsi_config_table
+
+
+def decode_qos_vm_info(payload: str) -> Dict[int, Dict[int, List[int]]]:
+    """
+    Decode VF2VM mapping emitted by remote parser.
+
+    :param payload: Output of remote script
+    :return: A dictionary of keys hosts, values are dicts of vms which values are lists of vfs in that vm.
+    :raises CliClientRemoteParserError: on malformed or incomplete payload
+    """
+    try:
+        data = {
+            int(host_id): {int(vm_id): [int(vf_id) for vf_id in vf_ids] for vm_id, vf_ids in vms.items()}
+            for host_id, vms in _load(payload, "hosts").items()
+        }
+    except (AttributeError, TypeError, ValueError) as e:
+        raise CliClientRemoteParserError("Remote parser returned incomplete vm_qos_info") from e
+    for key in [0, 1, 2, 3]:
+        if key not in data:
+            raise CliClientRemoteParserError("Error parsing output from vm_qos_info")
+    return data
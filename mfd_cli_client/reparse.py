@@ -0,0 +1,307 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for parallel re-parsing of archived cli_client outputs into columnar counter tables."""
+
+import logging
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import monotonic
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from . import log
+from .exceptions import CliClientException
+from .archive import ChunkIndexEntry, OutputArchive, command_type, read_chunk
+from .parsers import parse_switch_stats, parse_vsi_config_list, parse_vsi_statistics
+
+logger = logging.getLogger(__name__)
+
+# value of counter missing in output
+MISSING = -1
+TRAFFIC_CLASS_COUNT = 8
+
+Row = Sequence[Optional[int]]
+
+_VSI_COUNTERS = (
+    "packet",
+    "unicast_packet",
+    "multicast_packet",
+    "broadcast_packet",
+    "discards_packet",
+    "errors_packet",
+    "unknown_packet",
+)
+
+
+def _object_id(command: str) -> Optional[int]:
+    value = command.split()[-1]
+    return int(value) if value.isdigit() else None
+
+
+def _switch_rows(command: str, output: str) -> Iterator[Row]:
+    stats = parse_switch_stats(output, traffic_class_count=TRAFFIC_CLASS_COUNT)
+    row = [_object_id(command)]
+    for flow in (stats.ingress, stats.egress):
+        row += [flow.packet, flow.discards, *flow.traffic_class_counters]
+    yield row + [stats.unicast_packet, stats.multicast_packet, stats.broadcast_packet]
+
+
+def _vsi_rows(command: str, output: str) -> Iterator[Row]:
+    stats = parse_vsi_statistics(output)
+    row = [_object_id(command)]
+    for flow in (stats.ingress, stats.egress):
+        row += [getattr(flow, counter) for counter in _VSI_COUNTERS]
+    yield row
+
+
+def _vsi_config_rows(command: str, output: str) -> Iterator[Row]:
+    table = parse_vsi_config_list(output)
+    return zip(table.fn_ids, table.host_ids, table.vsi_ids, table.vport_ids, table.flags, table.macs)
+
+
+@dataclass(frozen=True)
+class Extractor:
+    """Structure for extraction of table rows from output of one command type: names of columns and row function."""
+
+    columns: Tuple[str, ...]
+    rows: Callable[[str, str], Iterable[Row]]
+
+
+def _flow_columns(counters: Sequence[str]) -> Tuple[str, ...]:
+    return tuple(f"{direction}_{counter}" for direction in ("ingress", "egress") for counter in counters)
+
+
+# extractors by command type, functions have to be importable by worker processes
+EXTRACTORS: Dict[str, Extractor] = {
+    "--query --statistics --switch": Extractor(
+        (
+            "switch_id",
+            *_flow_columns(["packet", "discards", *(f"tc{tc}" for tc in range(TRAFFIC_CLASS_COUNT))]),
+            "unicast_packet",
+            "multicast_packet",
+            "broadcast_packet",
+        ),
+        _switch_rows,
+    ),
+    "--query --statistics --vsi": Extractor(("vsi_id", *_flow_columns(_VSI_COUNTERS)), _vsi_rows),
+    "--query --config --verbose": Extractor(
+        ("fn_id", "host_id", "vsi_id", "vport_id", "flags", "mac"), _vsi_config_rows
+    ),
+}
+
+
+class CounterTable:
+    """
+    Table of counters stored column-wise.
+
+    Every row carries wall-clock time and host of output it was parsed from. Counters are kept in int64 arrays
+    (MISSING for counters not present in output), hosts as indices into hosts list, so tables are cheap to
+    transfer between processes and to merge.
+    """
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        """
+        Create empty table.
+
+        :param columns: Names of counter columns
+        """
+        self.columns = tuple(columns)
+        self.timestamps = array("d")
+        self.host_indices = array("H")
+        self.hosts: List[str] = []
+        self._host_index: Dict[str, int] = {}
+        self._values = [array("q") for _ in self.columns]
+
+    def _host(self, host: str) -> int:
+        index = self._host_index.get(host)
+        if index is None:
+            index = self._host_index[host] = len(self.hosts)
+            self.hosts.append(host)
+        return index
+
+    def append(self, timestamp: float, host: str, row: Row) -> None:
+        """
+        Append row.
+
+        :param timestamp: Wall-clock time of output
+        :param host: Host of output
+        :param row: Counters in order of columns, None for missing counter
+        """
+        self.timestamps.append(timestamp)
+        self.host_indices.append(self._host(host))
+        for values, value in zip(self._values, row):
+            values.append(MISSING if value is None else value)
+
+    def extend(self, other: "CounterTable") -> None:
+        """
+        Append all rows of other table with the same columns.
+
+        :param other: Table to append
+        :raises ValueError: when columns of tables differ
+        """
+        if other.columns != self.columns:
+            raise ValueError(f"Cannot merge table with columns {other.columns} into {self.columns}")
+        self.timestamps.extend(other.timestamps)
+        mapping = [self._host(host) for host in other.hosts]
+        self.host_indices.extend(mapping[index] for index in other.host_indices)
+        for values, other_values in zip(self._values, other._values):
+            values.extend(other_values)
+
+    def column(self, name: str) -> array:
+        """
+        Get counter column.
+
+        :param name: Name of column
+        :return: Values of column
+        :raises KeyError: on unknown column
+        """
+        try:
+            return self._values[self.columns.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    def host_column(self) -> List[str]:
+        """Get host of every row."""
+        return [self.hosts[index] for index in self.host_indices]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+@dataclass
+class ReparseResult:
+    """Structure for result of re-parsing: tables by command type, numbers of parsed and failed outputs."""
+
+    tables: Dict[str, CounterTable] = field(default_factory=dict)
+    outputs: int = 0
+    errors: int = 0
+    duration: float = 0.0
+
+    def merge(self, other: "ReparseResult") -> None:
+        """
+        Merge result of other part of archive.
+
+        :param other: Result to merge
+        """
+        for name, table in other.tables.items():
+            if name in self.tables:
+                self.tables[name].extend(table)
+            else:
+                self.tables[name] = table
+        self.outputs += other.outputs
+        self.errors += other.errors
+
+
+@dataclass(frozen=True)
+class _Task:
+    path: str
+    entries: Tuple[ChunkIndexEntry, ...]
+    start: Optional[float]
+    end: Optional[float]
+    command_types: Tuple[str, ...]
+    hosts: Optional[Tuple[str, ...]]
+    skip_errors: bool
+
+
+def _reparse_chunks(task: _Task) -> ReparseResult:
+    result = ReparseResult()
+    for entry in task.entries:
+        for record in read_chunk(task.path, entry):
+            kind = command_type(record.command)
+            if (
+                kind not in task.command_types
+                or (task.start is not None and record.timestamp < task.start)
+                or (task.end is not None and record.timestamp > task.end)
+                or (task.hosts is not None and record.host not in task.hosts)
+            ):
+                continue
+            extractor = EXTRACTORS[kind]
+            try:
+                rows = list(extractor.rows(record.command, record.output))
+            except Exception as e:
+                if not task.skip_errors:
+                    raise CliClientException(f"Cannot parse archived output of {record.command}: {e}") from e
+                log.debug(logger, "Skipping archived output of %s: %s", record.command, e)
+                result.errors += 1
+                continue
+            table = result.tables.get(kind)
+            if table is None:
+                table = result.tables[kind] = CounterTable(extractor.columns)
+            for row in rows:
+                table.append(record.timestamp, record.host, row)
+            result.outputs += 1
+    return result
+
+
+def reparse_archive(
+    archive: Union[OutputArchive, Path, str],
+    *,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    command_types: Optional[Collection[str]] = None,
+    hosts: Optional[Collection[str]] = None,
+    processes: Optional[int] = None,
+    chunks_per_task: int = 1,
+    skip_errors: bool = False,
+) -> ReparseResult:
+    """
+    Re-parse archived outputs in parallel and merge results into counter tables.
+
+    Only index entries are sent to worker processes, every worker reads and decompresses its chunks from
+    archive file itself, so parent process does not become bottleneck. Results are merged in order of chunks.
+
+    :param archive: Archive or path of archive data file, buffered outputs of archive are written first
+    :param start: Minimum timestamp of outputs
+    :param end: Maximum timestamp of outputs
+    :param command_types: Command types (or commands) to re-parse, all types with extractor by default
+    :param hosts: Hosts of outputs
+    :param processes: Number of worker processes, CPU count by default, 1 to parse in this process
+    :param chunks_per_task: Number of chunks parsed by worker per task
+    :param skip_errors: Count outputs which parser failed on instead of raising
+    :return: Tables by command type
+    :raises ValueError: on command type without extractor
+    :raises CliClientException: on corrupted chunk or when parser failed and skip_errors is False
+    """
+    started = monotonic()
+    if not isinstance(archive, OutputArchive):
+        archive = OutputArchive(archive)
+    archive.flush()
+    types = tuple(EXTRACTORS) if command_types is None else tuple({command_type(c) for c in command_types})
+    unknown = [kind for kind in types if kind not in EXTRACTORS]
+    if unknown:
+        raise ValueError(f"No extractor for command types {unknown}, known command types: {list(EXTRACTORS)}")
+    entries = archive.chunks(start=start, end=end, command_types=types, hosts=hosts)
+    tasks = [
+        _Task(
+            str(archive.path),
+            tuple(entries[index : index + chunks_per_task]),
+            start,
+            end,
+            types,
+            None if hosts is None else tuple(hosts),
+            skip_errors,
+        )
+        for index in range(0, len(entries), chunks_per_task)
+    ]
+    processes = min(processes or os.cpu_count() or 1, len(tasks)) or 1
+
+    result = ReparseResult()
+    if processes == 1:
+        for task in tasks:
+            result.merge(_reparse_chunks(task))
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            for partial in executor.map(_reparse_chunks, tasks):
+                result.merge(partial)
+    result.duration = monotonic() - started
+    log.debug(
+        logger,
+        "Re-parsed %d outputs of %d chunks in %.3fs by %d processes.",
+        result.outputs,
+        len(entries),
+        result.duration,
+        processes,
+    )
+    return result
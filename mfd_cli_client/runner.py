@@ -0,0 +1,232 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for persistent shell on the CP which runs cli_client commands without spawning remote shell per call."""
+
+import itertools
+import logging
+import shlex
+import typing
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from secrets import token_hex
+from threading import Event, Lock, Thread
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from . import log
+from .exceptions import CliClientException, CliClientRunnerUnavailable
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.base import ConnectionCompletedProcess
+    from mfd_connect.process import RemoteProcess
+
+logger = logging.getLogger(__name__)
+
+RUNNER_MARKER = "__cli_client_runner_"
+
+# POSIX sh loop: request is one line '<id>:<script>', response is output of script followed by
+# '\n<marker> <id> <return code>' line, in order of requests; script runs in subshell, so it cannot alter the loop;
+# stderr is merged into output, so error text of failed script reaches its exception
+RUNNER_SCRIPT = r"""
+marker=$1
+printf '%s ready\n' "$marker"
+while IFS= read -r request; do
+    (eval "${request#*:}") </dev/null 2>&1
+    printf '\n%s %s %d\n' "$marker" "${request%%:*}" $?
+done
+"""
+
+
+def _stdout_lines(process: "RemoteProcess") -> Iterator[str]:
+    """
+    Iterate over stdout lines of process as soon as they arrive.
+
+    Stream is read directly when available, because iterators of some processes poll for new lines in intervals
+    longer than execution of small command.
+
+    :param process: Running process
+    :return: Lines of stdout
+    """
+    try:
+        stream = process.stdout_stream
+    except Exception:
+        yield from process.get_stdout_iter()
+        return
+    for line in iter(stream.readline, ""):
+        if not line:
+            return
+        yield line.decode(errors="backslashreplace") if isinstance(line, bytes) else line
+
+
+class PersistentRunner:
+    """
+    Long-lived shell on the CP, started once through connection, which executes scripts sent over its stdin.
+
+    Requests are framed as single lines and written without waiting for previous responses (pipelined),
+    responses are framed by marker line with request ID and return code. Shell executes requests one by one,
+    so when it dies only the oldest pending request may have been running; later requests were never started
+    and fail with CliClientRunnerUnavailable, so they can be safely executed another way.
+    """
+
+    def __init__(self, connection: "Connection", *, start_timeout: float = 10.0) -> None:
+        """
+        Initialize runner, shell is started by start().
+
+        :param connection: Connection to the CP
+        :param start_timeout: Maximum wait time for shell to start in seconds
+        """
+        self._connection = connection
+        self.start_timeout = start_timeout
+        self._marker = f"{RUNNER_MARKER}{token_hex(4)}"
+        self._lock = Lock()
+        self._ids = itertools.count()
+        self._pending: Dict[int, Future] = {}
+        self._process: Optional["RemoteProcess"] = None
+        self._ready = Event()
+        self._closed = False
+
+    @property
+    def alive(self) -> bool:
+        """Whether shell is started and accepts requests."""
+        return self._process is not None and self._ready.is_set() and not self._closed
+
+    @property
+    def started(self) -> bool:
+        """Whether shell started and got ready, even if it exited since."""
+        return self._ready.is_set()
+
+    @property
+    def closed(self) -> bool:
+        """Whether shell was stopped or exited, closed runner is never started again."""
+        return self._closed
+
+    def start(self) -> None:
+        """
+        Start shell on the CP, once.
+
+        :raises CliClientRunnerUnavailable: when shell cannot be started
+        """
+        with self._lock:
+            if self._closed:
+                raise CliClientRunnerUnavailable("Persistent runner was stopped")
+            if self._process is not None:
+                return
+            command = f"sh -c {shlex.quote(RUNNER_SCRIPT)} mfd_cli_client_runner {self._marker}"
+            try:
+                self._process = self._connection.start_process(
+                    command, shell=True, enable_input=True, discard_stderr=True
+                )
+            except Exception as e:
+                self._closed = True
+                raise CliClientRunnerUnavailable(f"Cannot start persistent runner: {e}") from e
+            Thread(target=self._read, args=(_stdout_lines(self._process),), daemon=True).start()
+        if not self._ready.wait(self.start_timeout):
+            self.close()
+            raise CliClientRunnerUnavailable(f"Persistent runner did not start in {self.start_timeout}s")
+        log.debug(logger, "Persistent runner started.")
+
+    def _read(self, lines: Iterator[str]) -> None:
+        output = []
+        try:
+            for line in lines:
+                line = line[:-1] if line.endswith("\n") else line
+                if line.startswith(self._marker):
+                    fields = line.split()
+                    if fields == [self._marker, "ready"]:
+                        self._ready.set()
+                        output = []
+                        continue
+                    if len(fields) == 3 and fields[0] == self._marker:
+                        with self._lock:
+                            future = self._pending.pop(int(fields[1]), None)
+                        if future is not None:
+                            future.set_result((int(fields[2]), "\n".join(output)))
+                        output = []
+                        continue
+                output.append(line)
+        except Exception as e:
+            log.debug(logger, "Reading persistent runner output failed: %s", e)
+        self._fail()
+
+    def _fail(self) -> None:
+        with self._lock:
+            self._closed = True
+            pending = sorted(self._pending.items())
+            self._pending.clear()
+        for index, (_, future) in enumerate(pending):
+            if index == 0:
+                future.set_exception(CliClientException("Persistent runner exited while executing request"))
+            else:
+                future.set_exception(CliClientRunnerUnavailable("Persistent runner exited before executing request"))
+        if pending:
+            log.debug(logger, "Persistent runner exited with %d pending requests.", len(pending))
+
+    def submit(self, script: str) -> "Future[Tuple[int, str]]":
+        """
+        Send script to shell without waiting for response.
+
+        :param script: Shell command, single line
+        :return: Future of return code and output of script
+        :raises CliClientRunnerUnavailable: when runner is not alive, request was not sent
+        :raises ValueError: when script spans several lines
+        """
+        if "\n" in script:
+            raise ValueError("Script of persistent runner has to be single line")
+        future: Future = Future()
+        with self._lock:
+            if self._process is None or self._closed:
+                raise CliClientRunnerUnavailable("Persistent runner is not running")
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            try:
+                stdin = self._process.stdin_stream
+                stdin.write(f"{request_id}:{script}\n")
+                stdin.flush()
+            except Exception as e:
+                del self._pending[request_id]
+                raise CliClientRunnerUnavailable(f"Cannot send request to persistent runner: {e}") from e
+        return future
+
+    def execute(
+        self, script: str, *, timeout: int = 120, expected_return_codes: Optional[Iterable] = frozenset({0})
+    ) -> "ConnectionCompletedProcess":
+        """
+        Execute script and wait for its result, like execute_command of connection.
+
+        :param script: Shell command, single line
+        :param timeout: Maximum wait time for script to execute, shell is stopped when it expires
+        :param expected_return_codes: Return codes to be considered acceptable, None to accept any
+        :return: Result of script, stderr is merged into stdout
+        :raises CliClientRunnerUnavailable: when runner is not alive, request was not executed
+        :raises CliClientException: when runner exited while executing request
+        :raises TimeoutError: when timeout expired
+        :raises ConnectionCalledProcessError: on unexpected return code
+        """
+        # connection of runner comes from mfd_connect, which is not dependency of this module
+        from mfd_connect.base import ConnectionCompletedProcess
+        from mfd_connect.exceptions import ConnectionCalledProcessError
+
+        future = self.submit(script)
+        try:
+            return_code, output = future.result(timeout)
+        except FutureTimeoutError:
+            # shell is blocked by script, later requests would wait for it
+            self.close()
+            raise TimeoutError(f"Persistent runner did not execute '{script}' in {timeout}s") from None
+        if expected_return_codes is not None and return_code not in expected_return_codes:
+            raise ConnectionCalledProcessError(return_code, script, output=output)
+        return ConnectionCompletedProcess(return_code=return_code, args=script, stdout=output, stderr="")
+
+    def close(self) -> None:
+        """Stop shell, pending requests fail."""
+        with self._lock:
+            process, self._closed = self._process, True
+        if process is None:
+            return
+        try:
+            process.stdin_stream.close()
+            if process.running:
+                process.kill(wait=None)
+        except Exception as e:
+            log.debug(logger, "Stopping persistent runner failed: %s", e)
+        self._fail()
@@ -0,0 +1,438 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Simulated and recorded cli_client transport, without any remote host.
+
+Generators produce synthetic cli_client outputs at arbitrary scale, FakeConnection answers commands
+with outputs of responder, e.g. SimulatedResponder or RecordedResponder replaying outputs captured
+by RecordingConnection.
+"""
+
+import json
+import random
+import re
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from mfd_connect.base import Connection, ConnectionCompletedProcess
+from mfd_typing import OSName, OSType, OSBitness
+from mfd_typing.cpu_values import CPUArchitecture
+
+from .exceptions import CliClientException
+
+SERVER_FINISHED = "server finished responding ======================="
+HEADER = "No IP address specified, defaulting to localhost"
+VSI_SCALES = (16, 256, 4096)
+HOST_SCALES = (4, 16, 64)
+DIRECTIONS = ("ingress", "egress")
+TOOL_EXECUTABLE_NAME = "cli_client"
+DISCARD_OUTPUT = " > /dev/null"
+# Step of script built by CliClient.execute_cli_client_batch
+BATCH_STEP = re.compile(r"(?P<command>.+?); printf '\\n(?P<marker>\S+) %d\\n' \$\?(?:; |$)")
+
+Recording = Dict[str, List[str]]
+
+
+def switch_stats_output(seed: int = 0, traffic_class_count: int = 8, tick: int = 0) -> str:
+    """
+    Generate output of '--query --statistics --switch' command.
+
+    :param seed: Seed of counter values
+    :param traffic_class_count: Number of traffic classes
+    :param tick: Number of steps counters advanced from their seeded values, traffic class N grows by 1000 * (N + 1)
+                 packets per step
+    :return: Synthetic output
+    """
+    rng = random.Random(seed)
+    counters = {
+        direction: [rng.randrange(2**40) + tick * 1000 * (tc + 1) for tc in range(traffic_class_count)]
+        for direction in DIRECTIONS
+    }
+    lines = [HEADER]
+    for direction in DIRECTIONS:
+        packets = sum(counters[direction])
+        lines.append(f"{direction} packet: {packets} bytes: {packets * 64}")
+    for cast in ("unicast", "multicast", "broadcast"):
+        value = rng.randrange(2**32) + tick * 100
+        lines.append(f"{cast} packet: {value} bytes: {value * 64}")
+    for direction in DIRECTIONS:
+        value = rng.randrange(2**20) + tick
+        lines.append(f"{direction} discards packet: {value} bytes: {value * 64}")
+    for direction in DIRECTIONS:
+        for traffic_class, value in enumerate(counters[direction]):
+            lines.append(f"{direction} tc {traffic_class} packet counter: {value}")
+    lines.extend(["", SERVER_FINISHED])
+    return "\n".join(lines)
+
+
+def vsi_stats_output(seed: int = 0, tick: int = 0) -> str:
+    """
+    Generate output of '--query --statistics --vsi' command.
+
+    :param seed: Seed of counter values
+    :param tick: Number of steps counters advanced from their seeded values, by 1000 packets per step,
+                 of which 900 unicast, 60 multicast, 40 broadcast, 5 discards and 1 error
+    :return: Synthetic output
+    """
+    rng = random.Random(seed)
+    growth = {
+        "": 1000,
+        "unicast ": 900,
+        "multicast ": 60,
+        "broadcast ": 40,
+        "discards ": 5,
+        "errors ": 1,
+        "unknown ": 2,
+    }
+    lines = [HEADER]
+    for direction in DIRECTIONS:
+        kinds = ["", "unicast ", "multicast ", "broadcast ", "discards ", "errors "]
+        if direction == "ingress":
+            kinds.append("unknown ")
+        for kind in kinds:
+            value = rng.randrange(2**40) + tick * growth[kind]
+            lines.append(f"{direction} {kind}packet: {value} bytes: {value * 64}")
+    lines.extend(["", SERVER_FINISHED])
+    return "\n".join(lines)
+
+
+def vsi_config_output(vsi_count: int, host_count: int = 4, vfs_per_pf: Optional[int] = None) -> str:
+    """
+    Generate output of '--query --config --verbose' command.
+
+    PF rows are spread evenly across hosts and each PF is followed by its VF rows, as cli_client prints them.
+
+    :param vsi_count: Total number of rows in the table
+    :param host_count: Number of hosts PF rows are spread across
+    :param vfs_per_pf: Number of VF rows printed under each PF, by default VFs fill the table evenly
+    :return: Synthetic output
+    """
+    pf_count = min(host_count, vsi_count)
+    if vfs_per_pf is None:
+        vfs_per_pf = (vsi_count - pf_count) // pf_count
+    lines = [HEADER]
+    rows = 0
+    vsi_id = 1
+    for pf in range(pf_count):
+        flag = "yes" if pf % 2 == 0 else "no"
+        lines.append(
+            f"fn_id: {pf:#x}   host_id: {pf % host_count:#x}   is_vf: no  vsi_id: {vsi_id:#x}   vport_id {pf:#x}   "
+            f"is_created: yes  is_enabled: {flag} mac addr: 00:{vsi_id >> 8 & 0xff:02x}:{vsi_id & 0xff:02x}:00:03:14"
+        )
+        rows += 1
+        vsi_id += 1
+        for vf in range(vfs_per_pf):
+            if rows == vsi_count:
+                break
+            lines.append(
+                f"|->fn_id: {vf:#x}   host_id: {pf % host_count:#x}   is_vf: yes vsi_id: {vsi_id:#x}   vport_id 0x0   "
+                f"is_created: yes  is_enabled: yes mac addr: 00:{vsi_id >> 8 & 0xff:02x}:{vsi_id & 0xff:02x}:00:00:14"
+            )
+            rows += 1
+            vsi_id += 1
+    while rows < vsi_count:
+        lines.append(
+            f"fn_id: {rows:#x}   host_id: {rows % host_count:#x}   is_vf: no  vsi_id: 0x0   vport_id 0x0   "
+            "is_created: no  is_enabled: no mac addr: 00:00:00:00:00:00"
+        )
+        rows += 1
+    lines.extend(["", SERVER_FINISHED])
+    return "\n".join(lines)
+
+
+def qos_vm_info_output(host_count: int = 4, vms_per_host: int = 4, vfs_per_vm: int = 4) -> str:
+    """
+    Generate output of '--query --statistics --vm_qos_info' command.
+
+    :param host_count: Number of hosts, at least 4 as cli_client always reports hosts 0-3
+    :param vms_per_host: Number of VMs on each host
+    :param vfs_per_vm: Number of VFs mapped to each VM
+    :return: Synthetic output
+    """
+    lines = ["===== Host, VM, VF mapping for VMRL  ======", ""]
+    vf_id = 0
+    for host_id in range(host_count):
+        lines.extend([f"HOST ID {host_id}", ""])
+        for vm_id in range(1, vms_per_host + 1):
+            vf_ids = "".join(f" {vf}," for vf in range(vf_id, vf_id + vfs_per_vm))
+            lines.extend([f"        VM ID {vm_id}", f"                VF ID:{vf_ids}"])
+            vf_id += vfs_per_vm
+    lines.extend(["", SERVER_FINISHED])
+    return "\n".join(lines)
+
+
+def command_succeeded_output() -> str:
+    """
+    Generate output of successful modifying command.
+
+    :return: Synthetic output
+    """
+    return "\n".join([HEADER, "Command Succeeded", "", SERVER_FINISHED])
+
+
+def tool_arguments(command: str) -> str:
+    """
+    Strip cli_client executable (with its directory) from command.
+
+    :param command: Command executed on connection
+    :return: Arguments passed to cli_client, command unchanged if it does not start with cli_client
+    """
+    executable, _, arguments = command.partition(" ")
+    return arguments if executable.endswith(TOOL_EXECUTABLE_NAME) else command
+
+
+class SimulatedResponder:
+    """
+    Responder simulating CP with synthetic outputs.
+
+    Statistics counters advance with every query of the same switch or VSI, so consecutive queries show traffic.
+    Counters of VSI N are seeded with N and advance by N % 5 ticks per query, so some VSIs are idle.
+    """
+
+    def __init__(self, vsi_count: int = VSI_SCALES[0], host_count: int = HOST_SCALES[0]) -> None:
+        """
+        Initialize responder.
+
+        :param vsi_count: Number of rows in VSI table
+        :param host_count: Number of hosts in VSI table and QoS VM info
+        """
+        self._outputs = {
+            "--query --config --verbose": vsi_config_output(vsi_count, host_count),
+            "--query --statistics --vm_qos_info": qos_vm_info_output(host_count),
+        }
+        self._counters: Dict[str, Callable[[int, int], str]] = {
+            "--query --statistics --switch": lambda switch_id, tick: switch_stats_output(switch_id, tick=tick),
+            "--query --statistics --vsi": lambda vsi_id, tick: vsi_stats_output(vsi_id, tick=tick * (vsi_id % 5)),
+        }
+        self._ticks: Dict[str, int] = {}
+        self._succeeded = command_succeeded_output()
+
+    def __call__(self, command: str) -> str:
+        """
+        Get output of command.
+
+        :param command: Executed command
+        :return: Synthetic output, 'Command Succeeded' for commands which are not queries
+        """
+        for query, output in self._outputs.items():
+            if query in command:
+                return output
+        for query, generate in self._counters.items():
+            if query in command:
+                arguments = tool_arguments(command)
+                self._ticks[arguments] = tick = self._ticks.get(arguments, 0) + 1
+                try:
+                    object_id = int(arguments.rsplit(" ", 1)[-1], 0)
+                except ValueError:
+                    object_id = 0
+                return generate(object_id, tick)
+        return self._succeeded
+
+
+class RecordedResponder:
+    """
+    Responder replaying recorded outputs.
+
+    Outputs recorded for the same cli_client arguments are replayed in order, the last one is repeated.
+    """
+
+    def __init__(self, recording: Recording) -> None:
+        """
+        Initialize responder.
+
+        :param recording: Outputs by cli_client arguments, e.g. loaded with load_recording()
+        """
+        self._recording = {arguments: list(outputs) for arguments, outputs in recording.items() if outputs}
+        self._positions = dict.fromkeys(self._recording, 0)
+
+    def __call__(self, command: str) -> str:
+        """
+        Get output of command.
+
+        :param command: Executed command
+        :return: Next recorded output, empty for availability check
+        :raises CliClientException: when nothing was recorded for command
+        """
+        arguments = tool_arguments(command)
+        outputs = self._recording.get(arguments)
+        if outputs is None:
+            if arguments == "-h":
+                return ""
+            raise CliClientException(f"No recorded output for command: {arguments}")
+        position = self._positions[arguments]
+        self._positions[arguments] = min(position + 1, len(outputs) - 1)
+        return outputs[position]
+
+
+def load_recording(path: Union[Path, str]) -> Recording:
+    """
+    Load recording stored by save_recording().
+
+    :param path: Path of JSON file
+    :return: Outputs by cli_client arguments
+    :raises CliClientException: on malformed recording
+    """
+    recording = json.loads(Path(path).read_text())
+    if not isinstance(recording, dict) or not all(isinstance(outputs, list) for outputs in recording.values()):
+        raise CliClientException(f"Malformed recording {path}, expected lists of outputs by command.")
+    return recording
+
+
+def save_recording(recording: Recording, path: Union[Path, str]) -> None:
+    """
+    Store recording as JSON file.
+
+    :param recording: Outputs by cli_client arguments
+    :param path: Path of JSON file
+    """
+    Path(path).write_text(json.dumps(recording, indent=2) + "\n")
+
+
+class FakeConnection(Connection):
+    """
+    Connection returning output produced by responder for every executed command.
+
+    Batch scripts of CliClient.execute_cli_client_batch are split and every command is answered by responder.
+    """
+
+    def __init__(self, responder: Callable[[str], str]) -> None:
+        """
+        Initialize fake connection.
+
+        :param responder: Callable returning stdout for passed command
+        """
+        super().__init__()
+        self._responder = responder
+        self.executed_commands: List[str] = []
+        self.transferred_bytes = 0
+
+    def execute_command(
+        self, command: str, *, expected_return_codes: Iterable | None = frozenset({0}), **kwargs
+    ) -> ConnectionCompletedProcess:
+        """
+        Record command and return canned output.
+
+        :param command: Command to execute
+        :param expected_return_codes: Ignored, fake commands always succeed
+        :return: Completed process with canned output
+        """
+        self.executed_commands.append(command)
+        if kwargs.get("shell") and BATCH_STEP.match(command):
+            stdout = self._execute_batch(command)
+        else:
+            stdout = self._responder(command)
+        self.transferred_bytes += len(stdout)
+        return ConnectionCompletedProcess(args=command, stdout=stdout, stderr="", return_code=0)
+
+    def _execute_batch(self, script: str) -> str:
+        """
+        Answer every command of batch script, as shell on the CP would.
+
+        :param script: Batch script
+        :return: Outputs of commands followed by return code markers
+        """
+        outputs = []
+        for step in BATCH_STEP.finditer(script):
+            command = step["command"]
+            output = self._responder(command.removesuffix(DISCARD_OUTPUT))
+            outputs.append(f"{'' if command.endswith(DISCARD_OUTPUT) else output}\n{step['marker']} 0\n")
+        return "".join(outputs)
+
+    def get_os_type(self) -> OSType:
+        """Get os type."""
+        return OSType.POSIX
+
+    def get_os_name(self) -> OSName:
+        """Get os name."""
+        return OSName.LINUX
+
+    def get_os_bitness(self) -> OSBitness:
+        """Get os bitness."""
+        return OSBitness.OS_64BIT
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        """Get cpu architecture."""
+        return CPUArchitecture.X86_64
+
+    def restart_platform(self) -> None:
+        """Not supported by fake connection."""
+        raise NotImplementedError
+
+    def shutdown_platform(self) -> None:
+        """Not supported by fake connection."""
+        raise NotImplementedError
+
+    def wait_for_host(self, timeout: int = 60) -> None:
+        """Fake host is always available."""
+
+    @property
+    def path(self) -> type[PurePosixPath]:
+        """Path class of fake host."""
+        return PurePosixPath
+
+    def disconnect(self) -> None:
+        """Nothing to disconnect."""
+
+    def start_process(self, command: str, **kwargs) -> None:
+        """Not supported by fake connection."""
+        raise NotImplementedError
+
+    def start_processes(self, command: str, **kwargs) -> None:
+        """Not supported by fake connection."""
+        raise NotImplementedError
+
+    def modules(self) -> None:
+        """Not supported by fake connection."""
+        raise NotImplementedError
+
+
+class RecordingConnection(FakeConnection):
+    """Connection executing commands on another connection and recording their outputs for RecordedResponder."""
+
+    def __init__(self, connection: Connection) -> None:
+        """
+        Initialize recording connection.
+
+        :param connection: Connection commands are executed on
+        """
+        super().__init__(responder=lambda command: "")  # outputs come from wrapped connection
+        self._connection = connection
+        self.recording: Recording = {}
+
+    def execute_command(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """
+        Execute command on wrapped connection and record its output.
+
+        :param command: Command to execute
+        :return: Completed process of wrapped connection
+        """
+        result = self._connection.execute_command(command, **kwargs)
+        self.executed_commands.append(command)
+        self.transferred_bytes += len(result.stdout)
+        self.recording.setdefault(tool_arguments(command), []).append(result.stdout)
+        return result
+
+    def get_os_type(self) -> OSType:
+        """Get os type of wrapped connection."""
+        return self._connection.get_os_type()
+
+    def get_os_name(self) -> OSName:
+        """Get os name of wrapped connection."""
+        return self._connection.get_os_name()
+
+    def get_os_bitness(self) -> OSBitness:
+        """Get os bitness of wrapped connection."""
+        return self._connection.get_os_bitness()
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        """Get cpu architecture of wrapped connection."""
+        return self._connection.get_cpu_architecture()
+
+    @property
+    def path(self) -> type[PurePosixPath]:
+        """Path class of wrapped connection."""
+        return self._connection.path
+
+    def disconnect(self) -> None:
+        """Disconnect wrapped connection."""
+        self._connection.disconnect()
@@ -0,0 +1,212 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for data structures of command line interface client, importable without heavy dependencies."""
+
+import typing
+from array import array
+from dataclasses import dataclass, field
+from enum import IntEnum
+from time import monotonic, time
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+if typing.TYPE_CHECKING:
+    from mfd_typing import MACAddress
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class AcquisitionWindow:
+    """
+    Structure for bounds of time counters were read on the CP.
+
+    started/finished - monotonic time before and after real query (network latency included),
+    wall_started/wall_finished - the same as wall-clock time.
+    """
+
+    started: float
+    finished: float
+    wall_started: float
+    wall_finished: float
+
+    @property
+    def midpoint(self) -> float:
+        """Monotonic time in the middle of window, best estimate of time counters were read."""
+        return (self.started + self.finished) / 2
+
+    @property
+    def duration(self) -> float:
+        """Length of window in seconds."""
+        return self.finished - self.started
+
+    @staticmethod
+    def measure(query: Callable[[], T]) -> Tuple[T, "AcquisitionWindow"]:
+        """
+        Run query and measure its window.
+
+        :param query: Function executing real query
+        :return: Result of query and its window
+        """
+        started, wall_started = monotonic(), time()
+        result = query()
+        return result, AcquisitionWindow(started, monotonic(), wall_started, time())
+
+
+@dataclass
+class FlowStats:
+    """Structure for single direction statistics."""
+
+    traffic_class_counters: List[int]
+    packet: int
+    discards: int
+
+
+@dataclass
+class SwitchStats:
+    """Structure for both directions statistics, window - bounds of time stats were read (not compared)."""
+
+    egress: FlowStats
+    ingress: FlowStats
+    unicast_packet: int
+    multicast_packet: int
+    broadcast_packet: int
+    window: Optional[AcquisitionWindow] = field(default=None, compare=False)
+
+
+@dataclass
+class VSIFlowStats:
+    """Structure for VSI statistics."""
+
+    packet: int
+    unicast_packet: int
+    multicast_packet: int
+    broadcast_packet: int
+    discards_packet: int
+    errors_packet: int
+    unknown_packet: int | None = None
+
+
+@dataclass
+class VSIStats:
+    """Structure for both directions VSI statistics, window - bounds of time stats were read (not compared)."""
+
+    ingress: VSIFlowStats
+    egress: VSIFlowStats
+    window: Optional[AcquisitionWindow] = field(default=None, compare=False)
+
+
+@dataclass
+class TrafficClassCounters:
+    """Structure for both directions Traffic Classes Counter."""
+
+    tx: List[int]
+    rx: List[int]
+
+
+class SwitchStatsSnapshot:
+    """
+    Switch stats of one acquisition with views derived from them, so derived values never query CP again.
+
+    Per-TC counters are kept in fixed-width unsigned 64-bit arrays, which support buffer protocol,
+    e.g. numpy.frombuffer(snapshot.ingress_tc, dtype=numpy.uint64) works without copying.
+    """
+
+    __slots__ = ("switch_id", "stats", "ingress_tc", "egress_tc")
+
+    def __init__(self, switch_id: int, stats: SwitchStats) -> None:
+        """
+        Create snapshot.
+
+        :param switch_id: switch ID
+        :param stats: Stats of switch
+        """
+        self.switch_id = switch_id
+        self.stats = stats
+        self.ingress_tc = array("Q", stats.ingress.traffic_class_counters)
+        self.egress_tc = array("Q", stats.egress.traffic_class_counters)
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """Wall-clock time stats were received, end of their acquisition window."""
+        window = self.stats.window
+        return None if window is None else window.wall_finished
+
+    def tc_priorities(self) -> TrafficClassCounters:
+        """Get Traffic Class counters of both directions."""
+        return TrafficClassCounters(tx=self.egress_tc.tolist(), rx=self.ingress_tc.tolist())
+
+    def totals(self) -> Dict[str, int]:
+        """Get packets of ingress, egress and both directions."""
+        ingress, egress = self.stats.ingress.packet, self.stats.egress.packet
+        return {"ingress": ingress, "egress": egress, "all": ingress + egress}
+
+    def tc_shares(self, direction: str = "ingress") -> List[Optional[float]]:
+        """
+        Get share of every Traffic Class in packets of direction.
+
+        :param direction: 'ingress' or 'egress'
+        :return: Shares between 0 and 1, None when direction has no TC packets
+        """
+        counters = self.ingress_tc if direction == "ingress" else self.egress_tc
+        total = sum(counters)
+        return [counter / total if total else None for counter in counters]
+
+    def casting_ratios(self) -> Dict[str, Optional[float]]:
+        """Get share of unicast, multicast and broadcast packets, None when no packets were counted."""
+        counters = {
+            "unicast": self.stats.unicast_packet,
+            "multicast": self.stats.multicast_packet,
+            "broadcast": self.stats.broadcast_packet,
+        }
+        total = sum(counters.values())
+        return {cast: counter / total if total else None for cast, counter in counters.items()}
+
+
+@dataclass
+class VsiListEntry:
+    """Structure for an entry in VSI list containing VSI ID and MAC address."""
+
+    vsi_id: int
+    mac: "MACAddress"
+
+
+@dataclass
+class VsiConfigListEntry:
+    """Structure for an entry in VSI Config list containing all fields."""
+
+    fn_id: int
+    host_id: int
+    is_vf: bool
+    vsi_id: int
+    vport_id: int
+    is_created: bool
+    is_enabled: bool
+    mac: "MACAddress"
+
+
+@dataclass
+class ExecutionStats:
+    """Counters of cli_client executions requested through CliClient."""
+
+    executions: int = 0
+    coalesced: int = 0
+    throttled_time: float = 0.0
+    compressed_executions: int = 0
+    compressed_bytes: int = 0
+    decompressed_bytes: int = 0
+    compression_time_saved: float = 0.0
+    timeouts: int = 0
+    rejected: int = 0
+    runner_executions: int = 0
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """Ratio of decompressed to transferred size of compressed outputs, None if nothing was compressed."""
+        return self.decompressed_bytes / self.compressed_bytes if self.compressed_bytes else None
+
+
+class LinkStatus(IntEnum):
+    """Link Status enum represents link state."""
+
+    DOWN = 0
+    UP = 1
@@ -0,0 +1,242 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for adaptive timeouts learned from observed latency and fast-fail circuit breaker."""
+
+import logging
+import math
+import subprocess
+import sys
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Optional, Set
+
+from . import log
+from .compression import CompressionPolicy
+from .exceptions import CliClientCircuitOpen
+from .quantile import P2Quantile
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+TIMEOUT_ERRORS = (TimeoutError, FutureTimeoutError, subprocess.TimeoutExpired)
+
+
+def is_timeout(error: BaseException) -> bool:
+    """
+    Check if execution failed because its timeout expired.
+
+    Connections raise TimeoutError, subprocess.TimeoutExpired or RemoteProcessTimeoutExpired of mfd_connect,
+    which is recognized without importing mfd_connect: it can be raised only when its module was imported.
+
+    :param error: Exception raised by execution
+    :return: True for timeout
+    """
+    if isinstance(error, TIMEOUT_ERRORS):
+        return True
+    connect_exceptions = sys.modules.get("mfd_connect.exceptions")
+    return connect_exceptions is not None and isinstance(error, connect_exceptions.RemoteProcessTimeoutExpired)
+
+
+class AdaptiveTimeout:
+    """
+    Timeouts learned per command type from latency of successful executions.
+
+    Timeout of command type is quantile of its latency times factor plus margin, never below minimum nor above
+    ceiling passed by caller (e.g. 120 s default of execute_cli_client_command). Until min_samples latencies of
+    command type are observed, the ceiling is used. Latency of batch is learned per its command, so timeout of batch
+    scales with number of its commands.
+
+    Timeout is a censored sample: latency was at least the timeout, so it is learned as timeout times factor,
+    and the next execution of command type gets the ceiling, so latency which rose above learned timeout is
+    observed and learned instead of timing out again.
+    """
+
+    def __init__(
+        self,
+        *,
+        quantile: float = 0.99,
+        factor: float = 2.0,
+        margin: float = 1.0,
+        minimum: int = 5,
+        min_samples: int = 20,
+    ) -> None:
+        """
+        Initialize adaptive timeouts.
+
+        :param quantile: Quantile of latency timeout is based on
+        :param factor: Multiplier of latency quantile
+        :param margin: Seconds added to multiplied latency quantile
+        :param minimum: Lowest timeout in seconds
+        :param min_samples: Number of observed latencies of command type before its timeout is learned
+        """
+        self.quantile = quantile
+        self.factor = factor
+        self.margin = margin
+        self.minimum = minimum
+        self.min_samples = min_samples
+        self._lock = Lock()
+        self._latencies: Dict[str, P2Quantile] = {}
+        self._samples: Dict[str, int] = {}
+        self._timed_out: Set[str] = set()
+
+    @staticmethod
+    def command_type(command: str) -> str:
+        """
+        Get command type, so e.g. statistics of different VSIs share learned latency.
+
+        :param command: Command passed to command line interface client tool
+        :return: Flags of command without values
+        """
+        return CompressionPolicy.command_type(command)
+
+    def record(self, command: str, duration: float, count: int = 1) -> None:
+        """
+        Learn latency of successful execution.
+
+        :param command: Command passed to command line interface client tool
+        :param duration: Duration of execution in seconds
+        :param count: Number of commands executed in batch
+        """
+        key = self.command_type(command)
+        with self._lock:
+            self._add(key, duration / count)
+            self._timed_out.discard(key)
+
+    def record_timeout(self, command: str, timeout: float, count: int = 1) -> None:
+        """
+        Learn that execution timed out, so its latency was at least timeout.
+
+        :param command: Command passed to command line interface client tool
+        :param timeout: Timeout of execution in seconds
+        :param count: Number of commands executed in batch
+        """
+        key = self.command_type(command)
+        with self._lock:
+            self._add(key, timeout * self.factor / count)
+            self._timed_out.add(key)
+
+    def _add(self, key: str, latency: float) -> None:
+        """
+        Add latency sample of command type, lock has to be held.
+
+        :param key: Command type
+        :param latency: Latency per command in seconds
+        """
+        quantile = self._latencies.get(key)
+        if quantile is None:
+            quantile = self._latencies[key] = P2Quantile(self.quantile)
+        quantile.add(latency)
+        self._samples[key] = self._samples.get(key, 0) + 1
+
+    def learned(self, command: str) -> Optional[float]:
+        """
+        Get learned latency quantile of command type.
+
+        :param command: Command passed to command line interface client tool
+        :return: Latency in seconds per command, None until min_samples were observed
+        """
+        key = self.command_type(command)
+        with self._lock:
+            if self._samples.get(key, 0) < self.min_samples:
+                return None
+            return self._latencies[key].value
+
+    def timeout(self, command: str, ceiling: int, count: int = 1) -> int:
+        """
+        Get timeout of execution.
+
+        :param command: Command passed to command line interface client tool
+        :param ceiling: Timeout requested by caller, used while latency is not learned yet
+        :param count: Number of commands executed in batch
+        :return: Timeout in seconds, ceiling after timeout of command type until its next success
+        """
+        with self._lock:
+            if self.command_type(command) in self._timed_out:
+                return ceiling
+        latency = self.learned(command)
+        if latency is None:
+            return ceiling
+        return min(ceiling, max(self.minimum, math.ceil(latency * count * self.factor + self.margin)))
+
+
+class CircuitBreaker:
+    """
+    Stop sending commands to CP after repeated timeouts.
+
+    After failure_threshold consecutive timeouts circuit opens and every execution fails fast with
+    CliClientCircuitOpen. After reset_timeout seconds one trial execution is let through (half-open):
+    its success closes the circuit, its timeout opens it again. Executions failed for other reasons than timeout
+    prove that CP responds, so they count as success.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 3, reset_timeout: float = 30.0, *, clock: Callable[[], float] = monotonic
+    ) -> None:
+        """
+        Initialize circuit breaker.
+
+        :param failure_threshold: Number of consecutive timeouts which opens circuit
+        :param reset_timeout: Seconds after which open circuit lets trial execution through
+        :param clock: Monotonic clock in seconds
+        :raises ValueError: if failure_threshold is not positive
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"Failure threshold must be positive, got {failure_threshold}")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        """CLOSED, OPEN or HALF_OPEN."""
+        with self._lock:
+            if self._opened_at is None:
+                return CLOSED
+            if self._trial or self._clock() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return OPEN
+
+    def before_call(self) -> None:
+        """
+        Check if execution may be sent.
+
+        :raises CliClientCircuitOpen: when circuit is open or trial execution is in progress
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_timeout - (self._clock() - self._opened_at)
+            if remaining > 0 or self._trial:
+                raise CliClientCircuitOpen(
+                    f"Circuit open after {self._failures} consecutive timeouts, "
+                    f"next trial in {max(remaining, 0):.1f}s"
+                )
+            self._trial = True
+
+    def record_success(self) -> None:
+        """Close circuit after successful execution."""
+        with self._lock:
+            if self._opened_at is not None:
+                log.debug(logger, "Circuit closed, CP responds again.")
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_timeout(self) -> None:
+        """Count timeout, opening circuit after failure_threshold consecutive timeouts or failed trial."""
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._trial:
+                    log.debug(logger, "Circuit opened after %d consecutive timeouts.", self._failures)
+                self._opened_at = self._clock()
+                self._trial = False
@@ -0,0 +1,302 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for compact representation of VSI config table."""
+
+import operator
+import typing
+from array import array
+from collections.abc import MutableSequence, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .structures import VsiConfigListEntry
+
+IS_VF = 0x1
+IS_CREATED = 0x2
+IS_ENABLED = 0x4
+
+VsiConfigRow = Tuple[int, int, bool, int, int, bool, bool, int]
+
+
+def mac_to_int(mac: str) -> int:
+    """
+    Convert MAC address as printed by cli_client (e.g. 0:0:0:0:3:14, 00-01-00-00-03-14) to 48-bit int.
+
+    :param mac: MAC address
+    :return: MAC address as int
+    :raises ValueError: on malformed MAC address
+    """
+    groups = mac.replace("-", ":").replace("|", ":").strip(":").split(":")
+    if len(groups) == 1:
+        value = int(groups[0], 16)
+    elif len(groups) == 6 and all(0 < len(group) <= 2 for group in groups):
+        value = int("".join(group.zfill(2) for group in groups), 16)
+    else:
+        raise ValueError(f"{mac} is not a correct MAC 48b format")
+    if value >= 1 << 48:
+        raise ValueError(f"{mac} is not a correct MAC 48b format")
+    return value
+
+
+def entry_from_row(row: VsiConfigRow) -> VsiConfigListEntry:
+    """
+    Create VSI config list entry from row tuple.
+
+    :param row: Row as returned by VsiConfigTable.row()
+    :return: VSI config list entry
+    """
+    from mfd_typing import MACAddress  # loaded on first access to entries, not on import
+
+    fn_id, host_id, is_vf, vsi_id, vport_id, is_created, is_enabled, mac = row
+    return VsiConfigListEntry(fn_id, host_id, is_vf, vsi_id, vport_id, is_created, is_enabled, MACAddress(mac))
+
+
+def _pack_flags(is_vf: bool, is_created: bool, is_enabled: bool) -> int:
+    """
+    Pack flags of row into one byte.
+
+    :param is_vf: Whether function is VF
+    :param is_created: Whether VSI is created
+    :param is_enabled: Whether VSI is enabled
+    :return: Flags byte
+    """
+    return (IS_VF if is_vf else 0) | (IS_CREATED if is_created else 0) | (IS_ENABLED if is_enabled else 0)
+
+
+class VsiConfigTable(MutableSequence):
+    """
+    VSI config table stored column-wise.
+
+    IDs are kept in typed arrays, flags packed into one byte per row and MAC addresses as 48-bit ints, so no objects
+    are created per row. VsiConfigListEntry (with MACAddress) is created only when row is accessed, so the table
+    can be used as list of VsiConfigListEntry: iterated, indexed, compared with list and modified like list
+    (item and slice assignment, del, append, insert, extend, pop, remove, reverse, sort, copy), entries written
+    to the table are stored in columns, so later changes of written entry objects do not change the table.
+    append_row() appends row from plain values, without creating entry.
+    """
+
+    __slots__ = ("fn_ids", "host_ids", "vsi_ids", "vport_ids", "flags", "macs")
+
+    def __init__(self) -> None:
+        """Initialize empty table."""
+        self.fn_ids = array("I")
+        self.host_ids = array("I")
+        self.vsi_ids = array("I")
+        self.vport_ids = array("I")
+        self.flags = bytearray()
+        self.macs = array("Q")
+
+    def append_row(
+        self,
+        fn_id: int,
+        host_id: int,
+        is_vf: bool,
+        vsi_id: int,
+        vport_id: int,
+        is_created: bool,
+        is_enabled: bool,
+        mac: int,
+    ) -> None:
+        """
+        Append row.
+
+        :param fn_id: Function ID
+        :param host_id: Host ID
+        :param is_vf: Whether function is VF
+        :param vsi_id: VSI ID
+        :param vport_id: Vport ID
+        :param is_created: Whether VSI is created
+        :param is_enabled: Whether VSI is enabled
+        :param mac: MAC address as 48-bit int
+        """
+        self.fn_ids.append(fn_id)
+        self.host_ids.append(host_id)
+        self.vsi_ids.append(vsi_id)
+        self.vport_ids.append(vport_id)
+        self.flags.append(_pack_flags(is_vf, is_created, is_enabled))
+        self.macs.append(mac)
+
+    @staticmethod
+    def from_entries(entries: typing.Iterable[VsiConfigListEntry]) -> "VsiConfigTable":
+        """
+        Create table from VSI config list entries.
+
+        :param entries: VSI config list entries
+        :return: Table
+        """
+        table = VsiConfigTable()
+        table.extend(entries)
+        return table
+
+    @staticmethod
+    def _columns_of(entry: VsiConfigListEntry) -> Tuple[int, int, int, int, int, int]:
+        """
+        Convert entry to values of columns.
+
+        :param entry: VSI config list entry
+        :return: Values in order of columns (__slots__)
+        """
+        return (
+            entry.fn_id,
+            entry.host_id,
+            entry.vsi_id,
+            entry.vport_id,
+            _pack_flags(entry.is_vf, entry.is_created, entry.is_enabled),
+            int(entry.mac),
+        )
+
+    def created_vsis(self, vsi_ids: typing.Optional[typing.Collection[int]] = None) -> Dict[int, Tuple[int, int, bool]]:
+        """
+        Get created VSIs, e.g. to query their statistics.
+
+        :param vsi_ids: Return only these VSIs, all created VSIs by default
+        :return: host_id, fn_id and is_vf by VSI ID, VSI 0 (not assigned) is skipped
+        """
+        vsis = {}
+        for host_id, fn_id, vsi_id, flags in zip(self.host_ids, self.fn_ids, self.vsi_ids, self.flags):
+            if vsi_id and flags & IS_CREATED and (vsi_ids is None or vsi_id in vsi_ids):
+                vsis[vsi_id] = (host_id, fn_id, bool(flags & IS_VF))
+        return vsis
+
+    def row(self, index: int) -> VsiConfigRow:
+        """
+        Get row as plain tuple, without creating VsiConfigListEntry and MACAddress.
+
+        :param index: Index of row
+        :return: (fn_id, host_id, is_vf, vsi_id, vport_id, is_created, is_enabled, mac as int)
+        """
+        flags = self.flags[index]
+        return (
+            self.fn_ids[index],
+            self.host_ids[index],
+            bool(flags & IS_VF),
+            self.vsi_ids[index],
+            self.vport_ids[index],
+            bool(flags & IS_CREATED),
+            bool(flags & IS_ENABLED),
+            self.macs[index],
+        )
+
+    def rows(self) -> Iterator[VsiConfigRow]:
+        """
+        Iterate over rows as plain tuples.
+
+        :return: Iterator of rows, see row()
+        """
+        return map(self.row, range(len(self)))
+
+    def _entry(self, index: int) -> VsiConfigListEntry:
+        """
+        Create view of row.
+
+        :param index: Index of row
+        :return: VSI config list entry
+        """
+        return entry_from_row(self.row(index))
+
+    def _index(self, index: int) -> int:
+        """
+        Normalize index of row.
+
+        :param index: Index of row, negative from the end
+        :return: Non-negative index
+        :raises IndexError: when index is out of range
+        """
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("VsiConfigTable index out of range")
+        return index
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[VsiConfigListEntry, List[VsiConfigListEntry]]:
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        return self._entry(self._index(index))
+
+    def __setitem__(
+        self, index: Union[int, slice], value: Union[VsiConfigListEntry, Iterable[VsiConfigListEntry]]
+    ) -> None:
+        if isinstance(index, slice):
+            rows = [self._columns_of(entry) for entry in value]
+            columns = list(zip(*rows)) if rows else [()] * len(self.__slots__)
+            for name, values in zip(self.__slots__, columns):
+                column = getattr(self, name)
+                # all columns have equal length, so invalid extended slice fails on the first one
+                column[index] = array(column.typecode, values) if isinstance(column, array) else bytearray(values)
+            return
+        index = self._index(index)
+        for name, column_value in zip(self.__slots__, self._columns_of(value)):
+            getattr(self, name)[index] = column_value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if not isinstance(index, slice):
+            index = self._index(index)
+        for name in self.__slots__:
+            del getattr(self, name)[index]
+
+    def insert(self, index: int, value: VsiConfigListEntry) -> None:
+        """
+        Insert entry before index, like insert of list.
+
+        :param index: Index of row to insert before
+        :param value: VSI config list entry
+        """
+        for name, column_value in zip(self.__slots__, self._columns_of(value)):
+            getattr(self, name).insert(index, column_value)
+
+    def reverse(self) -> None:
+        """Reverse rows in place."""
+        for name in self.__slots__:
+            getattr(self, name).reverse()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        del self[:]
+
+    def sort(self, *, key: Optional[Callable[[VsiConfigListEntry], Any]] = None, reverse: bool = False) -> None:
+        """
+        Sort rows in place, like sort of list.
+
+        :param key: Function of entry to sort by
+        :param reverse: Sort in descending order
+        """
+        entries = list(self)
+        entries.sort(key=key, reverse=reverse)
+        self[:] = entries
+
+    def copy(self) -> "VsiConfigTable":
+        """
+        Get shallow copy of table, columns are copied without creating entries.
+
+        :return: New table with the same rows
+        """
+        table = VsiConfigTable()
+        for name in self.__slots__:
+            setattr(table, name, getattr(self, name)[:])
+        return table
+
+    def __iter__(self) -> Iterator[VsiConfigListEntry]:
+        return map(self._entry, range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, VsiConfigTable):
+            return all(getattr(self, column) == getattr(other, column) for column in self.__slots__)
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(entry == other_entry for entry, other_entry in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.to_list())
+
+    def to_list(self) -> List[VsiConfigListEntry]:
+        """
+        Get table as list of VSI config list entries.
+
+        :return: list with entries from VSI list containing all fields
+        """
+        return list(self)
@@ -0,0 +1,201 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for watching changes in VSI config table."""
+
+import logging
+import typing
+from dataclasses import dataclass, field
+from enum import Enum
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from . import log
+from .vsi_table import VsiConfigRow, VsiConfigTable, entry_from_row
+
+if typing.TYPE_CHECKING:
+    from .base import CliClient, VsiConfigListEntry
+
+logger = logging.getLogger(__name__)
+
+# Fields compared between snapshots and their positions in VsiConfigTable rows
+WATCHED_FIELDS: Dict[str, int] = {"vsi_id": 3, "vport_id": 4, "is_created": 5, "is_enabled": 6, "mac": 7}
+
+
+class VsiKey(NamedTuple):
+    """Key identifying function in VSI config table."""
+
+    host_id: int
+    fn_id: int
+    is_vf: bool
+
+
+class VsiChangeType(Enum):
+    """Type of change in VSI config table."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+@dataclass(frozen=True)
+class VsiChangeEvent:
+    """
+    Structure for change of single function in VSI config table.
+
+    entry is None for removed function, previous is None for added one.
+    changes maps name of changed field to (old value, new value), it is filled only for CHANGED events.
+    """
+
+    type: VsiChangeType
+    key: VsiKey
+    entry: Optional["VsiConfigListEntry"]
+    previous: Optional["VsiConfigListEntry"]
+    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+    timestamp: float = 0.0
+
+
+def _index_rows(table: Union[VsiConfigTable, Iterable["VsiConfigListEntry"]]) -> Dict[VsiKey, VsiConfigRow]:
+    """
+    Index rows of table by key.
+
+    :param table: VSI config table or list of VSI config list entries
+    :return: Rows by key, last row wins for duplicated keys
+    """
+    if not isinstance(table, VsiConfigTable):
+        table = VsiConfigTable.from_entries(table)
+    return {VsiKey(row[1], row[0], row[2]): row for row in table.rows()}
+
+
+def _diff_rows(
+    previous: Dict[VsiKey, VsiConfigRow], current: Dict[VsiKey, VsiConfigRow], timestamp: float
+) -> List[VsiChangeEvent]:
+    """
+    Compute keyed diff of indexed rows in O(n).
+
+    :param previous: Previous rows by key
+    :param current: Current rows by key
+    :param timestamp: Timestamp of events
+    :return: Change events, ordered as rows in current table, removed functions at the end
+    """
+    events = []
+    for key, row in current.items():
+        old_row = previous.get(key)
+        if old_row is None:
+            events.append(VsiChangeEvent(VsiChangeType.ADDED, key, entry_from_row(row), None, timestamp=timestamp))
+        elif old_row != row:
+            old_entry, entry = entry_from_row(old_row), entry_from_row(row)
+            changes = {
+                name: (getattr(old_entry, name), getattr(entry, name))
+                for name, position in WATCHED_FIELDS.items()
+                if old_row[position] != row[position]
+            }
+            events.append(VsiChangeEvent(VsiChangeType.CHANGED, key, entry, old_entry, changes, timestamp))
+    for key, old_row in previous.items():
+        if key not in current:
+            previous_entry = entry_from_row(old_row)
+            events.append(VsiChangeEvent(VsiChangeType.REMOVED, key, None, previous_entry, timestamp=timestamp))
+    return events
+
+
+def diff_vsi_tables(
+    previous: Union[VsiConfigTable, Iterable["VsiConfigListEntry"]],
+    current: Union[VsiConfigTable, Iterable["VsiConfigListEntry"]],
+) -> List[VsiChangeEvent]:
+    """
+    Compute diff of two VSI config tables.
+
+    Functions are matched by (host_id, fn_id, is_vf), changes of vsi_id, vport_id, is_created, is_enabled and mac
+    are reported.
+
+    :param previous: Previous VSI config table or list of VSI config list entries
+    :param current: Current VSI config table or list of VSI config list entries
+    :return: Change events
+    """
+    return _diff_rows(_index_rows(previous), _index_rows(current), monotonic())
+
+
+class VsiTableWatcher:
+    """
+    Watch VSI config table of CliClient for changes.
+
+    Watcher keeps previous snapshot indexed by key and on each refresh computes diff in O(n).
+    Change events are delivered to subscribed callbacks and returned from refresh() or yielded from watch().
+    """
+
+    def __init__(self, client: "CliClient", *, report_initial: bool = False) -> None:
+        """
+        Initialize watcher.
+
+        :param client: CliClient used to query VSI config table
+        :param report_initial: Whether first refresh should report all functions as added,
+                               by default it only stores snapshot
+        """
+        self.client = client
+        self.report_initial = report_initial
+        self._snapshot: Optional[Dict[VsiKey, VsiConfigRow]] = None
+        self._callbacks: List[Callable[[VsiChangeEvent], None]] = []
+
+    def subscribe(self, callback: Callable[[VsiChangeEvent], None]) -> None:
+        """
+        Subscribe callback to change events.
+
+        :param callback: Callable called with each change event
+        """
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[VsiChangeEvent], None]) -> None:
+        """
+        Unsubscribe callback from change events.
+
+        :param callback: Previously subscribed callable
+        """
+        self._callbacks.remove(callback)
+
+    def reset(self) -> None:
+        """Forget previous snapshot, next refresh starts watching from scratch."""
+        self._snapshot = None
+
+    def update(self, table: Union[VsiConfigTable, Iterable["VsiConfigListEntry"]]) -> List[VsiChangeEvent]:
+        """
+        Compare table with previous snapshot and store it as new snapshot.
+
+        :param table: VSI config table or list of VSI config list entries, e.g. obtained elsewhere
+        :return: Change events
+        """
+        timestamp = monotonic()
+        current = _index_rows(table)
+        previous = self._snapshot
+        self._snapshot = current
+        if previous is None and not self.report_initial:
+            return []
+        events = _diff_rows(previous or {}, current, timestamp)
+        if events:
+            log.debug(logger, "Detected %d change(s) in VSI config table.", len(events))
+        for event in events:
+            for callback in self._callbacks:
+                callback(event)
+        return events
+
+    def refresh(self) -> List[VsiChangeEvent]:
+        """
+        Query VSI config table and compare it with previous snapshot.
+
+        :return: Change events
+        """
+        return self.update(self.client.get_vsi_config_list())
+
+    def watch(self, interval: float, duration: Optional[float] = None) -> Iterator[VsiChangeEvent]:
+        """
+        Poll VSI config table and yield change events.
+
+        :param interval: Interval between refreshes in seconds
+        :param duration: How long to watch in seconds, forever if not passed
+        :return: Iterator of change events
+        """
+        end = None if duration is None else monotonic() + duration
+        while True:
+            started = monotonic()
+            yield from self.refresh()
+            if end is not None and monotonic() + interval > end:
+                return
+            sleep(max(0.0, interval - (monotonic() - started)))
@@ -0,0 +1,155 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for waiting until state of CP meets condition."""
+
+import logging
+import typing
+from dataclasses import dataclass
+from time import monotonic, sleep
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+
+from mfd_typing import MACAddress
+
+from . import log
+from .exceptions import CliClientTimeout
+from .vsi_table import IS_CREATED, IS_ENABLED, IS_VF, VsiConfigTable
+
+if typing.TYPE_CHECKING:
+    from .base import VsiConfigListEntry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """
+    Policy of delays between polls.
+
+    Delay starts at initial and is multiplied by factor after each poll up to maximum.
+    It goes back to initial whenever polled state changes, as state in progress is likely to change again soon.
+    """
+
+    initial: float = 0.1
+    factor: float = 2.0
+    maximum: float = 2.0
+
+
+@dataclass(frozen=True)
+class WaitResult(Generic[T]):
+    """Structure for result of wait: snapshot which met condition, time it took and number of checked snapshots."""
+
+    value: T
+    elapsed: float
+    attempts: int
+
+
+def wait_until(
+    fetch: Callable[[Optional[float]], T],
+    predicate: Callable[[T], bool],
+    timeout: float,
+    *,
+    backoff: Optional[Backoff] = None,
+    max_age: Optional[float] = None,
+    description: str = "condition",
+) -> WaitResult[T]:
+    """
+    Poll snapshots until predicate holds.
+
+    :param fetch: Callable returning snapshot, called with max_age of cached snapshot which can be reused
+                  (None for fresh snapshot)
+    :param predicate: Condition checked on each snapshot
+    :param timeout: Maximum time of waiting in seconds
+    :param backoff: Policy of delays between polls, Backoff() by default
+    :param max_age: Maximum age of cached snapshot which can be checked first instead of polling
+    :param description: Description of condition used in logs and exception
+    :return: Snapshot which met condition with elapsed time and number of checked snapshots
+    :raises CliClientTimeout: when condition is not met in time
+    """
+    backoff = backoff or Backoff()
+    start = monotonic()
+    deadline = start + timeout
+    delay = backoff.initial
+    previous = _MISSING
+    value = fetch(max_age)
+    attempts = 1
+    while not predicate(value):
+        now = monotonic()
+        if now >= deadline:
+            raise CliClientTimeout(f"Timeout while waiting for {description} ({attempts} checks in {now - start:.3f}s)")
+        if previous is not _MISSING and value != previous:
+            delay = backoff.initial
+        previous = value
+        sleep(min(delay, deadline - now))
+        delay = min(delay * backoff.factor, backoff.maximum)
+        value = fetch(None)
+        attempts += 1
+    elapsed = monotonic() - start
+    log.debug(logger, "Waited %.3fs for %s (%d checks).", elapsed, description, attempts)
+    return WaitResult(value, elapsed, attempts)
+
+
+def vfs_created_and_enabled(count: int, host_id: Optional[int] = None) -> Callable[[VsiConfigTable], bool]:
+    """
+    Create predicate: at least count VFs are created and enabled.
+
+    :param count: Number of VFs
+    :param host_id: Count only VFs of this host
+    :return: Predicate on VSI config table
+    """
+    mask = IS_VF | IS_CREATED | IS_ENABLED
+
+    def predicate(table: Union[VsiConfigTable, Iterable["VsiConfigListEntry"]]) -> bool:
+        if not isinstance(table, VsiConfigTable):
+            table = VsiConfigTable.from_entries(table)
+        ready = sum(
+            1
+            for flags, vf_host_id in zip(table.flags, table.host_ids)
+            if flags & mask == mask and (host_id is None or vf_host_id == host_id)
+        )
+        return ready >= count
+
+    return predicate
+
+
+def vsi_has_mac(vsi_id: int, mac: Union[MACAddress, str]) -> Callable[[VsiConfigTable], bool]:
+    """
+    Create predicate: VSI has MAC address.
+
+    :param vsi_id: VSI ID
+    :param mac: Expected MAC address
+    :return: Predicate on VSI config table
+    """
+    expected = int(MACAddress(mac))
+
+    def predicate(table: Union[VsiConfigTable, Iterable["VsiConfigListEntry"]]) -> bool:
+        if not isinstance(table, VsiConfigTable):
+            table = VsiConfigTable.from_entries(table)
+        return any(
+            table_vsi_id == vsi_id and table_mac == expected
+            for table_vsi_id, table_mac in zip(table.vsi_ids, table.macs)
+        )
+
+    return predicate
+
+
+def vm_mapping_present(
+    vm_id: int, vf_ids: Optional[Iterable[int]] = None, host_id: Optional[int] = None
+) -> Callable[[Dict[int, Dict[int, List[int]]]], bool]:
+    """
+    Create predicate: VM is present in VF2VM mapping, optionally with given VFs.
+
+    :param vm_id: VM ID
+    :param vf_ids: VFs which have to be mapped to VM
+    :param host_id: Host of VM, any host if not passed
+    :return: Predicate on result of read_qos_vm_info
+    """
+    expected_vfs = set(vf_ids or ())
+
+    def predicate(qos_vm_info: Dict[int, Dict[int, List[int]]]) -> bool:
+        hosts = [qos_vm_info.get(host_id, {})] if host_id is not None else qos_vm_info.values()
+        return any(vm_id in vms and expected_vfs.issubset(vms[vm_id]) for vms in hosts)
+
+    return predicate
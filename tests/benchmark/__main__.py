@@ -0,0 +1,9 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Run benchmarks with `python -m tests.benchmark`."""
+
+import sys
+
+from .run_benchmarks import main
+
+sys.exit(main())
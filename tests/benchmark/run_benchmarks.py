@@ -0,0 +1,384 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Parser and workflow benchmarks with machine-readable baseline.
+
+Usage:
+    python -m tests.benchmark --save tests/benchmark/baseline.json
+    python -m tests.benchmark --compare tests/benchmark/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from mfd_cli_client import CliClient, remote_parser, simulation
+from mfd_cli_client.parsers import parse_qos_vm_info, parse_switch_stats, parse_vsi_config_list, parse_vsi_statistics
+from mfd_cli_client.simulation import FakeConnection, SimulatedResponder
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of single benchmark case."""
+
+    name: str
+    items: int
+    input_bytes: int
+    median_s: float
+    min_s: float
+    items_per_s: float
+    mb_per_s: float
+    peak_kib: float
+    remote_calls: Optional[int] = None
+    extra: Dict[str, float] = field(default_factory=dict)
+
+
+def _measure(func: Callable[[], object], repeat: int) -> List[float]:
+    """
+    Measure wall time of func calls.
+
+    :param func: Benchmarked callable
+    :param repeat: Number of measured calls
+    :return: Durations in seconds
+    """
+    func()  # warm-up, e.g. regex cache
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _peak_memory_kib(func: Callable[[], object]) -> float:
+    """
+    Measure peak memory allocated by single func call.
+
+    :param func: Benchmarked callable
+    :return: Peak of traced memory in KiB
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / 1024
+
+
+def _run_case(
+    name: str, func: Callable[[], object], items: int, input_bytes: int, repeat: int, **kwargs
+) -> BenchmarkResult:
+    """
+    Run single benchmark case.
+
+    :param name: Unique name of case, used as key in baseline
+    :param func: Benchmarked callable
+    :param items: Number of items (rows, counters, hosts) processed in single call
+    :param input_bytes: Size of parsed output in single call
+    :param repeat: Number of measured calls
+    :return: Benchmark result
+    """
+    durations = _measure(func, repeat)
+    median = statistics.median(durations)
+    return BenchmarkResult(
+        name=name,
+        items=items,
+        input_bytes=input_bytes,
+        median_s=median,
+        min_s=min(durations),
+        items_per_s=items / median if median else 0.0,
+        mb_per_s=input_bytes / median / 2**20 if median else 0.0,
+        peak_kib=_peak_memory_kib(func),
+        **kwargs,
+    )
+
+
+def parser_benchmarks(repeat: int) -> List[BenchmarkResult]:
+    """
+    Benchmark parse-only functions on synthetic outputs at several scales.
+
+    :param repeat: Number of measured calls per case
+    :return: Benchmark results
+    """
+    results = []
+    output = simulation.switch_stats_output()
+    results.append(_run_case("parse_switch_stats", lambda: parse_switch_stats(output), 23, len(output), repeat))
+    output = simulation.vsi_stats_output()
+    results.append(_run_case("parse_vsi_statistics", lambda: parse_vsi_statistics(output), 13, len(output), repeat))
+    for vsi_count in simulation.VSI_SCALES:
+        output = simulation.vsi_config_output(vsi_count)
+        results.append(
+            _run_case(
+                f"parse_vsi_config_list[{vsi_count}]",
+                lambda output=output: parse_vsi_config_list(output),
+                vsi_count,
+                len(output),
+                max(1, repeat * 16 // vsi_count),
+            )
+        )
+    for host_count in simulation.HOST_SCALES:
+        output = simulation.qos_vm_info_output(host_count)
+        results.append(
+            _run_case(
+                f"parse_qos_vm_info[{host_count}]",
+                lambda output=output: parse_qos_vm_info(output),
+                host_count,
+                len(output),
+                repeat,
+            )
+        )
+    if shutil.which("awk") is not None:
+        results.extend(remote_parser_benchmarks(repeat))
+    return results
+
+
+def _run_awk(script: str, output: str) -> str:
+    """
+    Run remote parser script locally.
+
+    :param script: Awk script
+    :param output: Output of cli_client
+    :return: Output of script
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        script_path = Path(directory, "parser.awk")
+        script_path.write_text(script)
+        return subprocess.run(
+            ["awk", "-v", f"version={remote_parser.FORMAT_VERSION}", "-f", str(script_path)],
+            input=output,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+
+def remote_parser_benchmarks(repeat: int) -> List[BenchmarkResult]:
+    """
+    Benchmark decoding of remote parser output, input bytes show size transferred instead of raw output.
+
+    :param repeat: Number of measured calls per case
+    :return: Benchmark results
+    """
+    results = []
+    for vsi_count in simulation.VSI_SCALES:
+        output = simulation.vsi_config_output(vsi_count)
+        payload = _run_awk(remote_parser.VSI_CONFIG_SCRIPT, output)
+        results.append(
+            _run_case(
+                f"decode_vsi_config_list[{vsi_count}]",
+                lambda payload=payload: remote_parser.decode_vsi_config_list(payload),
+                vsi_count,
+                len(payload),
+                max(1, repeat * 16 // vsi_count),
+                extra={"raw_bytes": len(output)},
+            )
+        )
+    return results
+
+
+IMPORT_CASES = {
+    "mfd_cli_client": "import mfd_cli_client",
+    "mfd_cli_client.parsers": "import mfd_cli_client.parsers",
+    "mfd_cli_client.base": "import mfd_cli_client.base",
+}
+
+
+def _import_time(statement: str) -> Tuple[float, int]:
+    """
+    Measure import in fresh interpreter.
+
+    :param statement: Import statement
+    :return: Duration of import in seconds and number of modules it loaded
+    """
+    code = (
+        "import sys, time\n"
+        "loaded = len(sys.modules)\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start, len(sys.modules) - loaded)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).parents[2]
+    ).stdout
+    duration, modules = output.split()
+    return float(duration), int(modules)
+
+
+def import_benchmarks(repeat: int) -> List[BenchmarkResult]:
+    """
+    Benchmark import time of package entry points, each measured in fresh interpreter.
+
+    :param repeat: Number of measured imports per case (at most 5)
+    :return: Benchmark results
+    """
+    results = []
+    for name, statement in IMPORT_CASES.items():
+        measurements = [_import_time(statement) for _ in range(min(repeat, 5))]
+        durations = [duration for duration, _ in measurements]
+        median = statistics.median(durations)
+        results.append(
+            BenchmarkResult(
+                name=f"import[{name}]",
+                items=1,
+                input_bytes=0,
+                median_s=median,
+                min_s=min(durations),
+                items_per_s=1 / median if median else 0.0,
+                mb_per_s=0.0,
+                peak_kib=0.0,
+                extra={"modules": measurements[0][1]},
+            )
+        )
+    return results
+
+
+def _run_workflow(
+    name: str, workflow: Callable[[], object], connection: FakeConnection, items: int, repeat: int
+) -> BenchmarkResult:
+    """
+    Run single workflow case, counting remote calls and transferred bytes of one call.
+
+    :param name: Unique name of case, used as key in baseline
+    :param workflow: Benchmarked workflow
+    :param connection: Fake connection used by workflow
+    :param items: Number of items processed in single call
+    :param repeat: Number of measured calls
+    :return: Benchmark result
+    """
+    connection.executed_commands.clear()
+    connection.transferred_bytes = 0
+    workflow()
+    return _run_case(
+        name, workflow, items, connection.transferred_bytes, repeat, remote_calls=len(connection.executed_commands)
+    )
+
+
+def workflow_benchmarks(repeat: int) -> List[BenchmarkResult]:
+    """
+    Benchmark end-to-end CliClient workflows against fake connection.
+
+    :param repeat: Number of measured calls per case
+    :return: Benchmark results
+    """
+    results = []
+    for vsi_count, host_count in zip(simulation.VSI_SCALES, simulation.HOST_SCALES):
+        connection = FakeConnection(SimulatedResponder(vsi_count, host_count))
+        cli_client = CliClient(connection=connection)
+        workflows = {
+            f"workflow_find_vf_vsi[{vsi_count}]": (lambda: cli_client.find_vf_vsi(vf_amount=vsi_count), vsi_count),
+            f"workflow_mac_and_vsi_list[{vsi_count}]": (lambda: cli_client.get_mac_and_vsi_list(), vsi_count),
+            f"workflow_read_qos_vm_info[{host_count}]": (lambda: cli_client.read_qos_vm_info(), host_count),
+            f"workflow_prepare_vm_vsi[{host_count}]": (lambda: cli_client.prepare_vm_vsi(host_count), host_count),
+        }
+        if vsi_count == simulation.VSI_SCALES[0]:
+            workflows["workflow_switch_stats"] = (lambda: cli_client.get_switch_stats(), 1)
+            workflows["workflow_vsi_statistics"] = (lambda: cli_client.get_vsi_statistics(), 1)
+        for name, (workflow, items) in workflows.items():
+            results.append(_run_workflow(name, workflow, connection, items, max(1, repeat * 16 // vsi_count)))
+    return results
+
+
+def run(repeat: int = 20) -> Dict:
+    """
+    Run all benchmarks.
+
+    :param repeat: Number of measured calls per smallest case, bigger cases are scaled down
+    :return: Results in baseline format
+    """
+    results = import_benchmarks(repeat) + parser_benchmarks(repeat) + workflow_benchmarks(repeat)
+    return {
+        "version": BASELINE_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Compare results with baseline.
+
+    Time regression is reported when median time grows over tolerance, remote calls must never grow.
+
+    :param current: Current results
+    :param baseline: Baseline results
+    :param tolerance: Accepted relative slowdown, e.g. 0.25 for 25%
+    :return: Descriptions of regressions
+    """
+    regressions = []
+    for name, base in baseline["results"].items():
+        result = current["results"].get(name)
+        if result is None:
+            regressions.append(f"{name}: missing in current run")
+            continue
+        if result["median_s"] > base["median_s"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: median {result['median_s'] * 1e3:.3f} ms vs baseline {base['median_s'] * 1e3:.3f} ms"
+            )
+        if base.get("remote_calls") is not None and result["remote_calls"] > base["remote_calls"]:
+            regressions.append(f"{name}: {result['remote_calls']} remote calls vs baseline {base['remote_calls']}")
+    return regressions
+
+
+def _format_table(current: Dict, baseline: Optional[Dict]) -> str:
+    """
+    Format results as human-readable table.
+
+    :param current: Current results
+    :param baseline: Baseline results, if available
+    :return: Table
+    """
+    lines = [f"{'case':45} {'median ms':>12} {'items/s':>14} {'MB/s':>9} {'peak KiB':>10} {'calls':>6} {'vs base':>8}"]
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name) if baseline else None
+        ratio = f"{result['median_s'] / base['median_s']:.2f}x" if base and base["median_s"] else "-"
+        calls = result["remote_calls"] if result["remote_calls"] is not None else "-"
+        lines.append(
+            f"{name:45} {result['median_s'] * 1e3:12.3f} {result['items_per_s']:14.0f} {result['mb_per_s']:9.2f} "
+            f"{result['peak_kib']:10.1f} {calls:>6} {ratio:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run benchmarks from command line.
+
+    :param argv: Command line arguments
+    :return: Exit code, 1 when regressions against baseline were found
+    """
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmark", description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="measured calls per smallest case")
+    parser.add_argument("--save", type=Path, help="store results as new baseline")
+    parser.add_argument("--compare", type=Path, nargs="?", const=DEFAULT_BASELINE, help="compare with baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="accepted relative slowdown")
+    args = parser.parse_args(argv)
+
+    current = run(repeat=args.repeat)
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print(_format_table(current, baseline))
+    if args.save:
+        args.save.write_text(json.dumps(current, indent=2) + "\n")
+    if baseline:
+        regressions = compare(current, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
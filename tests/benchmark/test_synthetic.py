@@ -0,0 +1,50 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_cli_client import simulation
+from mfd_cli_client.parsers import parse_qos_vm_info, parse_switch_stats, parse_vsi_config_list, parse_vsi_statistics
+
+from .run_benchmarks import compare
+
+
+class TestSynthetic:
+    @pytest.mark.parametrize("vsi_count", simulation.VSI_SCALES)
+    def test_vsi_config_output_parses_to_requested_row_count(self, vsi_count):
+        entries = parse_vsi_config_list(simulation.vsi_config_output(vsi_count))
+        assert len(entries) == vsi_count
+        assert any(entry.is_vf for entry in entries)
+
+    @pytest.mark.parametrize("host_count", simulation.HOST_SCALES)
+    def test_qos_vm_info_output_parses_all_hosts(self, host_count):
+        data = parse_qos_vm_info(simulation.qos_vm_info_output(host_count, vms_per_host=2, vfs_per_vm=3))
+        assert sorted(data) == list(range(host_count))
+        assert data[0] == {1: [0, 1, 2], 2: [3, 4, 5]}
+
+    def test_switch_stats_output_parses_all_counters(self):
+        stats = parse_switch_stats(simulation.switch_stats_output(seed=1))
+        assert stats.ingress.packet == sum(stats.ingress.traffic_class_counters)
+        assert stats.egress.packet == sum(stats.egress.traffic_class_counters)
+        assert all(stats.egress.traffic_class_counters)
+
+    def test_vsi_stats_output_parses_all_counters(self):
+        stats = parse_vsi_statistics(simulation.vsi_stats_output(seed=1))
+        assert stats.ingress.unknown_packet is not None
+        assert stats.egress.unknown_packet is None
+        assert stats.egress.errors_packet is not None
+
+
+class TestCompare:
+    @staticmethod
+    def _results(median_s, remote_calls=None):
+        return {"results": {"case": {"median_s": median_s, "remote_calls": remote_calls}}}
+
+    def test_compare_within_tolerance(self):
+        assert compare(self._results(0.0012, 2), self._results(0.001, 2), tolerance=0.25) == []
+
+    def test_compare_reports_slowdown_and_extra_remote_calls(self):
+        regressions = compare(self._results(0.002, 3), self._results(0.001, 2), tolerance=0.25)
+        assert len(regressions) == 2
+
+    def test_compare_reports_missing_case(self):
+        assert compare({"results": {}}, self._results(0.001), tolerance=0.25) == ["case: missing in current run"]
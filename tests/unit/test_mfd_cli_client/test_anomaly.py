@@ -0,0 +1,68 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import random
+
+import pytest
+
+from mfd_cli_client.anomaly import AnomalyDetector
+from mfd_cli_client.exporter import CpSample
+from mfd_cli_client.structures import FlowStats, SwitchStats, VSIFlowStats, VSIStats
+
+
+def vsi_stats(discards, errors=0):
+    return VSIStats(VSIFlowStats(0, 0, 0, 0, discards, errors), VSIFlowStats(0, 0, 0, 0, 0, 0))
+
+
+class TestAnomalyDetector:
+    @pytest.fixture()
+    def anomalies(self):
+        return []
+
+    @pytest.fixture()
+    def detector(self, anomalies):
+        detector = AnomalyDetector(warm_up=5)
+        detector.add_callback(anomalies.append)
+        return detector
+
+    def feed(self, detector, rates, start=0):
+        counter = start
+        for second, rate in enumerate(rates):
+            counter += rate
+            detector.observe_vsi_stats("cp0", {5: vsi_stats(counter)}, float(second))
+
+    def test_spike_fires_once(self, detector, anomalies):
+        rng = random.Random(1)
+        self.feed(detector, [rng.randint(8, 12) for _ in range(30)] + [200, 300, 10, 500])
+        assert [(anomaly.rate, anomaly.reason) for anomaly in anomalies] == [
+            (200.0, "deviation"),
+            (500.0, "deviation"),
+        ]
+        assert anomalies[0].series == ("cp0", "vsi", 5, "ingress", "discards_packet")
+        assert 8 <= anomalies[0].baseline <= 12
+
+    def test_small_rates_are_not_deviations(self, detector, anomalies):
+        self.feed(detector, [0] * 20 + [1, 0])
+        assert anomalies == []
+
+    def test_threshold_fires_without_baseline(self, anomalies):
+        detector = AnomalyDetector(thresholds={"errors_packet": 5.0})
+        detector.add_callback(anomalies.append)
+        detector.observe_vsi_stats("cp0", {5: vsi_stats(0, errors=0)}, 0.0)
+        detector.observe_vsi_stats("cp0", {5: vsi_stats(0, errors=20)}, 2.0)
+        assert [(anomaly.reason, anomaly.rate, anomaly.limit) for anomaly in anomalies] == [("threshold", 10.0, 5.0)]
+
+    def test_counter_reset_and_missing_counter(self, detector, anomalies):
+        assert detector.observe(("cp0", "x"), 1000, 0.0) is None
+        assert detector.observe(("cp0", "x"), 5, 1.0) is None
+        assert detector.observe(("cp0", "x"), None, 2.0) is None
+        assert detector.observe(("cp0", "x"), 10, 3.0) is None
+        assert anomalies == []
+
+    def test_sampler_listener(self, detector, anomalies):
+        for second, discards in enumerate([0, 10, 20, 30, 40, 50, 60, 5000]):
+            switch = SwitchStats(FlowStats([], 0, 0), FlowStats([], 0, discards), 0, 0, 0)
+            detector.on_cp_sample("cp1", CpSample(float(second), 0.1, switch_stats={1: switch}))
+        assert [anomaly.series for anomaly in anomalies] == [("cp1", "switch", 1, "ingress", "discards")]
+        assert len(detector) == 2
+        detector.forget("cp1")
+        assert len(detector) == 0
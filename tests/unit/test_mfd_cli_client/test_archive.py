@@ -0,0 +1,90 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_cli_client import archive
+from mfd_cli_client.archive import ArchiveRecord, OutputArchive, register_parser, reparse
+from mfd_cli_client.exceptions import CliClientException
+from mfd_cli_client.simulation import switch_stats_output, vsi_stats_output
+
+
+@pytest.fixture()
+def path(tmp_path):
+    return tmp_path / "outputs.archive"
+
+
+def fill(output_archive, count=10):
+    for tick in range(count):
+        output_archive.append("--query --statistics --vsi 5", vsi_stats_output(5, tick), host="cp0", timestamp=tick)
+        output_archive.append(
+            "--query --statistics --switch 1", switch_stats_output(1, tick=tick), host="cp1", timestamp=tick + 0.5
+        )
+
+
+class TestOutputArchive:
+    def test_records_are_written_in_chunks(self, path):
+        with OutputArchive(path, chunk_size=4096) as output_archive:
+            fill(output_archive)
+        reopened = OutputArchive(path)
+        assert len(reopened) == 20
+        assert len(reopened.chunks()) > 1
+        records = list(reopened.records())
+        assert [record.timestamp for record in records] == sorted(record.timestamp for record in records)
+        assert records[0] == ArchiveRecord(0, "cp0", "--query --statistics --vsi 5", vsi_stats_output(5, 0))
+        assert path.stat().st_size < sum(len(record.output) for record in records) / 4
+
+    def test_filters_read_only_matching_chunks(self, path, mocker):
+        with OutputArchive(path, chunk_size=4096) as output_archive:
+            fill(output_archive)
+        read_chunk = mocker.spy(archive, "read_chunk")
+        records = list(output_archive.records(start=3, end=5, command_types=["--query --statistics --switch 9"]))
+        assert [record.timestamp for record in records] == [3.5, 4.5]
+        assert read_chunk.call_count < len(output_archive.chunks())
+        assert [record.host for record in output_archive.records(hosts=["cp0"])] == ["cp0"] * 10
+
+    def test_pending_records_are_readable(self, path):
+        output_archive = OutputArchive(path)
+        output_archive.append("--query --config --verbose", "output", timestamp=1.0)
+        assert [record.output for record in output_archive.records()] == ["output"]
+        assert not path.exists()
+
+    def test_unindexed_chunk_is_ignored(self, path):
+        with OutputArchive(path) as output_archive:
+            fill(output_archive, 1)
+        index = output_archive.index_path.read_text()
+        output_archive.index_path.write_text(index + index.replace('"offset": 0', '"offset": 100000') + "garbage\n")
+        with OutputArchive(path) as output_archive:
+            assert len(output_archive) == 2
+            fill(output_archive, 1)
+        assert len(OutputArchive(path)) == 4
+
+    def test_corrupted_chunk(self, path):
+        with OutputArchive(path) as output_archive:
+            fill(output_archive, 1)
+        path.write_bytes(b"x" * path.stat().st_size)
+        with pytest.raises(CliClientException, match="Corrupted archive chunk"):
+            list(output_archive.records())
+
+
+class TestReparse:
+    def test_outputs_are_parsed_by_command_type(self, path):
+        with OutputArchive(path) as output_archive:
+            fill(output_archive, 2)
+            output_archive.append("--modify --config", "done")
+        results = list(reparse(output_archive.records()))
+        assert len(results) == 4
+        record, stats = results[0]
+        assert stats.ingress.packet == int(vsi_stats_output(5, 0).split("ingress packet: ")[1].split()[0])
+        assert results[1][1].egress.traffic_class_counters
+
+    def test_registered_parser(self, path, mocker):
+        mocker.patch.dict(archive.PARSERS)
+        register_parser("--modify --config 5", len)
+        records = [ArchiveRecord(0, "", "--modify --config 7", "done")]
+        assert list(reparse(records)) == [(records[0], 4)]
+
+    def test_parser_failure(self):
+        records = [ArchiveRecord(0, "", "--query --statistics --vm_qos_info", "garbage")]
+        with pytest.raises(CliClientException, match="Cannot parse archived output"):
+            list(reparse(records))
+        assert list(reparse(records, skip_errors=True)) == []
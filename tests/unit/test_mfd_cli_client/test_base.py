@@ -1,6 +1,12 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import base64
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from textwrap import dedent
+from threading import Event
+from time import sleep
 
 import pytest
 from mfd_connect import SSHConnection
@@ -8,6 +14,7 @@ from mfd_connect.base import ConnectionCompletedProcess
 
 from mfd_cli_client import CliClient
 from mfd_cli_client.base import (
+    AcquisitionWindow,
     SwitchStats,
     FlowStats,
     TrafficClassCounters,
@@ -15,8 +22,24 @@ from mfd_cli_client.base import (
     VsiConfigListEntry,
     VSIFlowStats,
     VSIStats,
+    ExecutionStats,
 )
-from mfd_cli_client.exceptions import CliClientException
+from mfd_cli_client.archive import OutputArchive
+from mfd_cli_client.coalescing import SingleFlight
+from mfd_cli_client.compression import CompressionPolicy
+from mfd_cli_client.deadline import deadline_scope
+from mfd_cli_client.exceptions import (
+    CliClientCircuitOpen,
+    CliClientDeadlineExceeded,
+    CliClientException,
+    CliClientRunnerUnavailable,
+    CliClientTimeout,
+)
+from mfd_cli_client.rate_limit import RateLimiter
+from mfd_cli_client.remote_parser import RemoteParser
+from mfd_cli_client.runner import PersistentRunner
+from mfd_cli_client.timeouts import AdaptiveTimeout, CircuitBreaker
+from mfd_cli_client.waiters import vfs_created_and_enabled, vm_mapping_present
 from mfd_typing import OSName, MACAddress
 
 
@@ -39,6 +62,11 @@ class TestCliClient:
         mocker.stopall()
         return cli_client
 
+    @pytest.fixture
+    def coalescing_cli_client(self, cli_client):
+        cli_client._single_flight = SingleFlight()
+        return cli_client
+
     def test_execute_cli_client_command(self, cli_client):
         output = "Any output"
         cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
@@ -46,6 +74,574 @@ class TestCliClient:
         )
         assert cli_client.execute_cli_client_command(command="foo") == output
 
+    @pytest.mark.parametrize(
+        "command, expected",
+        [
+            ("--query --config --verbose", True),
+            ("--query --statistics --switch 1", True),
+            ("--modify --config --mir_prof 16 --vsi 1", False),
+            ("-b qos -m -v 9 --dir 0 --nup 0 --vup 0", False),
+            ("--event link_change --link_status 1 --link_speed 25GB --all_pf", False),
+            ("-b psm -m -c -H 0 --vmid 1", False),
+        ],
+    )
+    def test_is_read_only_command(self, command, expected):
+        assert CliClient._is_read_only_command(command) is expected
+
+    def test_execute_cli_client_command_coalesces_only_queries(self, coalescing_cli_client, mocker):
+        cli_client = coalescing_cli_client
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr="stderr"
+        )
+        do_spy = mocker.spy(cli_client._single_flight, "do")
+        cli_client.execute_cli_client_command(command="--query --config --verbose")
+        cli_client.execute_cli_client_command(command="--modify --config --mir_prof 16 --vsi 1")
+        assert do_spy.call_count == 1
+        assert do_spy.call_args.args[0] == ("--query --config --verbose", 120, frozenset({0}), None, None)
+        assert cli_client.execution_stats == ExecutionStats(executions=2, coalesced=0)
+
+    def test_execute_cli_client_command_counts_coalesced_queries(self, coalescing_cli_client, mocker):
+        cli_client = coalescing_cli_client
+        mocker.patch.object(cli_client._single_flight, "do", return_value=("output", True))
+        assert cli_client.execute_cli_client_command(command="--query --config --verbose") == "output"
+        assert cli_client.execution_stats == ExecutionStats(executions=0, coalesced=1)
+
+    def test_queries_with_different_timeouts_are_not_coalesced(self, coalescing_cli_client):
+        cli_client = coalescing_cli_client
+        started = Event()
+        release = Event()
+        outputs = iter(["first", "second"])
+
+        def execute_command(*args, **kwargs):
+            output = next(outputs)
+            if output == "first":
+                started.set()
+                release.wait(5)
+            return ConnectionCompletedProcess(return_code=0, args="command", stdout=output, stderr="")
+
+        cli_client._connection.execute_command.side_effect = execute_command
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(cli_client.execute_cli_client_command, "--query --config --verbose", timeout=120)
+            assert started.wait(5)
+            second = cli_client.execute_cli_client_command("--query --config --verbose", timeout=5)
+            release.set()
+            assert (first.result(5), second) == ("first", "second")
+        assert cli_client.execution_stats == ExecutionStats(executions=2, coalesced=0)
+
+    def test_execute_cli_client_command_does_not_coalesce_by_default(self, mocker):
+        mocker.patch("mfd_cli_client.CliClient.check_if_available")
+        connection = mocker.create_autospec(SSHConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr="stderr"
+        )
+        cli_client = CliClient(connection=connection)
+        assert cli_client._single_flight is None
+        assert cli_client.execute_cli_client_command(command="--query --config --verbose") == "output"
+        assert cli_client.execution_stats.executions == 1
+
+    def test_execute_cli_client_command_uses_separate_rate_limits(self, cli_client, mocker):
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr="stderr"
+        )
+        cli_client.query_rate_limit = RateLimiter(rate=100)
+        cli_client.mutation_rate_limit = RateLimiter(max_in_flight=1)
+        cli_client.execute_cli_client_command(command="--query --config --verbose")
+        cli_client.execute_cli_client_command(command="--modify --config --mir_prof 16 --vsi 1")
+        cli_client.execute_cli_client_command(command="-b psm -m -c -H 0 --vmid 1")
+        assert cli_client.query_rate_limit.stats.acquired == 1
+        assert cli_client.mutation_rate_limit.stats.acquired == 2
+
+    def test_execute_cli_client_command_reports_throttled_time(self, cli_client, mocker):
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr="stderr"
+        )
+        limiter = RateLimiter(rate=10)
+        sleeper = mocker.patch.object(limiter._bucket, "_sleeper")
+        cli_client.mutation_rate_limit = limiter
+        cli_client.execute_cli_client_command(command="-b psm -m -c -H 0 --vmid 1")
+        cli_client.execute_cli_client_command(command="-b psm -m -c -H 0 --vmid 2")
+        assert sleeper.call_count == 1
+        assert cli_client.execution_stats.throttled_time == pytest.approx(0.1, abs=0.01)
+        assert cli_client.execution_stats.executions == 2
+
+    def test_get_vsi_config_list_with_remote_parsing(self, cli_client, mocker):
+        cli_client._remote_parser = RemoteParser()
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout='{"v":1,"rows":[["0x0","0x0",0,"0x1","0x0",1,1,"00:01:00:00:03:14"]],"ok":1}\n',
+            stderr="",
+        )
+        assert cli_client.get_vsi_config_list() == [
+            VsiConfigListEntry(0, 0, False, 1, 0, True, True, MACAddress("00:01:00:00:03:14"))
+        ]
+        cli_client._connection.path.return_value.write_text.assert_called()
+        assert (
+            f"; }} | {cli_client._remote_parser.pipe('vsi_config')} >&4;"
+            in (cli_client._connection.execute_command.call_args.args[0])
+        )
+        cli_client._connection.execute_command.assert_called_once_with(
+            mocker.ANY,
+            timeout=120,
+            expected_return_codes=frozenset({0}),
+            shell=True,
+        )
+
+    def test_read_qos_vm_info_remote_parsing_falls_back_to_local_parser(self, cli_client, mocker):
+        cli_client._remote_parser = RemoteParser()
+        cli_client._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout='{"v":1,"hosts":{},"ok":0}', stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="command",
+                stdout="HOST ID 0\nHOST ID 1\nHOST ID 2\nHOST ID 3\nserver finished responding ===",
+                stderr="",
+            ),
+        ]
+        assert cli_client.read_qos_vm_info() == {0: {}, 1: {}, 2: {}, 3: {}}
+        assert cli_client._remote_parser is not None
+        assert cli_client._connection.execute_command.call_args.args == (
+            "cli_client --query --statistics --vm_qos_info",
+        )
+
+    @pytest.mark.parametrize("error", [TimeoutError("timed out"), CliClientCircuitOpen("open")])
+    def test_remote_parsing_does_not_repeat_failed_query(self, cli_client, error):
+        cli_client._remote_parser = RemoteParser()
+        cli_client._connection.execute_command.side_effect = error
+        with pytest.raises(type(error)):
+            cli_client.get_vsi_config_list()
+        assert cli_client._connection.execute_command.call_count == 1
+        assert cli_client._remote_parser is not None
+
+    def test_remote_parsing_keeps_return_code(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        cli_client._remote_parser = RemoteParser()
+        # awk emits valid document for empty output of failed cli_client
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout='{"v":1,"hosts":{},"ok":0}\n\n__cli_client_pipe_rc_abcd 1\n',
+            stderr="",
+        )
+        with pytest.raises(CliClientException, match="unexpected return code 1"):
+            cli_client.read_qos_vm_info()
+        assert cli_client._connection.execute_command.call_count == 1
+
+    def test_remote_parsing_disabled_when_script_cannot_be_pushed(self, cli_client, mocker):
+        cli_client._remote_parser = RemoteParser()
+        cli_client._connection.path.return_value.write_text.side_effect = OSError("read-only file system")
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="server finished responding", stderr=""
+        )
+        assert cli_client.get_vsi_config_list() == []
+        assert cli_client._remote_parser is None
+
+    def test_get_vsi_config_list_reuses_snapshot(self, cli_client):
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="server finished responding", stderr=""
+        )
+        table = cli_client.get_vsi_config_list()
+        table.append(VsiConfigListEntry(0, 0, False, 1, 0, True, True, MACAddress("00:01:00:00:03:14")))
+        assert cli_client.get_vsi_config_list(max_age=60) == []
+        assert cli_client._connection.execute_command.call_count == 1
+        cli_client.get_vsi_config_list()
+        assert cli_client._connection.execute_command.call_count == 2
+
+    def test_read_qos_vm_info_reuses_snapshot(self, cli_client, mocker):
+        query = mocker.patch.object(cli_client, "_query_qos_vm_info", return_value={0: {1: [0, 1]}, 1: {}})
+        mapping = cli_client.read_qos_vm_info()
+        mapping[0][1].append(2)
+        mapping[0][2] = [3]
+        mapping[1] = {4: [5]}
+        assert cli_client.read_qos_vm_info(max_age=60) == {0: {1: [0, 1]}, 1: {}}
+        assert query.call_count == 1
+
+    def test_mutating_command_invalidates_snapshots(self, cli_client):
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="server finished responding", stderr=""
+        )
+        table = cli_client.get_vsi_config_list()
+        cli_client.execute_cli_client_command("--modify --config --vsi 1")
+        assert cli_client.get_vsi_config_list(max_age=60) is not table
+
+    def test_wait_for_vsi_state(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.waiters.sleep")
+        not_enabled = (
+            "fn_id: 0x1   host_id: 0x0   is_vf: yes vsi_id: 0xd   vport_id 0x0   is_created: yes  is_enabled: no "
+            "mac addr: 00:0d:00:00:03:14\n"
+        )
+        cli_client._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=not_enabled, stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="command",
+                stdout=not_enabled.replace("is_enabled: no", "is_enabled: yes"),
+                stderr="",
+            ),
+        ]
+        result = cli_client.wait_for_vsi_state(vfs_created_and_enabled(1), timeout=10)
+        assert result.attempts == 2
+        assert result.value[0].is_enabled is True
+
+    def test_wait_for_qos_vm_info_timeout(self, cli_client, mocker):
+        now = [0.0]
+        mocker.patch("mfd_cli_client.waiters.sleep", side_effect=lambda s: now.append(now[-1] + s))
+        mocker.patch("mfd_cli_client.waiters.monotonic", side_effect=lambda: now[-1])
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout="HOST ID 0\nHOST ID 1\nHOST ID 2\nHOST ID 3\nserver finished responding ===",
+            stderr="",
+        )
+        with pytest.raises(CliClientTimeout):
+            cli_client.wait_for_qos_vm_info(vm_mapping_present(1), timeout=1)
+
+    def test_execute_cli_client_batch(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout="out 1\n\n__cli_client_batch_rc_abcd 0\n\n__cli_client_batch_rc_abcd 0\n",
+            stderr="",
+        )
+        assert cli_client.execute_cli_client_batch(["--event a", "--event b"]) == ["out 1\n", ""]
+        cli_client._connection.execute_command.assert_called_once_with(
+            "cli_client --event a; printf '\\n__cli_client_batch_rc_abcd %d\\n' $?; "
+            "cli_client --event b; printf '\\n__cli_client_batch_rc_abcd %d\\n' $?",
+            timeout=120,
+            expected_return_codes=frozenset({0}),
+            shell=True,
+        )
+        assert cli_client.execution_stats.executions == 1
+
+    def test_adaptive_timeout_is_learned_per_command_type(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        cli_client.adaptive_timeout = AdaptiveTimeout(min_samples=2, minimum=1)
+        cli_client.adaptive_timeout.record("--query --statistics --vsi 1", 0.5)
+        cli_client.adaptive_timeout.record("--query --statistics --vsi 2", 0.5)
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="\n__cli_client_batch_rc_abcd 0\n" * 3, stderr=""
+        )
+        cli_client.execute_cli_client_command("--query --statistics --vsi 3")
+        assert cli_client._connection.execute_command.call_args.kwargs["timeout"] == 2
+        cli_client.execute_cli_client_batch([f"--query --statistics --vsi {vsi}" for vsi in range(3)], timeout=30)
+        assert cli_client._connection.execute_command.call_args.kwargs["timeout"] == 4
+        cli_client.execute_cli_client_command("--query --config --verbose", timeout=60)
+        assert cli_client._connection.execute_command.call_args.kwargs["timeout"] == 60
+
+    def test_timeout_is_fed_back_to_adaptive_timeout(self, cli_client, mocker):
+        cli_client.adaptive_timeout = AdaptiveTimeout(min_samples=1, minimum=1)
+        cli_client.adaptive_timeout.record("--query --statistics --vsi 1", 0.5)
+        record_timeout = mocker.spy(cli_client.adaptive_timeout, "record_timeout")
+        cli_client._connection.execute_command.side_effect = [
+            TimeoutError("timed out"),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="output", stderr=""),
+        ]
+        with pytest.raises(TimeoutError):
+            cli_client.execute_cli_client_command("--query --statistics --vsi 1")
+        record_timeout.assert_called_once_with("--query --statistics --vsi 1", 2, 1)
+        assert cli_client.execute_cli_client_command("--query --statistics --vsi 1") == "output"
+        assert cli_client._connection.execute_command.call_args.kwargs["timeout"] == 120
+
+    @staticmethod
+    def _runner(mocker, execute_error=None):
+        runner = mocker.create_autospec(PersistentRunner, instance=True, closed=False, started=True)
+
+        def execute(*args, **kwargs):
+            if execute_error is None:
+                return ConnectionCompletedProcess(return_code=0, args="command", stdout="runner output", stderr="")
+            # runner closes itself when its shell exits or is stopped on timeout
+            runner.closed = not isinstance(execute_error, CliClientRunnerUnavailable) or runner.closed
+            raise execute_error
+
+        runner.execute.side_effect = execute
+        return runner
+
+    def test_persistent_runner_executes_commands(self, cli_client, mocker):
+        cli_client._runner = self._runner(mocker)
+        assert cli_client.execute_cli_client_command("--query --config --verbose", timeout=30) == "runner output"
+        cli_client._runner.execute.assert_called_once_with(
+            "cli_client --query --config --verbose", timeout=30, expected_return_codes=frozenset({0})
+        )
+        cli_client._connection.execute_command.assert_not_called()
+        assert cli_client.execution_stats.runner_executions == 1
+
+    @pytest.mark.parametrize(
+        "command, error, falls_back",
+        [
+            ("--event link_change", CliClientRunnerUnavailable("not running"), True),
+            ("--query --config --verbose", CliClientException("exited while executing"), True),
+            ("--event link_change", CliClientException("exited while executing"), False),
+        ],
+    )
+    def test_persistent_runner_falls_back_to_connection(self, cli_client, mocker, command, error, falls_back):
+        runner = cli_client._runner = self._runner(mocker, error)
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr=""
+        )
+        if falls_back:
+            assert cli_client.execute_cli_client_command(command) == "output"
+        else:
+            with pytest.raises(CliClientException):
+                cli_client.execute_cli_client_command(command)
+        assert cli_client._connection.execute_command.call_count == int(falls_back)
+        assert runner.execute.call_count == 1
+
+    def test_persistent_runner_is_restarted_after_timeout(self, cli_client, mocker):
+        cli_client._runner = self._runner(mocker, TimeoutError("timed out"))
+        restarted = self._runner(mocker)
+        runner_class = mocker.patch("mfd_cli_client.base.PersistentRunner", return_value=restarted)
+        with pytest.raises(TimeoutError):
+            cli_client.execute_cli_client_command("--query --config --verbose")
+        assert cli_client.execute_cli_client_command("--query --config --verbose") == "runner output"
+        runner_class.assert_called_once_with(cli_client._connection)
+        assert cli_client._runner is restarted
+        assert cli_client._runner_restarts == 2
+        cli_client._connection.execute_command.assert_not_called()
+
+    def test_persistent_runner_restarts_are_bounded(self, cli_client, mocker):
+        cli_client._runner = self._runner(mocker, TimeoutError("timed out"))
+        cli_client._runner_restarts = 1
+        mocker.patch("mfd_cli_client.base.PersistentRunner", side_effect=lambda connection: self._runner(mocker))
+        cli_client._runner.closed = True
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr=""
+        )
+        assert cli_client.execute_cli_client_command("--query --config --verbose") == "runner output"
+        cli_client._runner.closed = True
+        assert cli_client.execute_cli_client_command("--query --config --verbose") == "output"
+        assert cli_client._runner is None
+
+    def test_persistent_runner_disabled_when_it_cannot_start(self, cli_client, mocker):
+        runner = cli_client._runner = self._runner(mocker)
+        runner.started = False
+        runner.start.side_effect = CliClientRunnerUnavailable("Cannot start persistent runner")
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr=""
+        )
+        assert cli_client.execute_cli_client_command("--query --config --verbose") == "output"
+        assert cli_client._runner is None
+        runner.execute.assert_not_called()
+
+    def test_stop_runner(self, cli_client, mocker):
+        runner = cli_client._runner = mocker.create_autospec(PersistentRunner, instance=True)
+        cli_client.stop_runner()
+        runner.close.assert_called_once_with()
+        assert cli_client._runner is None
+
+    def test_circuit_breaker_rejects_after_timeouts(self, cli_client, mocker):
+        clock = mocker.Mock(return_value=0.0)
+        cli_client.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        cli_client._connection.execute_command.side_effect = TimeoutError
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                cli_client.execute_cli_client_command("--event link_change")
+        with pytest.raises(CliClientCircuitOpen):
+            cli_client.execute_cli_client_command("--event link_change")
+        assert cli_client._connection.execute_command.call_count == 2
+        assert (cli_client.execution_stats.timeouts, cli_client.execution_stats.rejected) == (2, 1)
+
+        clock.return_value = 10.0
+        cli_client._connection.execute_command.side_effect = None
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr=""
+        )
+        assert cli_client.execute_cli_client_command("--event link_change") == "output"
+        assert cli_client.circuit_breaker.state == "closed"
+
+    def test_expired_deadline_does_not_hold_half_open_circuit(self, cli_client, mocker):
+        clock = mocker.Mock(return_value=0.0)
+        cli_client.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        cli_client._connection.execute_command.side_effect = TimeoutError
+        with pytest.raises(TimeoutError):
+            cli_client.execute_cli_client_command("--event link_change")
+        clock.return_value = 10.0
+        deadline_clock = mocker.Mock(return_value=0.0)
+        with deadline_scope("operation", 1, ["step"], clock=deadline_clock):
+            deadline_clock.return_value = 2.0
+            with pytest.raises(CliClientDeadlineExceeded):
+                cli_client.execute_cli_client_command("--event link_change")
+        assert cli_client.circuit_breaker.state == "half-open"
+        cli_client._connection.execute_command.side_effect = None
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="output", stderr=""
+        )
+        assert cli_client.execute_cli_client_command("--event link_change") == "output"
+        assert cli_client.circuit_breaker.state == "closed"
+
+    @pytest.mark.parametrize(
+        "stdout, match",
+        [
+            ("out\n__cli_client_batch_rc_abcd 0\nerror\n__cli_client_batch_rc_abcd 1\n", "--event b"),
+            ("out\n__cli_client_batch_rc_abcd 0\n", "incomplete"),
+        ],
+    )
+    def test_execute_cli_client_batch_failure(self, cli_client, mocker, stdout, match):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=stdout, stderr=""
+        )
+        with pytest.raises(CliClientException, match=match):
+            cli_client.execute_cli_client_batch(["--event a", "--event b"])
+
+    def test_get_vsi_statistics_bulk(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        stats = "ingress packet: {0} bytes: 0\negress packet: {1} bytes: 0\n"
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout="\n__cli_client_batch_rc_abcd 0\n"
+            f"{stats.format(1, 2)}\n__cli_client_batch_rc_abcd 0\n"
+            f"{stats.format(3, 4)}\n__cli_client_batch_rc_abcd 0\n",
+            stderr="",
+        )
+        result = cli_client.get_vsi_statistics_bulk([5, 6, 5], warm_up=[6, 7])
+        assert list(result) == [5, 6]
+        assert (result[5].ingress.packet, result[5].egress.packet) == (1, 2)
+        assert (result[6].ingress.packet, result[6].egress.packet) == (3, 4)
+        script = cli_client._connection.execute_command.call_args.args[0]
+        assert script.startswith("cli_client --query --statistics --vsi 6 > /dev/null; ")
+        assert script.count("--query --statistics --vsi") == 3
+        assert cli_client.execution_stats.executions == 1
+
+    def test_get_switch_stats_bulk(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        mocker.patch("mfd_cli_client.structures.time", return_value=100.0)
+        stats = "ingress packet: {0} bytes: 0\negress tc 7 packet counter: {1}\n"
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout="\n__cli_client_batch_rc_abcd 0\n"
+            f"{stats.format(1, 2)}\n__cli_client_batch_rc_abcd 0\n"
+            f"{stats.format(3, 4)}\n__cli_client_batch_rc_abcd 0\n",
+            stderr="",
+        )
+        result = cli_client.get_switch_stats_bulk([1, 2, 1], warm_up=[2])
+        assert list(result) == [1, 2]
+        assert (result[1].ingress.packet, result[1].egress.traffic_class_counters[7]) == (1, 2)
+        assert (result[2].ingress.packet, result[2].egress.traffic_class_counters[7]) == (3, 4)
+        assert result[1].window.wall_finished == result[2].window.wall_finished == 100.0
+        assert result[1].window is result[2].window
+        assert result[1].window.started <= result[1].window.finished
+        script = cli_client._connection.execute_command.call_args.args[0]
+        assert script.startswith("cli_client --query --statistics --switch 2 > /dev/null; ")
+        assert cli_client.execution_stats.executions == 1
+
+    def test_raw_outputs_are_archived(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        cli_client.archive = mocker.Mock()
+        cli_client._connection.ip = "10.10.10.10"
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout="\n__cli_client_batch_rc_abcd 0\ningress packet: 1 bytes: 0\n\n__cli_client_batch_rc_abcd 0\n",
+            stderr="",
+        )
+        cli_client.get_vsi_statistics_bulk([5])
+        cli_client.archive.append.assert_called_once_with(
+            "--query --statistics --vsi 5", "ingress packet: 1 bytes: 0\n", host="10.10.10.10"
+        )
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="Any output", stderr=""
+        )
+        cli_client.execute_cli_client_command(command="foo")
+        cli_client.archive.append.assert_called_with("foo", "Any output", host="10.10.10.10")
+
+    def test_statistics_warm_up_is_not_archived(self, cli_client, tmp_path):
+        cli_client.archive = OutputArchive(tmp_path / "archive")
+        cli_client._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=output, stderr="")
+            for output in ("ingress packet: 1 bytes: 0", "ingress packet: 2 bytes: 0")
+        ]
+        cli_client.get_switch_stats(switch_id=1)
+        cli_client.archive.flush()
+        assert len(cli_client.archive) == 1
+        assert [entry.count for entry in cli_client.archive.chunks()] == [1]
+        assert [record.output for record in cli_client.archive.records()] == ["ingress packet: 2 bytes: 0"]
+
+    def test_execute_cli_client_command_compressed(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        output = "fn_id: 0x0" + " " * 4096
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout=base64.encodebytes(gzip.compress(output.encode())).decode() + "\n__cli_client_pipe_rc_abcd 0\n",
+            stderr="",
+        )
+        assert cli_client.execute_cli_client_command(command="--query --config --verbose", compress=True) == output
+        cli_client._connection.execute_command.assert_called_once_with(
+            "{ rc=$( { { cli_client --query --config --verbose; printf '%d' $? >&3; } | gzip -c | base64 >&4; }"
+            " 3>&1 ); } 4>&1; printf '\\n__cli_client_pipe_rc_abcd %s\\n' \"$rc\"",
+            timeout=120,
+            expected_return_codes=frozenset({0}),
+            shell=True,
+        )
+        stats = cli_client.execution_stats
+        assert stats.compressed_executions == 1
+        assert stats.decompressed_bytes == len(output)
+        assert stats.compression_ratio > 10
+
+    def test_execute_cli_client_command_compressed_keeps_return_code(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        # gzip and base64 succeed on empty output of failed cli_client
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout=base64.encodebytes(gzip.compress(b"")).decode() + "\n__cli_client_pipe_rc_abcd 2\n",
+            stderr="",
+        )
+        with pytest.raises(CliClientException, match="unexpected return code 2"):
+            cli_client.execute_cli_client_command(command="--query --config --verbose", compress=True)
+        assert cli_client._connection.execute_command.call_args.kwargs["expected_return_codes"] == frozenset({0})
+        assert (
+            cli_client.execute_cli_client_command(
+                command="--query --config --verbose", compress=True, expected_return_codes={0, 2}
+            )
+            == ""
+        )
+        assert cli_client.compression.enabled
+
+    def test_execute_cli_client_command_compressed_automatically(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.monotonic", side_effect=[0.0, 2.0, 10.0, 10.5])
+        output = "fn_id: 0x0" + " " * 4096
+        cli_client.compression = CompressionPolicy(threshold=1024)
+        cli_client._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=output, stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="command",
+                stdout=base64.encodebytes(gzip.compress(output.encode())).decode(),
+                stderr="",
+            ),
+        ]
+        assert cli_client.execute_cli_client_command(command="--query --config --verbose") == output
+        assert cli_client.execute_cli_client_command(command="--query --config --verbose") == output
+        assert "| gzip -c | base64 >&4;" in cli_client._connection.execute_command.call_args.args[0]
+        assert cli_client.execution_stats.compressed_executions == 1
+        assert cli_client.execution_stats.compression_time_saved == pytest.approx(1.5)
+
+    def test_execute_cli_client_command_compression_falls_back_when_not_supported_on_cp(self, cli_client):
+        cli_client._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr="gzip: not found"),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="output", stderr=""),
+        ]
+        assert cli_client.execute_cli_client_command(command="--query --config --verbose", compress=True) == "output"
+        assert not cli_client.compression.enabled
+        assert cli_client._connection.execute_command.call_args.args == ("cli_client --query --config --verbose",)
+        assert cli_client.execution_stats.compressed_executions == 0
+        assert cli_client.execution_stats.compression_ratio is None
+
+    def test_mutating_command_is_not_repeated_when_compressed_output_is_undecodable(self, cli_client, caplog):
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="gzip: not found", stderr=""
+        )
+        with pytest.raises(CliClientException, match="not executed again.*Raw output: 'gzip: not found'"):
+            cli_client.execute_cli_client_command(command="--event link_change --link_status 1", compress=True)
+        assert cli_client._connection.execute_command.call_count == 1
+        assert not cli_client.compression.enabled
+        assert "Compressed transport disabled" in caplog.text
+
     def test_add_group_vf2vm(self, cli_client, mocker):
         cli_client.add_psm_vm_node = mocker.create_autospec(cli_client.add_psm_vm_node)
         cli_client.add_vf_to_vm_node = mocker.create_autospec(cli_client.add_vf_to_vm_node)
@@ -113,6 +709,37 @@ class TestCliClient:
         test_result = cli_client.get_switch_stats()
         assert test_result == expected_result
 
+    def test_statistics_queries_are_not_coalesced(self, coalescing_cli_client, mocker):
+        cli_client = coalescing_cli_client
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="", stderr=""
+        )
+        do_spy = mocker.spy(cli_client._single_flight, "do")
+        mocker.patch("mfd_cli_client.base.parse_switch_stats")
+        mocker.patch("mfd_cli_client.base.parse_vsi_statistics")
+        cli_client.get_switch_stats(switch_id=2)
+        cli_client.get_vsi_statistics(vsi_id=3)
+        do_spy.assert_not_called()
+        assert cli_client.execution_stats.executions == 4
+
+    def test_statistics_window_excludes_rate_limit_wait(self, cli_client, mocker):
+        clock = [0.0]
+
+        @contextmanager
+        def limit():
+            clock[0] += 5.0
+            yield 5.0
+
+        def execute_command(*args, **kwargs):
+            clock[0] += 1.0
+            return ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr="")
+
+        mocker.patch("mfd_cli_client.structures.monotonic", side_effect=lambda: clock[0])
+        cli_client.query_rate_limit = mocker.Mock(limit=limit)
+        cli_client._connection.execute_command.side_effect = execute_command
+        window = cli_client.get_vsi_statistics(vsi_id=1).window
+        assert (window.started, window.finished) == (11.0, 12.0)
+
     def test_get_vsi_stats(self, cli_client):
         output = dedent(
             """No IP address specified, defaulting to localhost
@@ -157,6 +784,7 @@ class TestCliClient:
         )
         test_result = cli_client.get_vsi_statistics()
         assert test_result == expected_result
+        assert test_result.window.started <= test_result.window.finished
 
     def test_get_tc_priorities_switch(self, cli_client, mocker):
         cli_client.get_switch_stats = mocker.create_autospec(
@@ -173,6 +801,28 @@ class TestCliClient:
             tx=[26553, 0, 0, 0, 0, 0, 0, 0], rx=[14101, 0, 0, 0, 0, 0, 0, 0]
         )
 
+    def test_switch_stats_snapshot_is_shared(self, cli_client, mocker):
+        stats = SwitchStats(FlowStats([1, 3], 4, 0), FlowStats([6, 2], 8, 1), 9, 3, 0, AcquisitionWindow(1, 2, 4, 5.0))
+        get_switch_stats = mocker.patch.object(cli_client, "get_switch_stats", return_value=stats)
+        snapshot = cli_client.get_switch_stats_snapshot(2)
+        assert (snapshot.switch_id, snapshot.stats, snapshot.timestamp) == (2, stats, 5.0)
+        assert cli_client.get_tc_priorities_switch(2, max_age=60) == TrafficClassCounters(tx=[1, 3], rx=[6, 2])
+        get_switch_stats.assert_called_once_with(2)
+        cli_client.get_tc_priorities_switch(2)
+        assert get_switch_stats.call_count == 2
+
+    def test_switch_stats_bulk_stores_snapshots(self, cli_client, mocker):
+        mocker.patch("mfd_cli_client.base.token_hex", return_value="abcd")
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout="ingress tc 0 packet counter: 7\n\n__cli_client_batch_rc_abcd 0\n",
+            stderr="",
+        )
+        cli_client.get_switch_stats_bulk([3], warm_up=False)
+        assert cli_client.get_tc_priorities_switch(3, max_age=60).rx == [7, 0, 0, 0, 0, 0, 0, 0]
+        assert cli_client._connection.execute_command.call_count == 1
+
     def test_find_vf_vsi(self, cli_client):
         output = dedent(
             """\
@@ -306,6 +956,28 @@ class TestCliClient:
         test_result = cli_client.get_mac_and_vsi_list()
         assert test_result == expected_result
 
+    def test_add_group_vf2vm_stops_at_deadline(self, cli_client, mocker):
+        cli_client.add_psm_vm_node = mocker.create_autospec(cli_client.add_psm_vm_node)
+        cli_client.add_vf_to_vm_node = mocker.create_autospec(
+            cli_client.add_vf_to_vm_node, side_effect=lambda vm_id, vf_id: sleep(0.1)
+        )
+        with pytest.raises(CliClientDeadlineExceeded, match="completed 3 of 7 steps") as error:
+            cli_client.add_group_vf2vm({0: [0, 1], 1: [2, 3, 4]}, deadline=0.05)
+        assert error.value.completed == ["add VM node 0", "add VM node 1", "map VF 0 to VM node 0"]
+        assert error.value.pending[0] == "map VF 1 to VM node 0"
+        assert cli_client.add_vf_to_vm_node.call_count == 1
+
+    def test_prepare_vm_vsi_bounds_command_timeouts_by_deadline(self, cli_client):
+        cli_client._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="command succeeded", stderr=""
+        )
+        cli_client.prepare_vm_vsi(vf_amount=2, deadline=30)
+        timeouts = [call.kwargs["timeout"] for call in cli_client._connection.execute_command.call_args_list]
+        assert len(timeouts) == 4
+        assert all(timeout <= 30 for timeout in timeouts)
+        cli_client.prepare_vm_vsi(vf_amount=1)
+        assert cli_client._connection.execute_command.call_args.kwargs["timeout"] == 120
+
     def test_prepare_vm_vsi(self, cli_client, mocker):
         cli_client.add_psm_vm_node = mocker.create_autospec(cli_client.add_psm_vm_node)
         cli_client.add_vf_to_vm_node = mocker.create_autospec(cli_client.add_vf_to_vm_node)
@@ -444,6 +1116,16 @@ class TestCliClient:
         mocker.patch("mfd_cli_client.base.sleep")
         cli_client.apply_up_tc_changes("file")
 
+    def test_apply_changes_wait_is_clamped_to_deadline(self, cli_client, mocker):
+        cli_client.execute_cli_client_command = mocker.create_autospec(
+            cli_client.execute_cli_client_command, return_value="Command succeeded"
+        )
+        wait = mocker.patch("mfd_cli_client.base.sleep", side_effect=sleep)
+        with pytest.raises(CliClientDeadlineExceeded) as error:
+            cli_client.apply_grl_changes("file", deadline=0.05)
+        assert wait.call_args.args[0] <= 0.05
+        assert (error.value.completed, error.value.pending) == (["apply GRL config"], ["wait for update of GRL"])
+
     def test_apply_tuprl_changes(self, cli_client, mocker):
         output = dedent(
             """\
@@ -0,0 +1,164 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import io
+import json
+
+import pytest
+from mfd_typing import MACAddress
+
+from mfd_cli_client import simulation
+from mfd_cli_client.archive import OutputArchive
+from mfd_cli_client.cli import counter_rates, main, to_jsonable, watch
+from mfd_cli_client.structures import VsiConfigListEntry
+from mfd_cli_client.vsi_table import VsiConfigTable
+
+
+def run(argv):
+    stream = io.StringIO()
+    return main(argv, stream), stream.getvalue()
+
+
+class TestToJsonable:
+    def test_converts_table_of_entries(self):
+        entry = VsiConfigListEntry(0x0, 0x1, True, 0xD, 0x0, True, False, MACAddress("00:0d:00:00:03:14"))
+        assert to_jsonable(VsiConfigTable.from_entries([entry])) == [
+            {
+                "fn_id": 0,
+                "host_id": 1,
+                "is_vf": True,
+                "vsi_id": 13,
+                "vport_id": 0,
+                "is_created": True,
+                "is_enabled": False,
+                "mac": "00:0d:00:00:03:14",
+            }
+        ]
+
+    def test_converts_int_keys(self):
+        assert to_jsonable({0: {1: [0, 1]}}) == {"0": {"1": [0, 1]}}
+
+
+class TestCounterRates:
+    def test_rates_of_nested_counters(self):
+        previous = {"ingress": {"packet": 100, "tc": [10, 20]}, "egress": {"unknown": None}}
+        current = {"ingress": {"packet": 300, "tc": [30, 20]}, "egress": {"unknown": None}}
+        assert counter_rates(previous, current, 2.0) == {
+            "ingress": {"packet": 100.0, "tc": [10.0, 0.0]},
+            "egress": {"unknown": None},
+        }
+
+    def test_timestamps_have_no_rate(self):
+        assert counter_rates({"timestamp": 1.0}, {"timestamp": 3.0}, 2.0) == {"timestamp": None}
+
+    def test_reset_counter_has_unknown_rate(self):
+        assert counter_rates({"packet": 300}, {"packet": 5}, 1.0) == {"packet": None}
+
+
+class TestWatch:
+    def test_counters_emit_rates_per_interval(self):
+        now = [0.0]
+        samples = iter([{"packet": 0}, {"packet": 100}, {"packet": 300}])
+        records = []
+        watch(
+            lambda: next(samples),
+            1.0,
+            counters=True,
+            count=2,
+            emit=records.append,
+            clock=lambda: now[-1],
+            sleeper=lambda s: now.append(now[-1] + s),
+        )
+        assert [record["rates"] for record in records] == [{"packet": 100.0}, {"packet": 200.0}]
+        assert [record["interval"] for record in records] == [1.0, 1.0]
+
+    def test_tables_emit_only_changes(self):
+        now = [0.0]
+        samples = iter([[1], [1], [1, 2]])
+        records = []
+        watch(
+            lambda: next(samples),
+            1.0,
+            counters=False,
+            count=2,
+            emit=records.append,
+            clock=lambda: now[-1],
+            sleeper=lambda s: now.append(now[-1] + s),
+        )
+        assert [record["data"] for record in records] == [[1], [1, 2]]
+
+
+class TestMain:
+    def test_switch_stats_json(self):
+        code, output = run(["--simulate", "switch-stats"])
+        stats = json.loads(output)
+        assert code == 0
+        assert stats["ingress"]["packet"] == sum(stats["ingress"]["traffic_class_counters"])
+
+    def test_vsi_config_ndjson(self):
+        code, output = run(["--simulate", "--vsi-count", "8", "--host-count", "2", "vsi-config", "--format", "ndjson"])
+        lines = output.splitlines()
+        assert code == 0
+        assert len(lines) == 1
+        assert len(json.loads(lines[0])) == 8
+
+    def test_watch_prints_rates(self, mocker):
+        mocker.patch("mfd_cli_client.cli.time.sleep")
+        code, output = run(["--simulate", "switch-stats", "--watch", "0", "--count", "2"])
+        records = [json.loads(line) for line in output.splitlines()]
+        assert code == 0
+        assert len(records) == 2
+        assert all(rate > 0 for rate in records[0]["rates"]["egress"]["traffic_class_counters"])
+
+    def test_record_and_replay(self, tmp_path):
+        recording = tmp_path / "recording.json"
+        _, recorded = run(["--simulate", "--record", str(recording), "qos-vm-info"])
+        code, replayed = run(["--replay", str(recording), "qos-vm-info"])
+        assert code == 0
+        assert replayed == recorded
+        assert "--query --statistics --vm_qos_info" in json.loads(recording.read_text())
+
+    def test_archive_raw_outputs(self, tmp_path):
+        path = tmp_path / "outputs.archive"
+        run(["--simulate", "--archive", str(path), "vsi-stats", "--watch", "0", "--count", "1"])
+        assert [record.command for record in OutputArchive(path).records()] == ["--query --statistics --vsi 1"] * 2
+
+    def test_persistent_runner_falls_back_on_simulated_cp(self):
+        assert run(["--simulate", "--persistent-runner", "qos-vm-info"]) == run(["--simulate", "qos-vm-info"])
+
+    def test_missing_recording_is_reported(self, tmp_path, capsys):
+        recording = tmp_path / "recording.json"
+        simulation.save_recording({}, recording)
+        code, output = run(["--replay", str(recording), "vsi-stats"])
+        assert code == 1
+        assert output == ""
+        assert "No recorded output" in capsys.readouterr().err
+
+    def test_ip_required_for_remote_connection(self, capsys):
+        assert run(["--connection", "ssh", "vsi-config"])[0] == 1
+        assert "--ip is required" in capsys.readouterr().err
+
+    def test_query_is_required(self):
+        with pytest.raises(SystemExit):
+            main([])
+
+    def test_top_ranks_simulated_vsis(self):
+        code, output = run(
+            [
+                "--simulate",
+                "--vsi-count",
+                "32",
+                "top",
+                "--interval",
+                "0.01",
+                "--count",
+                "1",
+                "--limit",
+                "3",
+                "--format",
+                "ndjson",
+            ]
+        )
+        record = json.loads(output)
+        assert code == 0
+        assert len(record["traffic"]) == 3
+        assert record["traffic"][0]["ingress_pps"] >= record["traffic"][-1]["ingress_pps"] > 0
@@ -0,0 +1,88 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Semaphore
+
+import pytest
+
+from mfd_cli_client.coalescing import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.fixture
+    def single_flight(self):
+        return SingleFlight()
+
+    def test_do_without_concurrency(self, single_flight):
+        assert single_flight.do("key", lambda: 1) == (1, False)
+        assert single_flight.do("key", lambda: 2) == (2, False)
+        assert single_flight.in_flight == 0
+
+    @pytest.fixture
+    def waiting(self, mocker):
+        """Semaphore released every time caller starts waiting for call in flight."""
+        waiting = Semaphore(0)
+
+        class ObservedEvent(Event):
+            def wait(self, timeout=None):
+                waiting.release()
+                return super().wait(timeout)
+
+        mocker.patch("mfd_cli_client.coalescing.Event", ObservedEvent)
+        return waiting
+
+    def test_do_shares_result_of_call_in_flight(self, single_flight, waiting):
+        started, release = Event(), Event()
+        calls = []
+
+        def leader_function():
+            calls.append("leader")
+            started.set()
+            release.wait(5)
+            return "output"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(single_flight.do, "key", leader_function)
+            assert started.wait(5)
+            followers = [executor.submit(single_flight.do, "key", lambda: calls.append("follower")) for _ in range(3)]
+            for _ in followers:
+                assert waiting.acquire(timeout=5)
+            release.set()
+            assert leader.result(5) == ("output", False)
+            assert [follower.result(5) for follower in followers] == [("output", True)] * 3
+        assert calls == ["leader"]
+
+    def test_do_propagates_exception_to_waiting_callers(self, single_flight, waiting):
+        started, release = Event(), Event()
+
+        def failing_function():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, "key", failing_function)
+            assert started.wait(5)
+            follower = executor.submit(single_flight.do, "key", lambda: "not shared")
+            assert waiting.acquire(timeout=5)
+            release.set()
+            with pytest.raises(RuntimeError):
+                leader.result(5)
+            with pytest.raises(RuntimeError):
+                follower.result(5)
+        assert single_flight.in_flight == 0
+
+    def test_do_different_keys_are_not_shared(self, single_flight):
+        started, release = Event(), Event()
+
+        def blocking_function():
+            started.set()
+            release.wait(5)
+            return "first"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(single_flight.do, "first", blocking_function)
+            assert started.wait(5)
+            assert single_flight.do("second", lambda: "second") == ("second", False)
+            release.set()
+            assert first.result(5) == ("first", False)
@@ -0,0 +1,61 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import base64
+import gzip
+
+import pytest
+
+from mfd_cli_client.compression import CompressionPolicy
+
+
+def encode(text):
+    return base64.encodebytes(gzip.compress(text.encode())).decode()
+
+
+class TestCompressionPolicy:
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            CompressionPolicy(codec="lzma")
+
+    def test_command_type_ignores_values(self):
+        assert CompressionPolicy.command_type("--query --statistics --vsi 5") == "--query --statistics --vsi"
+        assert CompressionPolicy.command_type("--query --statistics --vsi 0x6") == "--query --statistics --vsi"
+
+    def test_should_compress_after_large_output_learned(self):
+        policy = CompressionPolicy(threshold=100)
+        assert not policy.should_compress("--query --config --verbose")
+        policy.record("--query --config --verbose", 1000, 1.0, compressed=False)
+        policy.record("--query --statistics --vsi 1", 10, 1.0, compressed=False)
+        assert policy.should_compress("--query --config --verbose")
+        assert not policy.should_compress("--query --statistics --vsi 2")
+        assert not policy.should_compress("--query --config --verbose", requested=False)
+
+    def test_should_compress_explicit_request(self):
+        policy = CompressionPolicy(threshold=None)
+        policy.record("--query --config --verbose", 10**6, 1.0, compressed=False)
+        assert not policy.should_compress("--query --config --verbose")
+        assert policy.should_compress("--query --config --verbose", requested=True)
+        policy.enabled = False
+        assert not policy.should_compress("--query --config --verbose", requested=True)
+
+    def test_record_learns_smoothed_size(self):
+        policy = CompressionPolicy(smoothing=0.5)
+        policy.record("--query --config --verbose", 100, 1.0, compressed=False)
+        policy.record("--query --config --verbose", 200, 1.0, compressed=True)
+        assert policy.learned_size("--query --config --verbose") == 150
+
+    def test_record_returns_time_saved(self):
+        policy = CompressionPolicy(smoothing=1.0)
+        assert policy.record("--query --config --verbose", 100, 2.0, compressed=True) is None
+        assert policy.record("--query --config --verbose", 100, 2.0, compressed=False) is None
+        assert policy.record("--query --config --verbose", 100, 0.5, compressed=True) == pytest.approx(1.5)
+
+    def test_decode(self):
+        policy = CompressionPolicy()
+        assert policy.remote_pipe == "gzip -c | base64"
+        assert policy.decode(encode("fn_id: 0x0" + " " * 1000)) == "fn_id: 0x0" + " " * 1000
+
+    @pytest.mark.parametrize("payload", ["", "sh: gzip: not found", base64.b64encode(b"not gzip").decode()])
+    def test_decode_invalid_payload(self, payload):
+        with pytest.raises(ValueError):
+            CompressionPolicy().decode(payload)
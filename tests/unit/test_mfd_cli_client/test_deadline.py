@@ -0,0 +1,86 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_cli_client.deadline import current_deadline, deadline_scope
+from mfd_cli_client.exceptions import CliClientDeadlineExceeded, CliClientTimeout
+
+
+class FakeClock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestDeadline:
+    def test_without_deadline_nothing_is_current(self, clock):
+        with deadline_scope("operation", None, ["a"], clock=clock) as deadline:
+            assert current_deadline() is None
+            clock.now = 1e9
+            with deadline.step("a"):
+                pass
+        assert deadline.completed == ["a"]
+
+    def test_sub_command_timeout_is_bounded_by_time_left(self, clock):
+        with deadline_scope("operation", 30, ["a"], clock=clock) as deadline:
+            assert current_deadline() is deadline
+            assert deadline.timeout(10) == 10
+            clock.now = 25.5
+            assert deadline.timeout(10) == 5
+            clock.now = 29.9
+            assert deadline.timeout(10) == 1
+            clock.now = 30
+            with pytest.raises(CliClientDeadlineExceeded):
+                deadline.timeout(10)
+        assert current_deadline() is None
+
+    def test_partial_progress_is_reported(self, clock):
+        steps = ["a", "b", "c"]
+        with pytest.raises(CliClientDeadlineExceeded, match="completed 2 of 3 steps, stopped at: c") as error:
+            with deadline_scope("operation", 10, steps, clock=clock) as deadline:
+                for step in steps:
+                    with deadline.step(step):
+                        clock.now += 6
+        assert isinstance(error.value, CliClientTimeout)
+        assert (error.value.operation, error.value.completed, error.value.pending) == ("operation", ["a", "b"], ["c"])
+        assert error.value.elapsed == 12
+
+    def test_timeout_after_deadline_is_reported_as_exceeded(self, clock):
+        with pytest.raises(CliClientDeadlineExceeded) as error:
+            with deadline_scope("operation", 10, ["a"], clock=clock) as deadline:
+                with deadline.step("a"):
+                    clock.now = 10
+                    raise TimeoutError
+        assert isinstance(error.value.__cause__, TimeoutError)
+
+    def test_timeout_within_deadline_is_raised(self, clock):
+        with pytest.raises(TimeoutError):
+            with deadline_scope("operation", 10, ["a"], clock=clock) as deadline:
+                with deadline.step("a"):
+                    raise TimeoutError
+
+    def test_clamp(self, clock):
+        with deadline_scope("operation", 4, [], clock=clock) as deadline:
+            assert deadline.clamp(10) == 4
+            assert deadline.clamp(1) == 1
+            clock.now = 5
+            assert deadline.clamp(1) == 0
+
+    def test_nested_operation_inherits_deadline(self, clock):
+        with pytest.raises(CliClientDeadlineExceeded) as error:
+            with deadline_scope("outer", 10, ["inner", "last"], clock=clock) as outer:
+                with outer.step("inner"):
+                    with deadline_scope("inner", 60, ["x", "y"], clock=clock) as inner:
+                        assert inner.expires_at == 10
+                        with inner.step("x"):
+                            clock.now = 11
+                        with inner.step("y"):
+                            pass
+        assert (error.value.operation, error.value.pending) == ("outer", ["inner", "last"])
+        assert error.value.__cause__.completed == ["x"]
@@ -0,0 +1,185 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import urllib.error
+import urllib.request
+
+import pytest
+from mfd_typing import MACAddress
+
+from mfd_cli_client.base import CliClient
+from mfd_cli_client.exceptions import CliClientException
+from mfd_cli_client.exporter import (
+    CONTENT_TYPE,
+    BackgroundSampler,
+    CpSample,
+    CpState,
+    MetricsExporter,
+    render_openmetrics,
+)
+from mfd_cli_client.simulation import FakeConnection, SimulatedResponder
+from mfd_cli_client.structures import FlowStats, SwitchStats, VSIFlowStats, VSIStats, VsiConfigListEntry
+from mfd_cli_client.vsi_table import VsiConfigTable
+
+SAMPLE = CpSample(
+    timestamp=100.0,
+    duration=0.5,
+    switch_stats={1: SwitchStats(FlowStats([1, 2], 3, 4), FlowStats([5, 6], 11, 7), 8, 9, 10)},
+    vsi_stats={5: VSIStats(VSIFlowStats(20, 18, 1, 1, 2, 3, 4), VSIFlowStats(30, 27, 2, 1, 5, 6))},
+    vsis={5: (0, 2, True)},
+    qos_vm_info={0: {1: [0, 1], 2: [2]}, 1: {}},
+)
+
+
+def lines(states):
+    return render_openmetrics(states).splitlines()
+
+
+class TestRenderOpenMetrics:
+    def test_counters_of_sample(self):
+        output = lines({"cp0": CpState(SAMPLE, up=True)})
+        assert 'cli_client_up{cp="cp0"} 1' in output
+        assert 'cli_client_switch_packets_total{cp="cp0",switch="1",direction="ingress"} 11' in output
+        assert (
+            'cli_client_switch_traffic_class_packets_total{cp="cp0",switch="1",direction="egress",traffic_class="1"} 2'
+            in output
+        )
+        assert 'cli_client_switch_cast_packets_total{cp="cp0",switch="1",cast="broadcast"} 10' in output
+        assert 'cli_client_vsi_info{cp="cp0",vsi="5",host="0",fn="2",vf="true"} 1' in output
+        assert 'cli_client_vsi_packets_total{cp="cp0",vsi="5",direction="egress",cast="unicast"} 27' in output
+        assert 'cli_client_vsi_errors_total{cp="cp0",vsi="5",direction="ingress"} 3' in output
+        assert 'cli_client_vsi_unknown_packets_total{cp="cp0",vsi="5",direction="ingress"} 4' in output
+        assert not any(
+            line.startswith('cli_client_vsi_unknown_packets_total{cp="cp0",vsi="5",direction="egress"')
+            for line in output
+        )
+        assert 'cli_client_qos_vms{cp="cp0",host="0"} 2' in output
+        assert 'cli_client_qos_vfs{cp="cp0",host="0",vm="2"} 1' in output
+        assert output[-1] == "# EOF"
+
+    def test_families_are_contiguous_across_cps(self):
+        output = lines({"cp0": CpState(SAMPLE, up=True), "cp1": CpState(SAMPLE, up=True)})
+        types = [line for line in output if line.startswith("# TYPE")]
+        assert len(types) == len(set(types))
+        packets = [i for i, line in enumerate(output) if line.startswith("cli_client_switch_packets_total")]
+        assert packets == list(range(packets[0], packets[0] + 4))
+
+    def test_failed_cp_without_sample(self):
+        output = lines({"cp0": CpState(errors=2, last_error="boom")})
+        assert output == [
+            "# TYPE cli_client_up gauge",
+            "# HELP cli_client_up Whether last sampling round of CP succeeded.",
+            'cli_client_up{cp="cp0"} 0',
+            "# TYPE cli_client_sample_errors counter",
+            "# HELP cli_client_sample_errors Failed sampling rounds of CP.",
+            'cli_client_sample_errors_total{cp="cp0"} 2',
+            "# EOF",
+        ]
+
+    def test_missing_counters_are_skipped(self):
+        sample = CpSample(
+            timestamp=100.0,
+            duration=0.5,
+            switch_stats={1: SwitchStats(FlowStats([1], 3, None), FlowStats([5], 11, 7), None, 9, 10)},
+            vsi_stats={5: VSIStats(VSIFlowStats(20, 18, 1, 1, None, None), VSIFlowStats(30, 27, 2, 1, 5, 6))},
+            vsis={},
+            qos_vm_info={},
+        )
+        output = lines({"cp0": CpState(sample, up=True)})
+        assert not any(line.endswith(" None") for line in output)
+        assert 'cli_client_vsi_discards_total{cp="cp0",vsi="5",direction="egress"} 5' in output
+        assert not any(
+            line.startswith('cli_client_vsi_errors_total{cp="cp0",vsi="5",direction="ingress"') for line in output
+        )
+        assert not any('cast="unicast"' in line and "switch_cast" in line for line in output)
+
+    def test_label_values_are_escaped(self):
+        assert 'cli_client_up{cp="a\\"b\\\\c"} 0' in lines({'a"b\\c': CpState()})
+
+
+class TestBackgroundSampler:
+    @pytest.fixture()
+    def client(self, mocker):
+        client = mocker.Mock()
+        client.get_vsi_config_list.return_value = VsiConfigTable.from_entries(
+            [VsiConfigListEntry(0x2, 0x0, True, 0x5, 0x0, True, True, MACAddress("00:00:00:00:00:05"))]
+        )
+        client.get_vsi_statistics_bulk.return_value = SAMPLE.vsi_stats
+        client.get_switch_stats_bulk.side_effect = lambda switch_ids, warm_up: {
+            switch_id: SAMPLE.switch_stats[1] for switch_id in switch_ids
+        }
+        client.read_qos_vm_info.return_value = SAMPLE.qos_vm_info
+        return client
+
+    def test_refresh_collects_all_counters(self, client):
+        sampler = BackgroundSampler({"cp0": client}, switch_ids=(1, 2))
+        state = sampler.refresh()["cp0"]
+        assert state.up
+        assert state.sample.vsis == {5: (0, 2, True)}
+        assert list(state.sample.switch_stats) == [1, 2]
+        client.get_vsi_statistics_bulk.assert_called_once_with({5: (0, 2, True)}, warm_up=[5])
+        client.get_switch_stats_bulk.assert_called_once_with((1, 2), warm_up=[1, 2])
+        client.get_vsi_config_list.assert_called_once_with(max_age=60.0)
+        assert sampler.generation == 1
+
+    def test_vsis_are_warmed_up_once(self, client):
+        sampler = BackgroundSampler({"cp0": client})
+        sampler.refresh()
+        sampler.refresh()
+        assert client.get_vsi_statistics_bulk.call_args.kwargs["warm_up"] == []
+        assert client.get_switch_stats_bulk.call_args.kwargs["warm_up"] == []
+
+    def test_failure_keeps_last_sample(self, client):
+        sampler = BackgroundSampler({"cp0": client})
+        sample = sampler.refresh()["cp0"].sample
+        client.read_qos_vm_info.side_effect = CliClientException("boom")
+        state = sampler.refresh()["cp0"]
+        assert (state.up, state.errors, state.last_error, state.sample) == (False, 1, "boom", sample)
+
+    def test_listeners_get_successful_samples(self, client, mocker):
+        listener = mocker.Mock(side_effect=[None, ValueError])
+        sampler = BackgroundSampler({"cp0": client}, listeners=[listener])
+        sample = sampler.refresh()["cp0"].sample
+        listener.assert_called_once_with("cp0", sample)
+        assert sampler.refresh()["cp0"].up
+        client.read_qos_vm_info.side_effect = CliClientException("boom")
+        sampler.refresh()
+        assert listener.call_count == 2
+
+    def test_rejects_non_positive_interval(self, client):
+        with pytest.raises(ValueError):
+            BackgroundSampler({"cp0": client}, interval=0)
+
+    def test_threads_sample_every_cp(self):
+        clients = {name: CliClient(connection=FakeConnection(SimulatedResponder(8))) for name in ("cp0", "cp1")}
+        with BackgroundSampler(clients, interval=60) as sampler:
+            pass
+        assert all(state.up for state in sampler.states.values())
+
+
+class TestMetricsExporter:
+    def test_renders_once_per_generation(self, mocker):
+        sampler = BackgroundSampler({"cp0": mocker.Mock()})
+        render = mocker.patch("mfd_cli_client.exporter.render_openmetrics", return_value="# EOF\n")
+        exporter = MetricsExporter(sampler)
+        assert exporter.render() == exporter.render() == b"# EOF\n"
+        sampler.generation += 1
+        exporter.render()
+        assert render.call_count == 2
+
+    def test_serves_metrics_over_http(self):
+        client = CliClient(connection=FakeConnection(SimulatedResponder(8)))
+        sampler = BackgroundSampler({"cp0": client})
+        sampler.refresh()
+        executed = len(client._connection.executed_commands)
+        with MetricsExporter(sampler, port=0) as exporter:
+            url = f"http://127.0.0.1:{exporter.port}"
+            for _ in range(3):
+                with urllib.request.urlopen(f"{url}/metrics") as response:
+                    assert response.headers["Content-Type"] == CONTENT_TYPE
+                    body = response.read().decode()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other")
+        assert 'cli_client_up{cp="cp0"} 1' in body
+        assert body.endswith("# EOF\n")
+        # scrapes never query CP
+        assert len(client._connection.executed_commands) == executed
@@ -0,0 +1,56 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parents[3]
+HEAVY_MODULES = ["mfd_base_tool", "mfd_common_libs", "mfd_typing", "mfd_connect"]
+
+
+def _loaded_modules(code: str) -> list:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT), os.environ.get("PYTHONPATH", "")]))
+    script = f"import sys, json\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import mfd_cli_client",
+        "from mfd_cli_client import FlowStats, SwitchStats, TrafficClassCounters",
+        "from mfd_cli_client.parsers import parse_switch_stats, parse_vsi_config_list",
+        "from mfd_cli_client.structures import VsiConfigListEntry, VSIStats",
+        "from mfd_cli_client.exceptions import CliClientException",
+        "import mfd_cli_client.parsers; mfd_cli_client.parsers.parse_vsi_config_list('')",
+    ],
+)
+def test_light_imports_do_not_load_heavy_dependencies(code):
+    modules = _loaded_modules(code)
+    assert [module for module in modules if module.split(".")[0] in HEAVY_MODULES] == []
+
+
+def test_cli_client_loaded_on_first_use():
+    modules = _loaded_modules("import mfd_cli_client; mfd_cli_client.CliClient")
+    assert "mfd_cli_client.base" in modules
+    assert "mfd_base_tool" in modules
+
+
+def test_lazy_exception_is_shared():
+    import mfd_cli_client
+    from mfd_cli_client import base, exceptions
+    from mfd_base_tool.exceptions import ToolNotAvailable
+
+    assert mfd_cli_client.CliClient is base.CliClient
+    assert exceptions.CliClientNotAvailable is base.CliClientNotAvailable
+    assert issubclass(exceptions.CliClientNotAvailable, ToolNotAvailable)
+    assert issubclass(exceptions.CliClientNotAvailable, exceptions.CliClientException)
+    with pytest.raises(AttributeError):
+        exceptions.CliClientMissing
+    with pytest.raises(AttributeError):
+        mfd_cli_client.Missing
@@ -0,0 +1,94 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_cli_client.exceptions import CliClientException
+from mfd_cli_client.link_events import FlapPlan, LinkEvent, LinkEventScheduler, LinkTarget
+
+SUCCEEDED = "command succeeded\n"
+
+
+class FakeClock:
+    now = 0.0
+
+    def __call__(self):
+        self.now += 0.0001
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestFlapPlan:
+    def test_events(self):
+        plan = FlapPlan(
+            targets=[LinkTarget(0), LinkTarget(1, vport_id=2)], speeds=("25GB", "100MB"), interval=0.5, repeat=2
+        )
+        events = plan.events()
+        assert [(event.at, event.link_status, event.link_speed) for event in events[::2]] == [
+            (0.0, "down", "25GB"),
+            (0.5, "up", "100MB"),
+            (1.0, "down", "25GB"),
+            (1.5, "up", "100MB"),
+        ]
+        assert events[1].command == "--event link_change --link_status 0 --link_speed 25GB --pf_num 0x1 --vport_id 0x2"
+
+    def test_stagger(self):
+        plan = FlapPlan(targets=[LinkTarget(0), LinkTarget(1)], sequence=("up",), stagger=0.1)
+        assert [(event.at, event.target.pf_num) for event in plan.events()] == [(0.0, 0), (0.1, 1)]
+
+    def test_all_pf_target(self):
+        assert LinkEvent(0, LinkTarget(), "up", "25GB").command == (
+            "--event link_change --link_status 1 --link_speed 25GB --all_pf"
+        )
+
+
+class TestLinkEventScheduler:
+    @pytest.fixture()
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture()
+    def client(self, mocker):
+        client = mocker.Mock()
+        client.execute_cli_client_command.return_value = SUCCEEDED
+        client.execute_cli_client_batch.side_effect = lambda commands: [SUCCEEDED] * len(commands)
+        return client
+
+    def test_batches_events_sharing_timestamp(self, client, clock):
+        plan = FlapPlan(targets=[LinkTarget(0), LinkTarget(1)], interval=1.0)
+        report = LinkEventScheduler(client, clock=clock, sleeper=clock.sleep).run(plan)
+        assert client.execute_cli_client_batch.call_count == 2
+        client.execute_cli_client_command.assert_not_called()
+        assert report.invocations == 2
+        assert len(report.sent) == 4
+        assert report.succeeded
+        assert [sent.scheduled for sent in report.sent] == [0.0, 0.0, 1.0, 1.0]
+        assert all(0 <= sent.lateness < 0.001 for sent in report.sent)
+        assert report.max_lateness < 0.001
+        assert report.jitter < 0.001
+        assert report.achieved_rate == pytest.approx(3 / (report.sent[-1].sent - report.sent[0].sent))
+
+    def test_single_event_sent_directly(self, client, clock):
+        events = [LinkEvent(0.5, LinkTarget(3), "up"), LinkEvent(0.0, LinkTarget(3), "down")]
+        report = LinkEventScheduler(client, clock=clock, sleeper=clock.sleep).run(events)
+        assert [sent.event.link_status for sent in report.sent] == ["down", "up"]
+        assert client.execute_cli_client_command.call_count == 2
+        assert report.sent[1].sent >= 0.5
+
+    def test_failure(self, client, clock):
+        client.execute_cli_client_command.return_value = "error"
+        scheduler = LinkEventScheduler(client, clock=clock, sleeper=clock.sleep)
+        with pytest.raises(CliClientException, match="Link change"):
+            scheduler.run([LinkEvent(0, LinkTarget(0), "up")])
+        scheduler.stop_on_failure = False
+        report = scheduler.run([LinkEvent(0, LinkTarget(0), "up"), LinkEvent(0.1, LinkTarget(0), "down")])
+        assert not report.succeeded
+        assert len(report.sent) == 2
+
+    def test_illegal_status_rejected_before_sending(self, client, clock):
+        with pytest.raises(CliClientException, match="Link status"):
+            LinkEventScheduler(client, clock=clock, sleeper=clock.sleep).run(
+                [LinkEvent(0, LinkTarget(0), "up"), LinkEvent(1, LinkTarget(0), "sideways")]
+            )
+        client.execute_cli_client_command.assert_not_called()
@@ -0,0 +1,113 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import csv
+import json
+
+import pytest
+
+from mfd_cli_client.link_events import LinkEvent, LinkTarget
+from mfd_cli_client.link_latency import CommandObserver, LatencyReport, LatencySample, LinkLatencyProbe
+
+
+class FakeClock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestCommandObserver:
+    @pytest.mark.parametrize(
+        "output, event, expected",
+        [
+            ("link_status: UP speed: 25GB", LinkEvent(0, LinkTarget(0), "up", "25GB"), True),
+            ("link_status: 1 speed: 25gb", LinkEvent(0, LinkTarget(0), "up", "25GB"), True),
+            ("link_status: DOWN speed: 25GB", LinkEvent(0, LinkTarget(0), "up", "25GB"), False),
+            ("link_status: UP speed: 100MB", LinkEvent(0, LinkTarget(0), "up", "25GB"), False),
+            ("no link", LinkEvent(0, LinkTarget(0), "up", "25GB"), False),
+        ],
+    )
+    def test_observer(self, mocker, output, event, expected):
+        client = mocker.Mock()
+        client.execute_cli_client_command.return_value = output
+        observer = CommandObserver(client, "--query --link", r"link_status:\s(?P<status>\w+)\sspeed:\s(?P<speed>\w+)")
+        assert observer(event) is expected
+        client.execute_cli_client_command.assert_called_once_with(command="--query --link")
+
+    def test_observer_without_speed(self, mocker):
+        client = mocker.Mock()
+        client.execute_cli_client_command.return_value = "link_status: 0"
+        observer = CommandObserver(client, "--query --link", r"link_status:\s(?P<status>\w+)")
+        assert observer(LinkEvent(0, LinkTarget(), "down", "25GB"))
+
+
+class TestLinkLatencyProbe:
+    @pytest.fixture()
+    def clock(self):
+        return FakeClock()
+
+    def test_run(self, mocker, clock):
+        client = mocker.Mock()
+        client.send_link_change_event_per_pf.side_effect = lambda *args: clock.sleep(0.001)
+        observer = mocker.Mock(side_effect=[False, False, True, True])
+        probe = LinkLatencyProbe(client, observer, poll_interval=0.01, clock=clock, sleeper=clock.sleep)
+        report = probe.run(LinkTarget(pf_num=1, vport_id=2), trials=2, speeds=["25GB"])
+
+        assert client.send_link_change_event_per_pf.call_args_list == [
+            mocker.call("down", "25GB", 1, 2),
+            mocker.call("up", "25GB", 1, 2),
+        ]
+        first, second = report.samples
+        assert first.latency == pytest.approx(0.021)
+        assert first.acknowledged == pytest.approx(0.001)
+        assert (first.polls, second.polls) == (3, 1)
+        assert second.latency == pytest.approx(0.001)
+        assert second.sent == pytest.approx(0.021)
+
+    def test_all_pf_and_timeout(self, mocker, clock):
+        client = mocker.Mock()
+        probe = LinkLatencyProbe(client, lambda event: False, timeout=0.05, clock=clock, sleeper=clock.sleep)
+        sample = probe.measure(LinkEvent(0, LinkTarget(), "up", "25GB"))
+        client.send_link_change_event_all_pf.assert_called_once_with("up", "25GB")
+        assert sample.observed is None
+        assert sample.latency is None
+        assert sample.polls == 6
+
+
+class TestLatencyReport:
+    @pytest.fixture()
+    def report(self):
+        samples = [
+            LatencySample("up", "25GB", 0, None, sent, sent, sent + latency, 1)
+            for sent, latency in zip(range(10), [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0])
+        ]
+        samples.append(LatencySample("down", "25GB", 0, None, 10, 10, None, 5))
+        return LatencyReport(samples)
+
+    def test_distribution(self, report):
+        distribution = report.distribution()
+        assert distribution["count"] == 10
+        assert distribution["timeouts"] == 1
+        assert distribution["min"] == pytest.approx(0.1)
+        assert distribution["max"] == pytest.approx(1.0)
+        assert distribution["mean"] == pytest.approx(0.55)
+        assert distribution["p50"] == pytest.approx(0.55)
+        assert distribution["p90"] == pytest.approx(0.91)
+        assert report.distribution("down") == {"count": 0, "timeouts": 1}
+        assert report.timeouts == 1
+
+    def test_export(self, report, tmp_path):
+        report.to_json(tmp_path / "report.json")
+        document = json.loads((tmp_path / "report.json").read_text())
+        assert document["by_status"]["down"] == {"count": 0, "timeouts": 1}
+        assert document["samples"][0]["latency"] == pytest.approx(0.1)
+
+        report.to_csv(tmp_path / "report.csv")
+        with open(tmp_path / "report.csv", newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 11
+        assert rows[-1]["latency"] == ""
+        assert rows[0]["link_status"] == "up"
@@ -0,0 +1,82 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import logging
+
+import pytest
+
+from mfd_cli_client import CliClient, base, log
+from mfd_cli_client.simulation import FakeConnection, SimulatedResponder
+
+LOGGER_NAME = "mfd_cli_client.test_log"
+
+
+class Unformattable:
+    def __str__(self):
+        raise AssertionError("message formatted while level is disabled")
+
+
+@pytest.fixture()
+def logger():
+    return logging.getLogger(LOGGER_NAME)
+
+
+class TestDebug:
+    def test_logs_at_module_debug(self, caplog, logger):
+        caplog.set_level(log.MODULE_DEBUG, logger=LOGGER_NAME)
+        log.debug(logger, "Configure %s passed.", "lem")
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [(log.MODULE_DEBUG, "Configure lem passed.")]
+
+    def test_does_not_format_when_disabled(self, caplog, logger):
+        caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+        log.debug(logger, "Value %s", Unformattable())
+        with log.BulkLog(logger, "Map VFs") as bulk:
+            bulk.step("Value %s", Unformattable())
+        assert caplog.records == []
+
+
+class TestBulkLog:
+    @pytest.fixture()
+    def client(self, mocker):
+        mocker.patch("mfd_cli_client.CliClient.check_if_available")
+        return CliClient(connection=FakeConnection(SimulatedResponder()))
+
+    def test_summarizes_steps(self, caplog, logger):
+        caplog.set_level(log.MODULE_DEBUG, logger=LOGGER_NAME)
+        with log.BulkLog(logger, "Map VFs") as bulk:
+            for vf in range(2):
+                bulk.step("Mapping VF %d", vf)
+        assert bulk.items == 2
+        assert [(r.levelno, r.getMessage()) for r in caplog.records[:2]] == [
+            (log.MODULE_DEBUG, "Mapping VF 0"),
+            (log.MODULE_DEBUG, "Mapping VF 1"),
+        ]
+        assert caplog.records[2].levelno == log.MODULE_DEBUG
+        assert caplog.records[2].getMessage().startswith("Map VFs passed, 2 items in ")
+
+    def test_nested_messages_are_not_counted(self, caplog, logger):
+        caplog.set_level(log.MODULE_DEBUG, logger=LOGGER_NAME)
+        with log.BulkLog(logger, "Outer") as outer:
+            outer.step("outer step")
+            log.debug(logger, "nested message")
+            with log.BulkLog(logger, "Inner") as inner:
+                inner.step("inner step")
+                inner.step("inner step")
+        assert (outer.items, inner.items) == (1, 2)
+        assert caplog.records[-1].getMessage().startswith("Outer passed, 1 items in ")
+
+    def test_reports_failure(self, caplog, logger):
+        caplog.set_level(log.MODULE_DEBUG, logger=LOGGER_NAME)
+        with pytest.raises(ValueError):
+            with log.BulkLog(logger, "Map VFs") as bulk:
+                bulk.step("Mapping VF %d", 0)
+                raise ValueError
+        assert caplog.records[-1].getMessage().startswith("Map VFs failed after 1 items in ")
+
+    def test_client_bulk_operations_count_own_steps(self, caplog, client):
+        caplog.set_level(log.MODULE_DEBUG, logger=base.logger.name)
+        client.prepare_vm_vsi(3)
+        client.configure_up_up_translation(vsi_id=1)
+        summaries = [r.getMessage() for r in caplog.records if " items in " in r.getMessage()]
+        assert summaries[0].startswith("Map VFs to VM nodes passed, 3 items")
+        assert summaries[1].startswith("Configure UP-UP translation passed, 16 items")
+        assert "Successfully add VF 2 to VM node id 3." in caplog.messages
@@ -0,0 +1,78 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_cli_client.exceptions import CliClientException
+from mfd_cli_client.mirror import MirrorProfileManager
+
+SUCCEEDED = "command succeeded\n"
+
+
+class TestMirrorProfileManager:
+    @pytest.fixture()
+    def client(self, mocker):
+        client = mocker.Mock()
+        client.execute_cli_client_command.return_value = SUCCEEDED
+        client.execute_cli_client_batch.side_effect = lambda commands, **kwargs: [SUCCEEDED] * len(commands)
+        return client
+
+    @pytest.fixture()
+    def manager(self, client):
+        return MirrorProfileManager(client)
+
+    def test_create_many_in_one_invocation(self, manager, client):
+        manager.create_many({16: 1, 17: 2})
+        client.execute_cli_client_batch.assert_called_once_with(
+            [
+                "--modify --config --mir_prof 16 --vsi 1 --func_valid",
+                "--modify --config --mir_prof 17 --vsi 2 --func_valid",
+            ],
+            expected_return_codes=None,
+        )
+        assert manager.profiles == {16: 1, 17: 2}
+
+    def test_create_single(self, manager, client):
+        manager.create(20, 3)
+        client.execute_cli_client_command.assert_called_once_with(
+            command="--modify --config --mir_prof 20 --vsi 3 --func_valid", expected_return_codes=None
+        )
+        assert manager.profiles == {20: 3}
+
+    def test_reserved_profile_rejected_up_front(self, manager, client):
+        with pytest.raises(CliClientException, match="must be >=16"):
+            manager.create_many([(16, 1), (15, 2)])
+        client.execute_cli_client_batch.assert_not_called()
+        assert manager.profiles == {}
+
+    def test_partial_failure_tracks_created(self, manager, client):
+        client.execute_cli_client_batch.side_effect = None
+        client.execute_cli_client_batch.return_value = [SUCCEEDED, "mirror profile set failed\n"]
+        with pytest.raises(CliClientException, match="--mir_prof 17"):
+            manager.create_many({16: 1, 17: 2})
+        assert manager.profiles == {16: 1}
+
+    def test_teardown_all_removes_only_created(self, manager, client):
+        manager.create_many({16: 1, 17: 2})
+        manager.teardown_all()
+        client.execute_cli_client_batch.assert_called_with(
+            ["--modify --config --mir_prof 16 --vsi 1", "--modify --config --mir_prof 17 --vsi 2"],
+            expected_return_codes=None,
+        )
+        assert manager.profiles == {}
+        manager.teardown_all()
+        assert client.execute_cli_client_batch.call_count == 2
+
+    def test_delete_unknown_profile(self, manager, client):
+        manager.create(16, 1)
+        with pytest.raises(CliClientException, match=r"\[18\] were not created"):
+            manager.delete_many([16, 18])
+        assert manager.profiles == {16: 1}
+        manager.delete(16)
+        client.execute_cli_client_command.assert_called_with(
+            command="--modify --config --mir_prof 16 --vsi 1", expected_return_codes=None
+        )
+
+    def test_context_manager(self, client):
+        with MirrorProfileManager(client) as manager:
+            manager.create(16, 1)
+        assert manager.profiles == {}
@@ -0,0 +1,123 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_typing import MACAddress
+
+from mfd_cli_client.monitor import MonitorSample, VsiTraffic, VsiTrafficMonitor, format_top
+from mfd_cli_client.structures import VSIFlowStats, VSIStats, VsiConfigListEntry
+from mfd_cli_client.vsi_table import VsiConfigTable
+
+MAC = MACAddress("00:00:00:00:00:01")
+TABLE = VsiConfigTable.from_entries(
+    [
+        VsiConfigListEntry(0x0, 0x0, False, 0x1, 0x0, True, True, MAC),
+        VsiConfigListEntry(0x0, 0x0, True, 0x2, 0x0, True, True, MAC),
+        VsiConfigListEntry(0x1, 0x0, True, 0x3, 0x0, True, True, MAC),
+        VsiConfigListEntry(0x2, 0x0, True, 0x0, 0x0, False, False, MAC),
+    ]
+)
+
+
+def vsi_stats(packet, discards=0, errors=0):
+    flow = VSIFlowStats(packet, packet, 0, 0, discards, errors)
+    return VSIStats(flow, flow)
+
+
+def traffic(vsi_id, pps, drops=0.0, errors=0.0):
+    return VsiTraffic(vsi_id, 0, 0, True, pps, 0.0, drops, 0.0, errors, 0.0)
+
+
+@pytest.fixture()
+def now():
+    return [0.0]
+
+
+@pytest.fixture()
+def client(mocker, now):
+    client = mocker.Mock()
+    client.get_vsi_config_list.return_value = TABLE
+    samples = iter(
+        [
+            {1: vsi_stats(100), 2: vsi_stats(0), 3: vsi_stats(0)},
+            {1: vsi_stats(300, discards=4), 2: vsi_stats(50, errors=2), 3: vsi_stats(0)},
+            {1: vsi_stats(400), 2: vsi_stats(10), 3: vsi_stats(10)},
+        ]
+    )
+
+    def bulk(vsi_ids, warm_up):
+        now.append(now[-1] + 2.0)
+        return next(samples)
+
+    client.get_vsi_statistics_bulk.side_effect = bulk
+    return client
+
+
+@pytest.fixture()
+def monitor(client, now):
+    return VsiTrafficMonitor(client, clock=lambda: now[-1], sleeper=lambda s: now.append(now[-1] + s))
+
+
+class TestVsiTrafficMonitor:
+    def test_first_sample_warms_up_created_vsis(self, monitor, client):
+        assert monitor.sample() is None
+        client.get_vsi_statistics_bulk.assert_called_once_with(
+            {1: (0, 0, False), 2: (0, 0, True), 3: (0, 1, True)}, warm_up=[1, 2, 3]
+        )
+        client.get_vsi_config_list.assert_called_once_with(max_age=30.0)
+
+    def test_rates_between_samples(self, monitor, client):
+        monitor.sample()
+        sample = monitor.sample()
+        assert client.get_vsi_statistics_bulk.call_args.kwargs["warm_up"] == []
+        assert sample.elapsed == 2.0
+        rates = {traffic.vsi_id: traffic for traffic in sample.traffic}
+        assert rates[1].ingress_pps == rates[1].egress_pps == 100.0
+        assert rates[1].drops == 4.0
+        assert rates[2].errors == 2.0
+        assert rates[3].pps == 0.0
+
+    def test_counter_reset_has_zero_rate(self, monitor):
+        monitor.sample()
+        monitor.sample()
+        rates = {traffic.vsi_id: traffic for traffic in monitor.sample().traffic}
+        assert rates[2].ingress_pps == 0.0
+        assert rates[3].ingress_pps == 5.0
+
+    def test_only_selected_vsis(self, client, now):
+        monitor = VsiTrafficMonitor(client, vsi_ids=[2], clock=lambda: now[-1])
+        monitor.sample()
+        assert list(client.get_vsi_statistics_bulk.call_args.args[0]) == [2]
+
+    def test_run_at_fixed_interval(self, monitor, now):
+        samples = []
+        monitor.run(5.0, samples.append, count=2)
+        assert len(samples) == 2
+        # queries take 2s, they start every 5s
+        assert now[1:] == [2.0, 5.0, 7.0, 10.0, 12.0]
+
+    def test_run_skips_missed_slots(self, monitor, now):
+        samples = []
+        monitor.run(1.5, samples.append, count=1)
+        # query takes 2s, so the slot at 1.5s is skipped and next sample starts at 3s
+        assert now[1:] == [2.0, 3.0, 5.0]
+
+    def test_run_rejects_non_positive_interval(self, monitor):
+        with pytest.raises(ValueError):
+            monitor.run(0, print)
+
+
+class TestMonitorSample:
+    def test_top_ranks_by_key(self):
+        sample = MonitorSample(1.0, 0.1, 0.01, [traffic(1, 10.0, drops=5.0), traffic(2, 20.0), traffic(3, 5.0)])
+        assert [t.vsi_id for t in sample.top(2)] == [2, 1]
+        assert [t.vsi_id for t in sample.top(sort_by="drops")][0] == 1
+        with pytest.raises(ValueError):
+            sample.top(sort_by="bytes")
+
+    def test_format_top(self):
+        sample = MonitorSample(1.0, 0.1, 0.01, [traffic(0x1A, 10.0), traffic(2, 20.0)])
+        lines = format_top(sample, limit=1).splitlines()
+        assert lines[0].startswith("VSIs: 2  interval: 1.000s")
+        assert lines[2].split()[:2] == ["VSI", "HOST"]
+        assert len(lines) == 4
+        assert lines[3].split()[:5] == ["0x2", "0x0", "0x0", "yes", "20.0"]
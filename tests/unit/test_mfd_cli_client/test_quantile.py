@@ -0,0 +1,28 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import random
+
+import pytest
+
+from mfd_cli_client.quantile import P2Quantile
+
+
+class TestP2Quantile:
+    @pytest.mark.parametrize("quantile", [0.5, 0.9, 0.99])
+    def test_estimate_of_uniform_distribution(self, quantile):
+        rng = random.Random(1)
+        estimator = P2Quantile(quantile)
+        for _ in range(20000):
+            estimator.add(rng.random())
+        assert estimator.value == pytest.approx(quantile, abs=0.02)
+
+    def test_few_observations(self):
+        estimator = P2Quantile(0.5)
+        assert estimator.value is None
+        for value in (3, 1, 2):
+            estimator.add(value)
+        assert estimator.value == 2
+
+    def test_rejects_quantile_out_of_range(self):
+        with pytest.raises(ValueError):
+            P2Quantile(1.0)
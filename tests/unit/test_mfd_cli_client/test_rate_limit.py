@@ -0,0 +1,93 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from mfd_cli_client.rate_limit import RateLimiter, RateLimiterStats, TokenBucket
+
+
+class FakeClock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def test_acquire_within_burst_does_not_wait(self, clock):
+        bucket = TokenBucket(rate=10, burst=3, clock=clock, sleeper=clock.sleep)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert clock.now == 0.0
+
+    def test_acquire_over_burst_waits_for_refill(self, clock):
+        bucket = TokenBucket(rate=10, clock=clock, sleeper=clock.sleep)
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.1)
+        assert bucket.acquire() == pytest.approx(0.1)
+        assert clock.now == pytest.approx(0.2)
+
+    def test_acquire_refills_after_idle_time(self, clock):
+        bucket = TokenBucket(rate=2, burst=2, clock=clock, sleeper=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 10
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    @pytest.mark.parametrize("rate, burst", [(0, None), (-1, None), (1, 0.5)])
+    def test_invalid_parameters(self, rate, burst):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate, burst=burst)
+
+
+class TestRateLimiter:
+    def test_limit_counts_throttled_time(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=4, clock=clock, sleeper=clock.sleep)
+        for _ in range(3):
+            with limiter.limit():
+                pass
+        assert limiter.stats == RateLimiterStats(acquired=3, throttled=2, throttled_time=0.5, max_in_flight=1)
+
+    def test_limit_without_rate_does_not_throttle(self):
+        limiter = RateLimiter()
+        with limiter.limit() as throttled_time:
+            assert throttled_time == 0.0
+        assert limiter.stats == RateLimiterStats(acquired=1, throttled=0, throttled_time=0.0, max_in_flight=1)
+
+    def test_limit_caps_invocations_in_flight(self):
+        limiter = RateLimiter(max_in_flight=2)
+        entered = [Event() for _ in range(3)]
+        release = Event()
+
+        def invoke(index):
+            with limiter.limit() as throttled_time:
+                entered[index].set()
+                release.wait(5)
+            return throttled_time
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            first = [executor.submit(invoke, index) for index in range(2)]
+            assert all(event.wait(5) for event in entered[:2])
+            third = executor.submit(invoke, 2)
+            assert not entered[2].wait(0.05)
+            release.set()
+            assert entered[2].wait(5)
+            assert third.result(5) > 0
+            assert [future.result(5) for future in first] == [0.0, 0.0]
+        assert limiter.stats.max_in_flight == 2
+        assert limiter.stats.throttled == 1
+
+    def test_invalid_max_in_flight(self):
+        with pytest.raises(ValueError):
+            RateLimiter(max_in_flight=0)
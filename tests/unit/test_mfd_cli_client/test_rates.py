@@ -0,0 +1,63 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import math
+
+import pytest
+
+from mfd_cli_client.rates import Rate, counter_rate, stats_rates
+from mfd_cli_client.structures import AcquisitionWindow, FlowStats, SwitchStats, VSIFlowStats, VSIStats
+
+
+def window(started, finished):
+    return AcquisitionWindow(started, finished, 1000 + started, 1000 + finished)
+
+
+class TestCounterRate:
+    def test_rate_with_error_interval(self):
+        rate = counter_rate(100, 1100, window(0.0, 0.2), window(1.0, 1.2))
+        assert rate.value == pytest.approx(1000.0)
+        assert rate.low == pytest.approx(1000 / 1.2)
+        assert rate.high == pytest.approx(1000 / 0.8)
+        assert rate.error == pytest.approx(250.0)
+        assert rate.relative_error == pytest.approx(0.25)
+
+    def test_overlapping_windows(self):
+        assert counter_rate(0, 10, window(0.0, 1.0), window(0.5, 1.5)).high == math.inf
+        assert counter_rate(5, 5, window(0.0, 1.0), window(0.5, 1.5)) == Rate(0.0, 0.0, 0.0)
+
+    @pytest.mark.parametrize("previous, current", [(None, 1), (1, None), (5, 1)])
+    def test_unknown_rate(self, previous, current):
+        assert counter_rate(previous, current, window(0.0, 0.1), window(1.0, 1.1)) is None
+
+    def test_windows_out_of_order(self):
+        assert counter_rate(0, 1, window(1.0, 1.1), window(0.0, 0.1)) is None
+
+
+class TestStatsRates:
+    def test_rates_of_switch_counters(self):
+        previous = SwitchStats(FlowStats([0, 0], 0, 0), FlowStats([0], 0, 0), 0, 0, 0, window=window(0.0, 0.0))
+        current = SwitchStats(FlowStats([10, 20], 30, 1), FlowStats([0], 0, 0), 4, 0, 0, window=window(2.0, 2.0))
+        rates = stats_rates(previous, current)
+        assert rates["egress.traffic_class_counters[1]"] == Rate(10.0, 10.0, 10.0)
+        assert rates["unicast_packet"].value == 2.0
+        assert "timestamp" not in rates and "window" not in rates
+
+    def test_missing_counter(self):
+        flow = VSIFlowStats(0, 0, 0, 0, 0, 0)
+        rates = stats_rates(VSIStats(flow, flow, window(0.0, 0.1)), VSIStats(flow, flow, window(1.0, 1.1)))
+        assert rates["ingress.unknown_packet"] is None
+        assert rates["ingress.packet"].value == 0.0
+
+    def test_stats_without_window(self):
+        flow = VSIFlowStats(0, 0, 0, 0, 0, 0)
+        with pytest.raises(ValueError):
+            stats_rates(VSIStats(flow, flow), VSIStats(flow, flow, window(0.0, 0.1)))
+
+
+class TestAcquisitionWindow:
+    def test_measure(self):
+        result, measured = AcquisitionWindow.measure(lambda: "output")
+        assert result == "output"
+        assert 0 <= measured.duration
+        assert measured.started <= measured.midpoint <= measured.finished
+        assert measured.wall_started <= measured.wall_finished
@@ -0,0 +1,134 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import shutil
+import subprocess
+from textwrap import dedent
+
+import pytest
+from mfd_connect import SSHConnection
+
+from mfd_cli_client.base import VsiConfigListEntry, parse_qos_vm_info, parse_vsi_config_list
+from mfd_cli_client.exceptions import CliClientRemoteParserError
+from mfd_cli_client.remote_parser import (
+    QOS_VM_INFO_SCRIPT,
+    VSI_CONFIG_SCRIPT,
+    RemoteParser,
+    decode_qos_vm_info,
+    decode_vsi_config_list,
+)
+from mfd_typing import MACAddress
+
+VSI_CONFIG_OUTPUT = dedent(
+    """\
+    No IP address specified, defaulting to localhost
+    fn_id: 0x0   host_id: 0x0   is_vf: no  vsi_id: 0x1   vport_id 0x0   is_created: yes  is_enabled: yes mac addr: 00:01:00:00:03:14
+    |->fn_id: 0x1   host_id: 0x0   is_vf: yes vsi_id: 0xd   vport_id 0x0   is_created: yes  is_enabled: no mac addr: 00:0d:00:00:03:14
+    fn_id: 6   host_id: 0   is_vf: no  vsi_id: 0   vport_id 408is_created: no  is_enabled: no mac addr: 0:0:0:0:0:0
+    fn_id: 0x5   host_id: 0x5   is_vf: no  vsi_id: 0x10  vport_id 0x1   is_created: yes  is_enabled: no mac addr: 00:10:00:01:03:19
+
+    server finished responding =======================
+    """  # noqa: E501
+)
+
+QOS_VM_INFO_OUTPUT = dedent(
+    """\
+    ===== Host, VM, VF mapping for VMRL  ======
+
+    HOST ID 0
+
+            VM ID 1
+                    VF ID: 0, 1,
+            VM ID -1
+                    VF ID: 4,
+    HOST ID 1
+
+            VM ID 3
+    HOST ID 2
+
+    HOST ID 3
+
+    server finished responding ======================="""
+)
+
+
+class TestRemoteParser:
+    def test_script_path_contains_digest(self):
+        remote_parser = RemoteParser("/var/tmp")
+        path = remote_parser.script_path("vsi_config")
+        assert path.startswith("/var/tmp/mfd_cli_client_vsi_config_")
+        assert path.endswith(".awk")
+        assert path != remote_parser.script_path("qos_vm_info")
+
+    def test_install_pushes_scripts_once(self, mocker):
+        connection = mocker.create_autospec(SSHConnection)
+        remote_parser = RemoteParser()
+        remote_parser.install(connection)
+        remote_parser.install(connection)
+        assert remote_parser.installed
+        assert connection.path.call_count == 2
+        written = [call.args[0] for call in connection.path.return_value.write_text.call_args_list]
+        assert written == [VSI_CONFIG_SCRIPT, QOS_VM_INFO_SCRIPT]
+
+    def test_pipe(self):
+        remote_parser = RemoteParser()
+        assert remote_parser.pipe("qos_vm_info") == f"awk -v version=1 -f {remote_parser.script_path('qos_vm_info')}"
+
+
+class TestDecode:
+    def test_decode_vsi_config_list(self):
+        payload = '{"v":1,"rows":[["0x0","0x1",1,"0xd","0x408",1,0,"00:0d:00:00:03:14"]],"ok":1}'
+        assert decode_vsi_config_list(payload) == [
+            VsiConfigListEntry(0, 1, True, 13, 0x408, True, False, MACAddress("00:0d:00:00:03:14"))
+        ]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            "not json",
+            '{"v":2,"rows":[],"ok":1}',
+            '{"v":1,"rows":[],"ok":0}',
+            '{"v":1,"rows":[["","0x1",1,"0xd","0x408",1,0,"00:0d:00:00:03:14"]],"ok":1}',
+            '{"v":1,"rows":[["0x0","0x1",-1,"0xd","0x408",1,0,"00:0d:00:00:03:14"]],"ok":1}',
+            '{"v":1,"rows":[["0x0","0x1",1,"0xd","0x408",1,0,""]],"ok":1}',
+        ],
+    )
+    def test_decode_vsi_config_list_invalid_payload(self, payload):
+        with pytest.raises(CliClientRemoteParserError):
+            decode_vsi_config_list(payload)
+
+    def test_decode_qos_vm_info(self):
+        payload = '{"v":1,"hosts":{"0":{"1":[0,1],"-1":[4]},"1":{"3":[]},"2":{},"3":{}},"ok":1}'
+        assert decode_qos_vm_info(payload) == {0: {1: [0, 1], -1: [4]}, 1: {3: []}, 2: {}, 3: {}}
+
+    def test_decode_qos_vm_info_missing_host(self):
+        with pytest.raises(CliClientRemoteParserError):
+            decode_qos_vm_info('{"v":1,"hosts":{"0":{},"1":{},"2":{}},"ok":1}')
+
+
+@pytest.mark.skipif(shutil.which("awk") is None, reason="awk is not available")
+class TestScripts:
+    @staticmethod
+    def _run(script, output, tmp_path):
+        script_path = tmp_path / "parser.awk"
+        script_path.write_text(script)
+        return subprocess.run(
+            ["awk", "-v", "version=1", "-f", str(script_path)],
+            input=output,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    def test_vsi_config_script_matches_local_parser(self, tmp_path):
+        payload = self._run(VSI_CONFIG_SCRIPT, VSI_CONFIG_OUTPUT, tmp_path)
+        assert len(payload) < len(VSI_CONFIG_OUTPUT)
+        assert decode_vsi_config_list(payload) == parse_vsi_config_list(VSI_CONFIG_OUTPUT)
+
+    def test_qos_vm_info_script_matches_local_parser(self, tmp_path):
+        payload = self._run(QOS_VM_INFO_SCRIPT, QOS_VM_INFO_OUTPUT, tmp_path)
+        assert decode_qos_vm_info(payload) == parse_qos_vm_info(QOS_VM_INFO_OUTPUT)
+
+    def test_script_reports_unfinished_output(self, tmp_path):
+        payload = self._run(VSI_CONFIG_SCRIPT, VSI_CONFIG_OUTPUT.replace("server finished responding", ""), tmp_path)
+        with pytest.raises(CliClientRemoteParserError):
+            decode_vsi_config_list(payload)
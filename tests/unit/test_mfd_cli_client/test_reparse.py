@@ -0,0 +1,91 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_cli_client.archive import OutputArchive
+from mfd_cli_client.exceptions import CliClientException
+from mfd_cli_client.parsers import parse_switch_stats, parse_vsi_statistics
+from mfd_cli_client.reparse import EXTRACTORS, MISSING, CounterTable, Extractor, reparse_archive
+from mfd_cli_client.simulation import switch_stats_output, vsi_config_output, vsi_stats_output
+
+
+@pytest.fixture()
+def archive(tmp_path):
+    with OutputArchive(tmp_path / "outputs.archive", chunk_size=8192) as archive:
+        for tick in range(20):
+            for vsi_id in (5, 6):
+                archive.append(
+                    f"--query --statistics --vsi {vsi_id}", vsi_stats_output(vsi_id, tick), host="cp0", timestamp=tick
+                )
+            archive.append(
+                "--query --statistics --switch 1", switch_stats_output(1, tick=tick), host="cp1", timestamp=tick
+            )
+        archive.append("--query --config --verbose", vsi_config_output(8, 2), host="cp0", timestamp=20)
+        archive.append("--modify --config", "done", timestamp=20)
+    return archive
+
+
+class TestReparseArchive:
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_tables_of_all_command_types(self, archive, processes):
+        result = reparse_archive(archive, processes=processes)
+        assert (result.outputs, result.errors) == (61, 0)
+        vsi = result.tables["--query --statistics --vsi"]
+        assert len(vsi) == 40
+        assert list(vsi.column("vsi_id")[:4]) == [5, 6, 5, 6]
+        expected = parse_vsi_statistics(vsi_stats_output(6, 19))
+        assert vsi.column("egress_discards_packet")[-1] == expected.egress.discards_packet
+        assert vsi.column("egress_unknown_packet")[-1] == MISSING
+        assert list(vsi.timestamps) == [tick for tick in range(20) for _ in (5, 6)]
+        switch = result.tables["--query --statistics --switch"]
+        assert switch.host_column() == ["cp1"] * 20
+        assert (
+            switch.column("ingress_tc7")[3]
+            == parse_switch_stats(switch_stats_output(1, tick=3)).ingress.traffic_class_counters[7]
+        )
+        assert len(result.tables["--query --config --verbose"]) == 8
+
+    def test_parallel_result_equals_serial(self, archive):
+        serial = reparse_archive(archive.path, processes=1).tables["--query --statistics --vsi"]
+        parallel = reparse_archive(archive.path, processes=3, chunks_per_task=2).tables["--query --statistics --vsi"]
+        assert [list(serial.column(name)) for name in serial.columns] == [
+            list(parallel.column(name)) for name in parallel.columns
+        ]
+
+    def test_filters(self, archive):
+        result = reparse_archive(archive, start=5, end=9, command_types=["--query --statistics --switch 2"])
+        assert list(result.tables) == ["--query --statistics --switch"]
+        assert list(result.tables["--query --statistics --switch"].timestamps) == [5, 6, 7, 8, 9]
+        assert reparse_archive(archive, hosts=["cp2"]).outputs == 0
+
+    def test_unknown_command_type(self, archive):
+        with pytest.raises(ValueError, match="No extractor"):
+            reparse_archive(archive, command_types=["--modify --config"])
+
+    def test_parser_errors(self, archive, mocker):
+        def rows(command, output):
+            if command.endswith(" 6"):
+                raise ValueError("unexpected output")
+            yield [5]
+
+        mocker.patch.dict(EXTRACTORS, {"--query --statistics --vsi": Extractor(("vsi_id",), rows)})
+        result = reparse_archive(archive, processes=1, command_types=["--query --statistics --vsi"], skip_errors=True)
+        assert (result.outputs, result.errors) == (20, 20)
+        with pytest.raises(CliClientException, match="Cannot parse archived output"):
+            reparse_archive(archive, processes=1, command_types=["--query --statistics --vsi"])
+
+
+class TestCounterTable:
+    def test_extend_maps_hosts(self):
+        table = CounterTable(["a"])
+        table.append(0.0, "cp0", [1])
+        other = CounterTable(["a"])
+        other.append(1.0, "cp1", [None])
+        other.append(2.0, "cp0", [3])
+        table.extend(other)
+        assert table.host_column() == ["cp0", "cp1", "cp0"]
+        assert list(table.column("a")) == [1, MISSING, 3]
+        with pytest.raises(KeyError):
+            table.column("b")
+        with pytest.raises(ValueError):
+            table.extend(CounterTable(["b"]))
@@ -0,0 +1,74 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_connect import LocalConnection
+from mfd_connect.exceptions import ConnectionCalledProcessError
+
+from mfd_cli_client.exceptions import CliClientException, CliClientRunnerUnavailable
+from mfd_cli_client.runner import PersistentRunner
+
+
+@pytest.fixture
+def runner():
+    runner = PersistentRunner(LocalConnection())
+    runner.start()
+    yield runner
+    runner.close()
+
+
+class TestPersistentRunner:
+    @pytest.mark.parametrize(
+        "script, output",
+        [("echo hello", "hello\n"), ("printf abc", "abc"), ("true", ""), ("echo a; echo; echo b", "a\n\nb\n")],
+    )
+    def test_output_is_framed_exactly(self, runner, script, output):
+        result = runner.execute(script)
+        assert (result.return_code, result.stdout) == (0, output)
+
+    def test_pipelined_requests(self, runner):
+        futures = [runner.submit(f"echo {index}") for index in range(50)]
+        assert [future.result(10) for future in futures] == [(0, f"{index}\n") for index in range(50)]
+
+    def test_unexpected_return_code(self, runner):
+        with pytest.raises(ConnectionCalledProcessError):
+            runner.execute("echo out; exit 3")
+        assert runner.execute("exit 3", expected_return_codes=None).return_code == 3
+        assert runner.alive
+
+    def test_error_output_reaches_exception(self, runner):
+        with pytest.raises(ConnectionCalledProcessError) as error:
+            runner.execute("echo no such vsi >&2; exit 3")
+        assert "no such vsi" in error.value.output
+
+    def test_script_does_not_consume_requests(self, runner):
+        first = runner.submit("cat")
+        second = runner.submit("echo second")
+        assert first.result(10) == (0, "")
+        assert second.result(10) == (0, "second\n")
+
+    def test_timeout_stops_runner(self, runner):
+        pending = [runner.submit("sleep 3"), runner.submit("echo later")]
+        with pytest.raises(TimeoutError):
+            runner.execute("echo never", timeout=1)
+        assert not runner.alive
+        assert runner.closed and runner.started
+        with pytest.raises(CliClientException, match="while executing"):
+            pending[0].result(10)
+        with pytest.raises(CliClientRunnerUnavailable):
+            pending[1].result(10)
+        with pytest.raises(CliClientRunnerUnavailable):
+            runner.submit("echo again")
+
+    def test_multiline_script_is_rejected(self, runner):
+        with pytest.raises(ValueError):
+            runner.submit("echo a\necho b")
+
+    def test_start_failure(self, mocker):
+        connection = mocker.Mock()
+        connection.start_process.side_effect = NotImplementedError
+        runner = PersistentRunner(connection)
+        with pytest.raises(CliClientRunnerUnavailable):
+            runner.start()
+        assert runner.closed and not runner.started
+        with pytest.raises(CliClientRunnerUnavailable):
+            runner.start()
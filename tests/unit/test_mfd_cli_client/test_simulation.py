@@ -0,0 +1,65 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_cli_client.base import CliClient
+from mfd_cli_client.exceptions import CliClientException
+from mfd_cli_client.simulation import (
+    FakeConnection,
+    RecordedResponder,
+    RecordingConnection,
+    SimulatedResponder,
+    load_recording,
+    save_recording,
+    switch_stats_output,
+    tool_arguments,
+)
+
+
+class TestSimulatedResponder:
+    def test_counters_advance_with_every_query(self):
+        client = CliClient(connection=FakeConnection(SimulatedResponder()))
+        first = client.get_switch_stats()
+        second = client.get_switch_stats()
+        assert second.ingress.traffic_class_counters[0] - first.ingress.traffic_class_counters[0] == 2000
+        assert second.ingress.packet == sum(second.ingress.traffic_class_counters)
+
+    def test_tick_zero_keeps_seeded_output(self):
+        assert switch_stats_output(seed=3) == switch_stats_output(seed=3, tick=0)
+
+    def test_tables_have_requested_scale(self):
+        client = CliClient(connection=FakeConnection(SimulatedResponder(vsi_count=32, host_count=8)))
+        assert len(client.get_vsi_config_list()) == 32
+        assert len(client.read_qos_vm_info()) == 8
+
+
+class TestRecording:
+    def test_tool_arguments(self):
+        assert tool_arguments("/home/root/cli_client --query --config --verbose") == "--query --config --verbose"
+        assert tool_arguments("echo 1") == "echo 1"
+
+    def test_replays_in_order_and_repeats_last(self):
+        responder = RecordedResponder({"--query --statistics --vsi 1": ["a", "b"]})
+        assert [responder("cli_client --query --statistics --vsi 1") for _ in range(3)] == ["a", "b", "b"]
+
+    def test_unknown_command_raises(self):
+        responder = RecordedResponder({})
+        assert responder("cli_client -h") == ""
+        with pytest.raises(CliClientException, match="No recorded output"):
+            responder("cli_client --query --config --verbose")
+
+    def test_recording_round_trip(self, tmp_path):
+        connection = RecordingConnection(FakeConnection(SimulatedResponder()))
+        CliClient(connection=connection).get_vsi_statistics(vsi_id=3)
+        path = tmp_path / "recording.json"
+        save_recording(connection.recording, path)
+        recording = load_recording(path)
+        assert len(recording["--query --statistics --vsi 3"]) == 2
+        replayed = CliClient(connection=FakeConnection(RecordedResponder(recording))).get_vsi_statistics(vsi_id=3)
+        assert replayed == CliClient(connection=FakeConnection(SimulatedResponder())).get_vsi_statistics(vsi_id=3)
+
+    def test_malformed_recording(self, tmp_path):
+        path = tmp_path / "recording.json"
+        path.write_text('{"--query": "output"}')
+        with pytest.raises(CliClientException, match="Malformed recording"):
+            load_recording(path)
@@ -0,0 +1,38 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from mfd_cli_client.structures import (
+    AcquisitionWindow,
+    FlowStats,
+    SwitchStats,
+    SwitchStatsSnapshot,
+    TrafficClassCounters,
+)
+
+
+class TestSwitchStatsSnapshot:
+    def test_views(self):
+        stats = SwitchStats(FlowStats([1, 3], 4, 0), FlowStats([6, 2], 8, 1), 9, 3, 0)
+        snapshot = SwitchStatsSnapshot(1, stats)
+        assert snapshot.ingress_tc.typecode == "Q"
+        assert memoryview(snapshot.ingress_tc).tolist() == [6, 2]
+        assert snapshot.tc_priorities() == TrafficClassCounters(tx=[1, 3], rx=[6, 2])
+        assert snapshot.totals() == {"ingress": 8, "egress": 4, "all": 12}
+        assert snapshot.tc_shares() == [0.75, 0.25]
+        assert snapshot.tc_shares("egress") == [0.25, 0.75]
+        assert snapshot.casting_ratios() == {"unicast": 0.75, "multicast": 0.25, "broadcast": 0.0}
+
+    def test_views_without_packets(self):
+        snapshot = SwitchStatsSnapshot(1, SwitchStats(FlowStats([0], 0, 0), FlowStats([0], 0, 0), 0, 0, 0))
+        assert snapshot.tc_shares() == [None]
+        assert set(snapshot.casting_ratios().values()) == {None}
+
+    def test_window_is_not_compared(self):
+        flow = FlowStats([0], 0, 0)
+        first, second = AcquisitionWindow(0, 1, 10, 11), AcquisitionWindow(2, 3, 12, 13)
+        assert SwitchStats(flow, flow, 0, 0, 0, window=first) == SwitchStats(flow, flow, 0, 0, 0, window=second)
+
+    def test_snapshot_timestamp_is_end_of_window(self):
+        flow = FlowStats([0], 0, 0)
+        assert SwitchStatsSnapshot(1, SwitchStats(flow, flow, 0, 0, 0)).timestamp is None
+        window = AcquisitionWindow(0, 1, 10, 11)
+        assert SwitchStatsSnapshot(1, SwitchStats(flow, flow, 0, 0, 0, window=window)).timestamp == 11
@@ -0,0 +1,136 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import subprocess
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+from mfd_connect.exceptions import ConnectionCalledProcessError, RemoteProcessTimeoutExpired
+
+from mfd_cli_client.exceptions import CliClientCircuitOpen, CliClientException, CliClientTimeout
+from mfd_cli_client.timeouts import CLOSED, HALF_OPEN, OPEN, AdaptiveTimeout, CircuitBreaker, is_timeout
+
+
+class FakeClock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestIsTimeout:
+    @pytest.mark.parametrize(
+        "error",
+        [TimeoutError(), FutureTimeoutError(), subprocess.TimeoutExpired("cmd", 1), RemoteProcessTimeoutExpired()],
+    )
+    def test_timeouts(self, error):
+        assert is_timeout(error)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ConnectionCalledProcessError(1, "cmd"),
+            CliClientException("boom"),
+            CliClientTimeout("condition not met"),
+            type("ReadTimeoutConfig", (Exception,), {})(),
+        ],
+    )
+    def test_other_errors(self, error):
+        assert not is_timeout(error)
+
+
+class TestAdaptiveTimeout:
+    def test_ceiling_until_learned(self):
+        timeouts = AdaptiveTimeout(min_samples=3)
+        for _ in range(2):
+            timeouts.record("--event link_change --vsi 1", 0.1)
+        assert timeouts.learned("--event link_change") is None
+        assert timeouts.timeout("--event link_change", 120) == 120
+
+    def test_timeout_from_latency_quantile(self):
+        timeouts = AdaptiveTimeout(min_samples=20, factor=2, margin=1, minimum=1)
+        for index in range(100):
+            timeouts.record(f"--query --statistics --vsi {index}", 1.0 + (index % 10) / 10)
+        assert timeouts.learned("--query --statistics --vsi 5") == pytest.approx(1.9, abs=0.05)
+        assert timeouts.timeout("--query --statistics --vsi 5", 120) == 5
+        assert timeouts.timeout("--query --statistics --vsi 5", 120, count=10) == 39
+        assert timeouts.timeout("--query --statistics --vsi 5", 30, count=10) == 30
+        assert timeouts.timeout("--query --config --verbose", 120) == 120
+
+    def test_batch_latency_is_learned_per_command(self):
+        timeouts = AdaptiveTimeout(min_samples=1, minimum=1, margin=0)
+        timeouts.record("--query --statistics --switch 1", 10.0, count=10)
+        assert timeouts.learned("--query --statistics --switch 2") == 1.0
+
+    def test_minimum(self):
+        timeouts = AdaptiveTimeout(min_samples=1, minimum=5)
+        timeouts.record("--event link_change", 0.01)
+        assert timeouts.timeout("--event link_change", 120) == 5
+
+    def test_timeout_is_learned_as_censored_sample(self):
+        timeouts = AdaptiveTimeout(min_samples=20, factor=2, margin=1, minimum=5)
+        for _ in range(2000):
+            timeouts.record("--query --statistics --vsi 1", 0.1)
+        assert timeouts.timeout("--query --statistics --vsi 1", 120) == 5
+        timeouts.record_timeout("--query --statistics --vsi 1", 5)
+        # latency rose above learned timeout, next execution may take up to ceiling
+        assert timeouts.timeout("--query --statistics --vsi 2", 120) == 120
+        timeouts.record("--query --statistics --vsi 2", 8.0)
+        assert timeouts.timeout("--query --statistics --vsi 1", 120) == 5
+
+    def test_repeated_timeouts_raise_learned_timeout(self):
+        timeouts = AdaptiveTimeout(min_samples=20, factor=2, margin=1, minimum=5)
+        for _ in range(20):
+            timeouts.record("--query --config --verbose", 0.1)
+        learned = [timeouts.timeout("--query --config --verbose", 120)]
+        for _ in range(5):
+            timeouts.record_timeout("--query --config --verbose", learned[-1], count=2)
+            timeouts.record("--query --config --verbose", 0.1)
+            learned.append(timeouts.timeout("--query --config --verbose", 120))
+        assert learned == sorted(learned) and learned[-1] > learned[0]
+
+
+class TestCircuitBreaker:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def test_opens_after_consecutive_timeouts(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_timeout()
+        breaker.record_success()
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_timeout()
+        assert breaker.state == OPEN
+        with pytest.raises(CliClientCircuitOpen, match="next trial in 30.0s"):
+            breaker.before_call()
+
+    def test_single_trial_after_reset_timeout(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_timeout()
+        clock.now = 30.0
+        assert breaker.state == HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CliClientCircuitOpen):
+            breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        breaker.before_call()
+
+    def test_failed_trial_opens_again(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        for _ in range(3):
+            breaker.record_timeout()
+        clock.now = 31.0
+        breaker.before_call()
+        breaker.record_timeout()
+        assert breaker.state == OPEN
+        clock.now = 60.0
+        with pytest.raises(CliClientCircuitOpen):
+            breaker.before_call()
+
+    def test_rejects_non_positive_threshold(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
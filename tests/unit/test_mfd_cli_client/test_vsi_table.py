@@ -0,0 +1,140 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_typing import MACAddress
+
+from mfd_cli_client.base import VsiConfigListEntry
+from mfd_cli_client.vsi_table import VsiConfigTable, mac_to_int
+
+ENTRIES = [
+    VsiConfigListEntry(0x0, 0x0, False, 0x1, 0x0, True, True, MACAddress("00:01:00:00:03:14")),
+    VsiConfigListEntry(0x1, 0x0, True, 0xD, 0x0, True, False, MACAddress("00:0d:00:00:03:14")),
+    VsiConfigListEntry(0x6, 0x0, False, 0x0, 0x408, False, False, MACAddress("00:00:00:00:00:00")),
+]
+
+
+class TestVsiConfigTable:
+    @pytest.fixture()
+    def table(self):
+        return VsiConfigTable.from_entries(ENTRIES)
+
+    @pytest.mark.parametrize(
+        "mac, expected",
+        [
+            ("00:01:00:00:03:14", 0x000100000314),
+            ("0:0:0:0:3:14", 0x000000000314),
+            ("00-0d-00-00-03-14", 0x000D00000314),
+            ("ff:ff:ff:ff:ff:ff", 0xFFFFFFFFFFFF),
+            ("000100000314", 0x000100000314),
+        ],
+    )
+    def test_mac_to_int(self, mac, expected):
+        assert mac_to_int(mac) == expected
+        assert MACAddress(mac_to_int(mac)) == MACAddress(mac)
+
+    @pytest.mark.parametrize("mac", ["00:01:00:00:03", "00:01:00:00:03:14:15", "1ffffffffffff", "zz:01:00:00:03:14"])
+    def test_mac_to_int_malformed(self, mac):
+        with pytest.raises(ValueError):
+            mac_to_int(mac)
+
+    def test_behaves_like_list(self, table):
+        assert len(table) == 3
+        assert table == ENTRIES
+        assert list(table) == ENTRIES
+        assert table.to_list() == ENTRIES
+        assert table[1] == ENTRIES[1]
+        assert table[-1] == ENTRIES[-1]
+        assert table[1:] == ENTRIES[1:]
+        assert ENTRIES[0] in table
+        assert repr(table) == repr(ENTRIES)
+
+    def test_modified_like_list(self, table):
+        entries = list(ENTRIES)
+        new = VsiConfigListEntry(0x2, 0x1, True, 0x7, 0x1, True, True, MACAddress("00:07:00:00:03:14"))
+        for operation in (
+            lambda target: target.append(new),
+            lambda target: target.insert(1, new),
+            lambda target: target.insert(-10, new),
+            lambda target: target.extend([new, new]),
+            lambda target: target.__setitem__(0, new),
+            lambda target: target.__setitem__(-1, new),
+            lambda target: target.__setitem__(slice(1, 3), [new]),
+            lambda target: target.__setitem__(slice(0, 6, 2), [new, new, new]),
+            lambda target: target.__delitem__(1),
+            lambda target: target.__delitem__(slice(None, 2)),
+            lambda target: target.pop(),
+            lambda target: target.pop(0),
+            lambda target: target.remove(new),
+            lambda target: target.reverse(),
+            lambda target: target.sort(key=lambda entry: entry.vsi_id, reverse=True),
+            lambda target: target.__iadd__([new]),
+            lambda target: target.clear(),
+        ):
+            operation(entries)
+            operation(table)
+            assert table == entries
+            assert len(set(map(len, (table.fn_ids, table.host_ids, table.vsi_ids, table.vport_ids, table.macs)))) == 1
+            table.extend(ENTRIES)
+            entries.extend(ENTRIES)
+
+    def test_invalid_modifications_like_list(self, table):
+        new = ENTRIES[0]
+        for operation, error in (
+            (lambda target: target.__setitem__(3, new), IndexError),
+            (lambda target: target.__delitem__(-4), IndexError),
+            (lambda target: target.__setitem__(slice(None, None, 2), [new]), ValueError),
+            (
+                lambda target: target.remove(VsiConfigListEntry(9, 9, False, 9, 9, False, False, MACAddress(0))),
+                ValueError,
+            ),
+            (lambda target: VsiConfigTable().pop(), IndexError),
+        ):
+            with pytest.raises(error):
+                operation(list(ENTRIES))
+            with pytest.raises(error):
+                operation(table)
+            assert table == ENTRIES
+
+    def test_stores_copy_of_entries(self, table):
+        entry = VsiConfigListEntry(0x2, 0x1, True, 0x7, 0x1, True, True, MACAddress("00:07:00:00:03:14"))
+        table[0] = entry
+        entry.vsi_id = 0x8
+        assert table[0].vsi_id == 0x7
+
+    def test_copy(self, table):
+        copy = table.copy()
+        assert copy == table and copy is not table
+        copy.pop()
+        assert table == ENTRIES
+
+    def test_index_out_of_range(self, table):
+        with pytest.raises(IndexError):
+            table[3]
+        with pytest.raises(IndexError):
+            table[-4]
+
+    def test_not_equal(self, table):
+        assert table != ENTRIES[:2]
+        assert table != list(reversed(ENTRIES))
+        assert table != "table"
+        assert VsiConfigTable() == []
+
+    def test_equal_tables(self, table):
+        assert table == VsiConfigTable.from_entries(ENTRIES)
+        assert table != VsiConfigTable.from_entries(ENTRIES[:2])
+
+    def test_row_does_not_create_views(self, table, mocker):
+        entry = mocker.patch("mfd_cli_client.base.VsiConfigListEntry")
+        assert table.row(2) == (0x6, 0x0, False, 0x0, 0x408, False, False, 0)
+        assert list(table.rows())[1] == (0x1, 0x0, True, 0xD, 0x0, True, False, 0x000D00000314)
+        entry.assert_not_called()
+
+    def test_columns(self, table):
+        assert list(table.vsi_ids) == [0x1, 0xD, 0x0]
+        assert list(table.vport_ids) == [0x0, 0x0, 0x408]
+        assert list(table.macs) == [0x000100000314, 0x000D00000314, 0]
+        assert list(table.flags) == [0b110, 0b011, 0b000]
+
+    def test_created_vsis(self, table):
+        assert table.created_vsis() == {0x1: (0x0, 0x0, False), 0xD: (0x0, 0x1, True)}
+        assert table.created_vsis([0xD, 0x7]) == {0xD: (0x0, 0x1, True)}
@@ -0,0 +1,88 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from dataclasses import replace
+
+import pytest
+from mfd_typing import MACAddress
+
+from mfd_cli_client.base import VsiConfigListEntry
+from mfd_cli_client.vsi_table import VsiConfigTable
+from mfd_cli_client.vsi_watch import VsiChangeType, VsiKey, VsiTableWatcher, diff_vsi_tables
+
+PF = VsiConfigListEntry(0x0, 0x0, False, 0x1, 0x0, True, True, MACAddress("00:01:00:00:03:14"))
+VF0 = VsiConfigListEntry(0x0, 0x0, True, 0xD, 0x0, False, False, MACAddress("00:00:00:00:00:00"))
+VF1 = VsiConfigListEntry(0x1, 0x0, True, 0xE, 0x0, True, True, MACAddress("00:0e:00:00:03:14"))
+
+
+class TestDiffVsiTables:
+    def test_no_changes(self):
+        assert diff_vsi_tables([PF, VF0], VsiConfigTable.from_entries([VF0, PF])) == []
+
+    def test_added_removed_changed(self):
+        vf0_enabled = replace(VF0, is_created=True, is_enabled=True, mac=MACAddress("00:0d:00:00:03:14"))
+        events = diff_vsi_tables([PF, VF0, VF1], [PF, vf0_enabled])
+        assert [(event.type, event.key) for event in events] == [
+            (VsiChangeType.CHANGED, VsiKey(0x0, 0x0, True)),
+            (VsiChangeType.REMOVED, VsiKey(0x0, 0x1, True)),
+        ]
+        changed, removed = events
+        assert changed.entry == vf0_enabled
+        assert changed.previous == VF0
+        assert changed.changes == {
+            "is_created": (False, True),
+            "is_enabled": (False, True),
+            "mac": (MACAddress("00:00:00:00:00:00"), MACAddress("00:0d:00:00:03:14")),
+        }
+        assert removed.entry is None
+        assert removed.previous == VF1
+
+        events = diff_vsi_tables([PF], [PF, VF1])
+        assert [(event.type, event.entry, event.previous) for event in events] == [(VsiChangeType.ADDED, VF1, None)]
+
+    def test_pf_and_vf_with_same_fn_id_are_different_keys(self):
+        events = diff_vsi_tables([PF], [PF, VF0])
+        assert [event.key for event in events] == [VsiKey(0x0, 0x0, True)]
+
+
+class TestVsiTableWatcher:
+    @pytest.fixture()
+    def client(self, mocker):
+        return mocker.Mock()
+
+    def test_first_refresh_stores_snapshot(self, client):
+        client.get_vsi_config_list.side_effect = [[PF, VF0], [PF, VF0], [PF, VF0, VF1]]
+        watcher = VsiTableWatcher(client)
+        assert watcher.refresh() == []
+        assert watcher.refresh() == []
+        events = watcher.refresh()
+        assert [(event.type, event.entry) for event in events] == [(VsiChangeType.ADDED, VF1)]
+
+    def test_report_initial(self, client):
+        client.get_vsi_config_list.return_value = [PF, VF0]
+        watcher = VsiTableWatcher(client, report_initial=True)
+        assert [event.entry for event in watcher.refresh()] == [PF, VF0]
+        assert watcher.refresh() == []
+        watcher.reset()
+        assert len(watcher.refresh()) == 2
+
+    def test_callbacks(self, client, mocker):
+        client.get_vsi_config_list.side_effect = [[PF, VF0], [PF]]
+        callback = mocker.Mock()
+        watcher = VsiTableWatcher(client)
+        watcher.subscribe(callback)
+        watcher.refresh()
+        callback.assert_not_called()
+        (event,) = watcher.refresh()
+        callback.assert_called_once_with(event)
+        watcher.unsubscribe(callback)
+        watcher.update([])
+        callback.assert_called_once()
+
+    def test_watch(self, client, mocker):
+        now = [0.0]
+        sleep = mocker.patch("mfd_cli_client.vsi_watch.sleep", side_effect=lambda s: now.append(now[-1] + s))
+        mocker.patch("mfd_cli_client.vsi_watch.monotonic", side_effect=lambda: now[-1])
+        client.get_vsi_config_list.side_effect = [[PF], [PF, VF0], [PF, VF0, VF1]]
+        events = list(VsiTableWatcher(client).watch(interval=1, duration=2.5))
+        assert [event.entry for event in events] == [VF0, VF1]
+        assert sleep.call_count == 2
@@ -0,0 +1,70 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_typing import MACAddress
+
+from mfd_cli_client.base import VsiConfigListEntry
+from mfd_cli_client.exceptions import CliClientTimeout
+from mfd_cli_client.vsi_table import VsiConfigTable
+from mfd_cli_client.waiters import (
+    Backoff,
+    vfs_created_and_enabled,
+    vm_mapping_present,
+    vsi_has_mac,
+    wait_until,
+)
+
+PF = VsiConfigListEntry(0x0, 0x0, False, 0x1, 0x0, True, True, MACAddress("00:01:00:00:03:14"))
+VF0 = VsiConfigListEntry(0x0, 0x0, True, 0xD, 0x0, True, True, MACAddress("00:0d:00:00:03:14"))
+VF1 = VsiConfigListEntry(0x1, 0x1, True, 0xE, 0x0, True, False, MACAddress("00:0e:00:00:03:14"))
+
+
+class TestWaitUntil:
+    @pytest.fixture()
+    def clock(self, mocker):
+        now = [0.0]
+        sleep = mocker.patch("mfd_cli_client.waiters.sleep", side_effect=lambda s: now.append(now[-1] + s))
+        mocker.patch("mfd_cli_client.waiters.monotonic", side_effect=lambda: now[-1])
+        return sleep
+
+    def test_returns_as_soon_as_predicate_holds(self, clock, mocker):
+        fetch = mocker.Mock(side_effect=[1, 2, 3, 4])
+        result = wait_until(fetch, lambda value: value == 3, timeout=10, backoff=Backoff(1, 1, 1), max_age=5)
+        assert (result.value, result.elapsed, result.attempts) == (3, 2.0, 3)
+        assert [call.args for call in fetch.call_args_list] == [(5,), (None,), (None,)]
+
+    def test_backoff_grows_and_resets_on_change(self, clock, mocker):
+        fetch = mocker.Mock(side_effect=["a", "a", "a", "b", "b", "c"])
+        wait_until(fetch, lambda value: value == "c", timeout=100, backoff=Backoff(initial=1, factor=2, maximum=3))
+        assert [call.args[0] for call in clock.call_args_list] == [1, 2, 3, 1, 2]
+
+    def test_timeout(self, clock, mocker):
+        fetch = mocker.Mock(return_value="a")
+        with pytest.raises(CliClientTimeout, match="Timeout while waiting for state"):
+            wait_until(fetch, lambda value: False, timeout=5, backoff=Backoff(2, 1, 2), description="state")
+        assert [call.args[0] for call in clock.call_args_list] == [2, 2, 1]
+        assert fetch.call_count == 4
+
+
+class TestPredicates:
+    def test_vfs_created_and_enabled(self):
+        table = VsiConfigTable.from_entries([PF, VF0, VF1])
+        assert vfs_created_and_enabled(1)(table)
+        assert not vfs_created_and_enabled(2)(table)
+        assert not vfs_created_and_enabled(1, host_id=1)(table)
+        assert vfs_created_and_enabled(1)([PF, VF0])
+
+    def test_vsi_has_mac(self):
+        table = VsiConfigTable.from_entries([PF, VF0])
+        assert vsi_has_mac(0xD, "00:0d:00:00:03:14")(table)
+        assert vsi_has_mac(0x1, MACAddress("00:01:00:00:03:14"))([PF])
+        assert not vsi_has_mac(0x1, "00:0d:00:00:03:14")(table)
+
+    def test_vm_mapping_present(self):
+        qos_vm_info = {0: {1: [0, 1], -1: [4]}, 1: {2: [5]}}
+        assert vm_mapping_present(1)(qos_vm_info)
+        assert vm_mapping_present(1, vf_ids=[1])(qos_vm_info)
+        assert not vm_mapping_present(1, vf_ids=[1, 2])(qos_vm_info)
+        assert vm_mapping_present(2, host_id=1)(qos_vm_info)
+        assert not vm_mapping_present(2, host_id=0)(qos_vm_info)
+        assert not vm_mapping_present(2, host_id=3)(qos_vm_info)